@@ -0,0 +1,66 @@
+"""
+Project-wide middleware.
+"""
+import re
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = re.compile(r"^(text/|application/(json|javascript|xml|xhtml\+xml)|image/svg\+xml)")
+ACCEPTS_BR = re.compile(r"\bbr\b")
+MIN_SIZE = 200
+
+
+def carries_csrf_token(request, response):
+    """Whether the page embeds a CSRF token (``get_token`` ran while rendering it)."""
+    if settings.CSRF_USE_SESSIONS:
+        return "CSRF_COOKIE" in request.META
+    # CsrfViewMiddleware (re)sends the cookie on every response that used the token.
+    return settings.CSRF_COOKIE_NAME in response.cookies
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Compress text responses with brotli (when the optional ``brotli`` package
+    is installed and the client accepts it) or gzip.
+
+    Works like ``django.middleware.gzip.GZipMiddleware`` (gzip output is
+    padded with its random bytes against BREACH) but skips binary content
+    types, which are already compressed. Brotli has no room for such padding,
+    so responses that carry a CSRF token are always gzipped.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        if not COMPRESSIBLE_TYPES.match(response.get("Content-Type", "")):
+            return response
+        if not response.streaming and len(response.content) < MIN_SIZE:
+            return response
+
+        accept = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if (brotli is None or response.streaming or not ACCEPTS_BR.search(accept)
+                or carries_csrf_token(request, response)):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressed = brotli.compress(response.content, quality=5)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+
+        # The representation changed, so a strong ETag no longer matches it.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+
+        response.headers["Content-Encoding"] = "br"
+        return response
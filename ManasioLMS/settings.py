@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'ManasioLMS.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -64,11 +65,22 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'admin_panel.context_processors.data_versions',
             ],
         },
     },
 ]
 
+# Production: keep compiled templates in memory between requests.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'ManasioLMS.wsgi.application'
 
 
@@ -79,9 +91,56 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Background workers write concurrently with requests: take the write
+        # lock up front and wait for it instead of failing with "database is locked".
+        'OPTIONS': {
+            'timeout': 20,
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Use a shared backend (Redis / Memcached) when running more than one process,
+# the data-version counters in admin_panel.data_versions live here.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'manasio-lms',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
     }
 }
 
+# Seconds a {% cache %} fragment may live; data-version tokens invalidate earlier.
+TEMPLATE_FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Background jobs are run by `manage.py run_jobs`. Set to True to run them
+# inline instead (no worker needed, e.g. local development).
+BACKGROUND_JOBS_EAGER = False
+
+# Serve the read-heavy student pages (dashboards, materials, calendar, careers,
+# progress report) from student_portal.async_views. Only worth it under ASGI
+# (ManasioLMS.asgi); under WSGI every async view runs in its own event loop.
+STUDENT_PORTAL_ASYNC_VIEWS = False
+
+# Login admission control (ManasioLMS.throttling). Token buckets as
+# (burst, refills per minute): per client IP across all login forms and per
+# submitted username / email. LOGIN_MAX_CONCURRENT attempts are processed at
+# once per process; more are answered with 429 straight away.
+LOGIN_THROTTLE_IP = (30, 30)
+LOGIN_THROTTLE_IDENTITY = (5, 2)
+LOGIN_MAX_CONCURRENT = 8
+# request.META key holding the client address, e.g. 'HTTP_X_REAL_IP' behind a
+# reverse proxy that sets it (never trust a header the client can set itself).
+CLIENT_IP_HEADER = 'REMOTE_ADDR'
+
+# `manage.py archive_history` moves completed tasks and superseded progress
+# reports older than this out of the hot tables.
+ARCHIVE_AFTER_DAYS = 365
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -122,8 +181,19 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 # Additional static folders (your custom CSS, images, JS)
 STATICFILES_DIRS = [
-    BASE_DIR / 'static',
+    path for path in [BASE_DIR / 'static'] if path.exists()
 ]
+
+# Production: fingerprinted file names plus .gz/.br copies written by collectstatic.
+if not DEBUG:
+    STORAGES = {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'ManasioLMS.storage.CompressedManifestStaticFilesStorage'},
+    }
+
+# Let Django serve STATIC_ROOT (precompressed, immutable cache headers) when no
+# front-end server does it.
+SERVE_STATIC_FILES = not DEBUG
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -0,0 +1,69 @@
+"""
+Serve collected static files with precompressed variants and long-lived
+cache headers. Fingerprinted (manifest) names are immutable, so they are
+cached for a year; anything else gets a short max-age.
+"""
+import mimetypes
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+DEFAULT_MAX_AGE = 60 * 10
+
+_hashed_names = None
+
+
+def _is_hashed(path):
+    global _hashed_names
+    if _hashed_names is None:
+        _hashed_names = set(getattr(staticfiles_storage, "hashed_files", {}).values())
+    return path in _hashed_names
+
+
+def _accepted_variants(request):
+    accept = request.headers.get("Accept-Encoding", "")
+    variants = []
+    if "br" in accept:
+        variants.append((".br", "br"))
+    if "gzip" in accept:
+        variants.append((".gz", "gzip"))
+    return variants
+
+
+def serve_static(request, path):
+    try:
+        full_path = Path(safe_join(settings.STATIC_ROOT, path))
+    except Exception:
+        raise Http404("Invalid path")
+    if not full_path.is_file():
+        raise Http404(f"'{path}' could not be found")
+
+    stat = full_path.stat()
+    if not was_modified_since(request.META.get("HTTP_IF_MODIFIED_SINCE"), stat.st_mtime):
+        return HttpResponseNotModified()
+
+    content_type, _ = mimetypes.guess_type(str(full_path))
+    serve_path, encoding = full_path, None
+    for suffix, name in _accepted_variants(request):
+        candidate = full_path.with_name(full_path.name + suffix)
+        if candidate.is_file():
+            serve_path, encoding = candidate, name
+            break
+
+    response = FileResponse(serve_path.open("rb"), content_type=content_type or "application/octet-stream")
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    response["Vary"] = "Accept-Encoding"
+    if encoding:
+        response["Content-Encoding"] = encoding
+    if _is_hashed(path):
+        response["Cache-Control"] = f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    else:
+        response["Cache-Control"] = f"public, max-age={DEFAULT_MAX_AGE}"
+    return response
@@ -0,0 +1,54 @@
+"""
+Static files storage that fingerprints every file (via the manifest) and
+writes precompressed ``.gz`` / ``.br`` siblings during ``collectstatic``.
+
+Brotli output needs the optional ``brotli`` package; without it only gzip
+variants are written.
+"""
+import gzip
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".html", ".xml", ".ico", ".ttf", ".eot",
+)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        for hashed_name in set(self.hashed_files.values()):
+            if hashed_name.endswith(COMPRESSIBLE_EXTENSIONS):
+                yield from self._compress(hashed_name)
+        # Unhashed copies are still referenced by {% static %} in DEBUG and by
+        # third-party CSS, so compress them as well.
+        for name in paths:
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                yield from self._compress(name)
+
+    def _compress(self, name):
+        with self.open(name) as fh:
+            original = fh.read()
+
+        variants = [(".gz", gzip.compress(original, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append((".br", brotli.compress(original)))
+
+        for suffix, compressed in variants:
+            if len(compressed) >= len(original):
+                continue
+            if self.exists(name + suffix):
+                self.delete(name + suffix)
+            self._save(name + suffix, ContentFile(compressed))
+            yield name, name + suffix, True
@@ -0,0 +1,118 @@
+"""
+Admission control for the login endpoints.
+
+Every login POST must take a token from two buckets kept in the default cache:
+one per client IP (shared by all login forms) and one per submitted identity
+(username / email, per form). A refused attempt is answered with 429 and a
+Retry-After header before anything touches the database. Admitted attempts
+also need one of ``LOGIN_MAX_CONCURRENT`` slots of the process; when they are
+all busy the request is shed immediately instead of queueing on the database.
+
+Buckets are read and written without locking, so concurrent attempts may
+occasionally both take the last token; that slack is fine for rate limiting.
+With more than one server process the default cache must be shared (Redis /
+Memcached) for the limits to be global.
+"""
+import hashlib
+import math
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+
+KEY_PREFIX = "login-bucket:"
+
+_slots = None
+_slots_lock = threading.Lock()
+
+
+def _concurrency_slots():
+    global _slots
+    with _slots_lock:
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(settings.LOGIN_MAX_CONCURRENT)
+    return _slots
+
+
+def client_ip(request):
+    return request.META.get(settings.CLIENT_IP_HEADER) or request.META.get("REMOTE_ADDR", "")
+
+
+def _refill(state, capacity, per_minute, now):
+    tokens, stamp = state if state else (capacity, now)
+    return min(capacity, tokens + (now - stamp) * per_minute / 60), now
+
+
+def take(buckets, now=None):
+    """
+    Take one token from every bucket in ``buckets`` (``{key: (capacity,
+    refills_per_minute)}``), all or nothing. Returns 0 when admitted,
+    otherwise the seconds until the emptiest bucket has a token again.
+    """
+    now = time.time() if now is None else now
+    states = cache.get_many(list(buckets))
+    refilled = {
+        key: _refill(states.get(key), capacity, per_minute, now)
+        for key, (capacity, per_minute) in buckets.items()
+    }
+
+    wait = max(
+        (1 - tokens) * 60 / buckets[key][1]
+        for key, (tokens, _) in refilled.items()
+    )
+    if wait > 0:
+        return wait
+
+    for key, (capacity, per_minute) in buckets.items():
+        tokens, stamp = refilled[key]
+        # Expire once the bucket would be full again anyway.
+        timeout = math.ceil((capacity - tokens + 1) * 60 / per_minute)
+        cache.set(key, (tokens - 1, stamp), timeout)
+    return 0
+
+
+def too_many_requests(retry_after):
+    seconds = max(1, math.ceil(retry_after))
+    response = HttpResponse(
+        f"Too many login attempts. Try again in {seconds} seconds.",
+        status=429, content_type="text/plain; charset=utf-8",
+    )
+    response["Retry-After"] = str(seconds)
+    return response
+
+
+def throttle_login(identity_field):
+    """
+    View decorator applying login admission control to POSTs. ``identity_field``
+    is the form field naming the account (e.g. "email" or "username").
+    """
+    def decorator(view_func):
+        scope = view_func.__name__
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != "POST":
+                return view_func(request, *args, **kwargs)
+
+            identity = (request.POST.get(identity_field) or "").strip().lower()
+            identity_key = hashlib.sha1(f"{scope}:{identity}".encode()).hexdigest()
+            retry_after = take({
+                f"{KEY_PREFIX}ip:{client_ip(request)}": settings.LOGIN_THROTTLE_IP,
+                f"{KEY_PREFIX}id:{identity_key}": settings.LOGIN_THROTTLE_IDENTITY,
+            })
+            if retry_after:
+                return too_many_requests(retry_after)
+
+            slots = _concurrency_slots()
+            if not slots.acquire(blocking=False):
+                return too_many_requests(1)
+            try:
+                return view_func(request, *args, **kwargs)
+            finally:
+                slots.release()
+        return wrapper
+    return decorator
@@ -1,6 +1,9 @@
 
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path,include
+from django.urls import path,include,re_path
+
+from .static_views import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -8,3 +11,6 @@ urlpatterns = [
     path('admin_panel/', include('admin_panel.urls')),
     path('', include('student_portal.urls')),
 ]
+
+if settings.SERVE_STATIC_FILES:
+    urlpatterns.insert(0, re_path(r'^static/(?P<path>.+)$', serve_static))
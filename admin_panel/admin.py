@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Student,College,Course,StudyImage,CareerOpportunities,ProgressReport,CalendarEvent,BroadcastMessage,Task,CourseMaterial,CourseFolder,CourseAssignment
+from .models import Student,College,Course,StudyImage,CareerOpportunities,ProgressReport,CalendarEvent,CalendarEventOverride,BroadcastMessage,Task,CourseMaterial,CourseFolder,CourseAssignment,BackgroundJob,Notification,ArchivedTask,ArchivedProgressReport,MaterialText,MaterialPreview
 
 admin.site.register(Student)
 admin.site.register(College)
@@ -10,7 +10,31 @@ admin.site.register(CourseMaterial)
 admin.site.register(Task)
 admin.site.register(BroadcastMessage)
 admin.site.register(CalendarEvent)
+admin.site.register(CalendarEventOverride)
 admin.site.register(ProgressReport)
 admin.site.register(CareerOpportunities)
 admin.site.register(StudyImage)
+admin.site.register(Notification)
+admin.site.register(ArchivedTask)
+admin.site.register(ArchivedProgressReport)
 
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "task", "status", "priority", "attempts", "created_at", "finished_at")
+    list_filter = ("status", "task")
+    readonly_fields = ("progress", "result", "error", "locked_by", "started_at", "finished_at")
+
+
+@admin.register(MaterialText)
+class MaterialTextAdmin(admin.ModelAdmin):
+    list_display = ("material", "course_id", "status", "source", "extracted_at")
+    list_filter = ("status",)
+    readonly_fields = ("text", "error", "extracted_at")
+
+
+@admin.register(MaterialPreview)
+class MaterialPreviewAdmin(admin.ModelAdmin):
+    list_display = ("material", "status", "page_count", "source", "generated_at")
+    list_filter = ("status",)
+    readonly_fields = ("cover", "pages", "error", "generated_at")
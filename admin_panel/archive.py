@@ -0,0 +1,175 @@
+"""
+Archival tiering for task and progress history.
+
+Completed tasks and superseded progress reports (every report except each
+student's latest) older than a cut-off are moved out of the hot tables in
+batches, either into the compact ``ArchivedTask`` / ``ArchivedProgressReport``
+tables or into Parquet files (requires the optional ``pyarrow`` package).
+Archived history stays readable through ``task_history`` and
+``progress_history``.
+"""
+import os
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from .jobs import background_task, report_progress
+from .models import ArchivedProgressReport, ArchivedTask, ProgressReport, Task
+
+
+ARCHIVE_BATCH_SIZE = 1000
+
+TASK_FIELDS = ("id", "student_id", "course_id", "title", "description", "deadline", "priority", "completed_at")
+REPORT_FIELDS = (
+    "id", "student_id", "interview_prep", "communication_skills", "resume_prep",
+    "technical_prep", "mock_tests", "mock_interviews", "created_at",
+)
+
+
+def archivable_tasks(cutoff):
+    """Completed tasks finished before ``cutoff`` (by deadline when the finish time is unknown)."""
+    return Task.objects.filter(status="completed").filter(
+        Q(completed_at__lt=cutoff) | Q(completed_at__isnull=True, deadline__lt=cutoff.date())
+    )
+
+
+def archivable_reports(cutoff):
+    """Progress reports older than ``cutoff`` that are not their student's latest."""
+    # Correlated per row (served by the student_id index), so each batch does not
+    # re-group the whole table the way an ``id__in=<latest per student>`` would.
+    newer = ProgressReport.objects.filter(student_id=OuterRef("student_id"), id__gt=OuterRef("id"))
+    return ProgressReport.objects.filter(Exists(newer), created_at__lt=cutoff)
+
+
+# =====================================================
+# 📦 SINKS
+# =====================================================
+class TableSink:
+    """Copy rows into the archive tables. Re-running after a crash is safe (unique original_id)."""
+
+    def write(self, kind, rows):
+        if kind == "tasks":
+            objs = [ArchivedTask(original_id=row.pop("id"), **row) for row in rows]
+            ArchivedTask.objects.bulk_create(objs, ignore_conflicts=True)
+        else:
+            objs = [ArchivedProgressReport(original_id=row.pop("id"), **row) for row in rows]
+            ArchivedProgressReport.objects.bulk_create(objs, ignore_conflicts=True)
+
+    def close(self):
+        return {}
+
+
+class ParquetSink:
+    """Append rows to one Parquet file per kind in ``directory``."""
+
+    def __init__(self, directory):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet export needs the optional 'pyarrow' package (pip install pyarrow).")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        timestamp = pyarrow.timestamp("us", tz="UTC")
+        score = pyarrow.int16()
+        # Explicit schemas: a batch where a column is all NULL must not change the file type.
+        self.schemas = {
+            "tasks": pyarrow.schema([
+                ("id", pyarrow.int64()), ("student_id", pyarrow.int64()), ("course_id", pyarrow.int64()),
+                ("title", pyarrow.string()), ("description", pyarrow.string()), ("deadline", pyarrow.date32()),
+                ("priority", pyarrow.string()), ("completed_at", timestamp),
+            ]),
+            "progress_reports": pyarrow.schema([
+                ("id", pyarrow.int64()), ("student_id", pyarrow.int64()),
+                ("interview_prep", score), ("communication_skills", score), ("resume_prep", score),
+                ("technical_prep", score), ("mock_tests", score), ("mock_interviews", score),
+                ("created_at", timestamp),
+            ]),
+        }
+        self.directory = directory
+        self.stamp = timezone.now().strftime("%Y%m%dT%H%M%S")
+        self.writers = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, kind, rows):
+        table = self.pa.Table.from_pylist(rows, schema=self.schemas[kind])
+        if kind not in self.writers:
+            path = os.path.join(self.directory, f"{kind}-{self.stamp}.parquet")
+            self.writers[kind] = (path, self.pq.ParquetWriter(path, table.schema, compression="zstd"))
+        self.writers[kind][1].write_table(table)
+
+    def close(self):
+        files = {}
+        for kind, (path, writer) in self.writers.items():
+            writer.close()
+            files[kind] = path
+        return files
+
+
+# =====================================================
+# 🚚 MOVE
+# =====================================================
+def _move(kind, queryset, fields, sink, batch_size, stats):
+    total = queryset.count()
+    moved = 0
+    while True:
+        rows = list(queryset.order_by("id").values(*fields)[:batch_size])
+        if not rows:
+            break
+        ids = [row["id"] for row in rows]
+        with transaction.atomic():
+            sink.write(kind, rows)
+            # Nothing references these rows, so skip the deletion collector and
+            # its per-row post_delete signals.
+            queryset.model._base_manager.filter(id__in=ids)._raw_delete(queryset.db)
+        moved += len(ids)
+        report_progress(stage=kind, done=moved, total=total)
+    stats[kind] = moved
+
+
+def archive(older_than_days, target="table", output_dir="archive", batch_size=ARCHIVE_BATCH_SIZE):
+    """Move history older than ``older_than_days`` out of the hot tables."""
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    sink = ParquetSink(output_dir) if target == "parquet" else TableSink()
+    stats = {}
+    try:
+        _move("tasks", archivable_tasks(cutoff), TASK_FIELDS, sink, batch_size, stats)
+        _move("progress_reports", archivable_reports(cutoff), REPORT_FIELDS, sink, batch_size, stats)
+    finally:
+        files = sink.close()
+    if files:
+        stats["files"] = files
+    return stats
+
+
+@background_task
+def archive_history(older_than_days, target="table", output_dir="archive"):
+    """Background job wrapper around ``archive``."""
+    return archive(older_than_days, target, output_dir)
+
+
+# =====================================================
+# 🔎 READING HISTORY
+# =====================================================
+def task_history(student_id):
+    """Hot and archived tasks of a student, newest deadline first, as dicts."""
+    hot = Task.objects.filter(student_id=student_id).values(
+        "id", "title", "deadline", "priority", "status", "completed_at"
+    )
+    cold = ArchivedTask.objects.filter(student_id=student_id).values(
+        "original_id", "title", "deadline", "priority", "completed_at"
+    )
+    rows = list(hot) + [dict(row, id=row.pop("original_id"), status="completed") for row in cold]
+    return sorted(rows, key=lambda row: (row["deadline"], row["id"]), reverse=True)
+
+
+def progress_history(student_id):
+    """Hot and archived progress reports of a student, oldest first, as dicts."""
+    hot = ProgressReport.objects.filter(student_id=student_id).values(*REPORT_FIELDS)
+    cold = ArchivedProgressReport.objects.filter(student_id=student_id).values(
+        "original_id", *REPORT_FIELDS[1:]
+    )
+    rows = list(hot) + [dict(row, id=row.pop("original_id")) for row in cold]
+    return sorted(rows, key=lambda row: (row["created_at"], row["id"]))
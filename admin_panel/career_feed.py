@@ -0,0 +1,211 @@
+"""
+Bulk ingestion of partner career feeds (CSV or JSON).
+
+Rows are matched against existing posts by normalized link first and by a
+company/title hash second, then created or updated in batches. Posts from the
+same source that are missing from the feed are deactivated in one UPDATE.
+"""
+import csv
+import hashlib
+import io
+import json
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .data_versions import bump
+from .jobs import background_task
+from .models import CareerOpportunities
+from . import search
+
+
+TRACKING_PARAMS = {"ref", "source", "gclid", "fbclid", "mc_cid", "mc_eid"}
+
+# feed column -> model field
+FIELD_ALIASES = {
+    "job_title": ("job_title", "title", "role"),
+    "company_name": ("company_name", "company"),
+    "location": ("location", "city"),
+    "stipend": ("stipend", "salary", "ctc"),
+    "experience": ("experience",),
+    "link": ("link", "url", "apply_url"),
+    "job_description": ("job_description", "description"),
+    "mode": ("mode",),
+}
+UPDATE_FIELDS = [
+    "job_title", "company_name", "location", "stipend", "experience",
+    "link", "job_description", "mode", "status", "source",
+    "link_key", "dedupe_key", "last_seen_at", "updated_at",
+]
+
+
+def normalize_link(url):
+    """Canonical form of a job link: lower-case host, no tracking params, fragment or trailing slash."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(((parts.scheme or "https").lower(), host, path, urlencode(query), ""))[:255]
+
+
+def _normalize_text(value):
+    return re.sub(r"[^a-z0-9]+", " ", (value or "").lower()).strip()
+
+
+def dedupe_key(company_name, job_title):
+    raw = f"{_normalize_text(company_name)}|{_normalize_text(job_title)}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+# =====================================================
+# 📥 READING FEEDS
+# =====================================================
+def read_feed(fileobj, fmt="auto", name=""):
+    """Yield dict rows from a binary file object without loading CSV feeds into memory."""
+    if fmt == "auto":
+        fmt = "json" if name.lower().endswith((".json", ".jsonl", ".ndjson")) else "csv"
+
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            yield from csv.DictReader(text)
+            return
+
+        first = text.read(1)
+        while first and first.isspace():
+            first = text.read(1)
+        if first == "[":
+            # A JSON array has to be parsed as a whole.
+            rows = json.loads(first + text.read())
+            if not all(isinstance(row, dict) for row in rows):
+                raise ValueError("JSON feed must be an array of objects.")
+            yield from rows
+            return
+        # JSON Lines: one object per line, streamed.
+        buffered = first + text.readline()
+        if buffered.strip():
+            yield json.loads(buffered)
+        for line in text:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        # Leave the caller's file open.
+        text.detach()
+
+
+def _clean(row, default_mode):
+    data = {}
+    if not isinstance(row, dict):
+        return None
+    lowered = {str(key).strip().lower(): value for key, value in row.items() if key}
+    for field, aliases in FIELD_ALIASES.items():
+        for alias in aliases:
+            value = lowered.get(alias)
+            if value not in (None, ""):
+                data[field] = str(value).strip()
+                break
+    if not (data.get("job_title") and data.get("company_name") and data.get("link")):
+        return None
+    data.setdefault("job_description", "")
+    for field in ("location", "stipend", "experience"):
+        data.setdefault(field, "Not specified")
+    mode = data.get("mode", default_mode).lower()
+    data["mode"] = mode if mode in ("online", "offline") else default_mode
+    data["link_key"] = normalize_link(data["link"])
+    data["dedupe_key"] = dedupe_key(data["company_name"], data["job_title"])
+    return data
+
+
+# =====================================================
+# 🔁 UPSERT
+# =====================================================
+def import_feed(rows, source, default_mode="offline", batch_size=500, deactivate_missing=True):
+    """
+    Upsert ``rows`` (an iterable of dicts) as CareerOpportunities tagged with
+    ``source``. Returns counts of created / updated / skipped / deactivated rows.
+    """
+    started = timezone.now()
+    stats = {"created": 0, "updated": 0, "skipped": 0, "deactivated": 0}
+    batch = []
+
+    for row in rows:
+        data = _clean(row, default_mode)
+        if data is None:
+            stats["skipped"] += 1
+            continue
+        batch.append(data)
+        if len(batch) >= batch_size:
+            _upsert_batch(batch, source, started, stats)
+            batch = []
+    if batch:
+        _upsert_batch(batch, source, started, stats)
+
+    if deactivate_missing:
+        stats["deactivated"] = CareerOpportunities.objects.filter(
+            source=source, status="active", last_seen_at__lt=started,
+        ).update(status="inactive", updated_at=timezone.now())
+
+    bump("careers")
+    return stats
+
+
+@background_task
+def import_feed_file(path, source, default_mode="offline", deactivate_missing=True):
+    """Background job: import a feed saved to default storage, then delete the file."""
+    with default_storage.open(path, "rb") as fileobj:
+        stats = import_feed(
+            read_feed(fileobj, name=path), source,
+            default_mode=default_mode, deactivate_missing=deactivate_missing,
+        )
+    default_storage.delete(path)
+    return stats
+
+
+def _upsert_batch(batch, source, seen_at, stats):
+    # Later duplicates inside one batch win.
+    unique = {}
+    for data in batch:
+        unique[data["link_key"] or data["dedupe_key"]] = data
+    stats["skipped"] += len(batch) - len(unique)
+    batch = list(unique.values())
+
+    link_keys = {data["link_key"] for data in batch if data["link_key"]}
+    hashes = {data["dedupe_key"] for data in batch}
+    by_link, by_hash = {}, {}
+    for job in CareerOpportunities.objects.filter(Q(link_key__in=link_keys) | Q(dedupe_key__in=hashes)).order_by("id"):
+        by_link.setdefault(job.link_key, job)
+        by_hash.setdefault(job.dedupe_key, job)
+
+    to_create, to_update, claimed = [], [], set()
+    for data in batch:
+        job = by_link.get(data["link_key"]) or by_hash.get(data["dedupe_key"])
+        if job is not None and job.id in claimed:
+            job = None
+        fields = dict(data, status="active", source=source, last_seen_at=seen_at, updated_at=seen_at)
+        if job is None:
+            to_create.append(CareerOpportunities(**fields))
+        else:
+            claimed.add(job.id)
+            for field, value in fields.items():
+                setattr(job, field, value)
+            to_update.append(job)
+
+    with transaction.atomic():
+        CareerOpportunities.objects.bulk_create(to_create)
+        CareerOpportunities.objects.bulk_update(to_update, UPDATE_FIELDS)
+        # Bulk writes skip the model signals that maintain the admin search index.
+        search.index_objects("career", to_create + to_update)
+    stats["created"] += len(to_create)
+    stats["updated"] += len(to_update)
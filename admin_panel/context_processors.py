@@ -0,0 +1,10 @@
+from django.conf import settings
+
+from .data_versions import DataVersions
+
+
+def data_versions(request):
+    return {
+        "data_versions": DataVersions(request),
+        "fragment_cache_timeout": settings.TEMPLATE_FRAGMENT_CACHE_TIMEOUT,
+    }
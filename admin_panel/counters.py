@@ -0,0 +1,156 @@
+"""
+Denormalized counters on colleges and courses.
+
+``College.student_count`` / ``active_student_count`` and
+``Course.enrolled_count`` / ``folder_count`` / ``material_count`` are kept up
+to date from the write paths (the signals in ``admin_panel.signals`` and
+``purge.soft_delete``) with single ``UPDATE ... SET n = n + 1`` statements,
+so listing pages read them without extra queries. Soft-deleted students are
+not counted. Writes that skip signals (``bulk_create``, ``QuerySet.update``)
+leave drift behind that ``reconcile`` repairs in batches
+(``manage.py reconcile_counters``).
+"""
+from django.db import transaction
+from django.db.models import Count, Exists, F, Func, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from .data_versions import bump
+from .models import College, Course, CourseAssignment, CourseFolder, CourseMaterial, Student
+
+
+RECONCILE_BATCH_SIZE = 1000
+
+COUNTERS = {
+    College: {
+        "student_count": lambda: Student.objects.filter(college_id=OuterRef("pk")),
+        "active_student_count": lambda: Student.objects.filter(college_id=OuterRef("pk"), status="active"),
+    },
+    Course: {
+        "enrolled_count": lambda: CourseAssignment.objects.filter(
+            course_id=OuterRef("pk"), student__deleted_at__isnull=True
+        ),
+        "folder_count": lambda: CourseFolder.objects.filter(course_id=OuterRef("pk")),
+        "material_count": lambda: CourseMaterial.objects.filter(course_id=OuterRef("pk")),
+    },
+}
+
+
+def change(model, pk, **deltas):
+    """Add ``deltas`` to the counters of one row in a single UPDATE (never below zero)."""
+    deltas = {name: int(delta) for name, delta in deltas.items() if delta}
+    if pk is None or not deltas:
+        return
+    model.all_objects.filter(pk=pk).update(**{
+        name: F(name) + delta if delta > 0 else Greatest(F(name) + delta, 0)
+        for name, delta in deltas.items()
+    })
+
+
+def _live_student(student_id):
+    return Exists(Student.objects.filter(pk=student_id))
+
+
+# =====================================================
+# ✏️ WRITE PATHS
+# =====================================================
+def student_saved(student, created):
+    counted = None if student.deleted_at else (student.college_id, student.status == "active")
+    if created:
+        before = None
+    elif hasattr(student, "_counted"):
+        before = student._counted
+    else:
+        # Loaded without the counted fields: recount the college it is in now.
+        recount(College, [student.college_id])
+        student._counted = counted
+        return
+
+    if before != counted:
+        if before:
+            change(College, before[0], student_count=-1, active_student_count=-before[1])
+        if counted:
+            change(College, counted[0], student_count=1, active_student_count=counted[1])
+    student._counted = counted
+
+
+def student_deleted(student):
+    # Soft-deleted students were uncounted by soft_delete already.
+    if student.deleted_at is None:
+        change(College, student.college_id, student_count=-1, active_student_count=-(student.status == "active"))
+
+
+def assignment_changed(assignment, delta):
+    """``delta`` is +1 for a new assignment and -1 for a deleted one; only live students count."""
+    Course.all_objects.filter(pk=assignment.course_id).filter(_live_student(assignment.student_id)).update(
+        enrolled_count=F("enrolled_count") + delta if delta > 0 else Greatest(F("enrolled_count") + delta, 0)
+    )
+
+
+def soft_deleted(obj):
+    """Uncount what ``purge.soft_delete`` is about to hide. Call before the rows are marked."""
+    if isinstance(obj, Student):
+        if obj.deleted_at is not None:
+            return
+        student_deleted(obj)
+        Course.all_objects.filter(courseassignment__student_id=obj.pk).update(
+            enrolled_count=Greatest(F("enrolled_count") - 1, 0)
+        )
+    elif isinstance(obj, College):
+        # Every student of the college disappears from the courses they are enrolled in.
+        leaving = (
+            CourseAssignment.objects.filter(course_id=OuterRef("pk"), student__college_id=obj.pk)
+            .filter(student__deleted_at__isnull=True)
+            .order_by().values("course_id").annotate(n=Count("pk")).values("n")
+        )
+        # Courses whose enrolled students were all soft-deleted already have no
+        # row in ``leaving``; Coalesce keeps that NULL out of the counter.
+        Course.all_objects.filter(courseassignment__student__college_id=obj.pk).update(
+            enrolled_count=Greatest(F("enrolled_count") - Coalesce(Subquery(leaving), 0), 0)
+        )
+    else:
+        return
+    bump("enrolments")
+
+
+# =====================================================
+# 🔧 RECONCILE
+# =====================================================
+def _actual(model):
+    """Correlated COUNT(*) subqueries giving the true value of each counter."""
+    return {
+        name: Coalesce(Subquery(queryset().order_by().values(n=Func(F("pk"), function="COUNT"))), 0)
+        for name, queryset in COUNTERS[model].items()
+    }
+
+
+def recount(model, pks):
+    """Set the counters of ``pks`` to their true values."""
+    return model.all_objects.filter(pk__in=pks).update(**_actual(model))
+
+
+def drifted(model, queryset=None):
+    """Rows of ``queryset`` (default: all live rows) whose counters are wrong."""
+    queryset = model.objects.all() if queryset is None else queryset
+    actual = {f"actual_{name}": expression for name, expression in _actual(model).items()}
+    return queryset.annotate(**actual).exclude(**{name: F(f"actual_{name}") for name in COUNTERS[model]})
+
+
+def reconcile(batch_size=RECONCILE_BATCH_SIZE, dry_run=False):
+    """Repair drifted counters batch by batch; returns ``{model name: rows repaired}``."""
+    repaired = {}
+    for model in COUNTERS:
+        fixed, last = 0, 0
+        while True:
+            ids = list(model.objects.filter(pk__gt=last).order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            last = ids[-1]
+            with transaction.atomic():
+                wrong = list(drifted(model, model.objects.filter(pk__in=ids)).values_list("pk", flat=True))
+                if wrong and not dry_run:
+                    recount(model, wrong)
+            fixed += len(wrong)
+        repaired[model._meta.model_name] = fixed
+    if any(repaired.values()) and not dry_run:
+        bump("courses", "enrolments")
+    return repaired
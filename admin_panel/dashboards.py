@@ -0,0 +1,129 @@
+"""
+Per-student dashboard read model.
+
+``StudentDashboard.document`` holds everything the two student dashboards
+render (profile, assigned courses) so a page view is one indexed lookup.
+Task windows are not part of it: the progress page reads them live. Writes that concern one student patch only the affected section;
+course- or college-wide writes flag the affected documents ``stale`` with a
+single UPDATE and they are rebuilt on the next view. Broadcasts are global and
+cached once, keyed by their data version.
+"""
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404
+
+from .data_versions import get_version
+from .models import BroadcastMessage, Course, Student, StudentDashboard
+
+
+def _file_url(field):
+    return field.url if field else ""
+
+
+def build_profile(student_id):
+    student = Student.objects.select_related("college").get(id=student_id)
+    college = student.college
+    return {
+        "college_name": college.name if college else "",
+        "college_poster_url": _file_url(college.poster_image) if college else "",
+    }
+
+
+def build_courses(student_id):
+    courses = (
+        Course.objects.filter(courseassignment__student_id=student_id)
+        .order_by("courseassignment__id")
+        .only("id", "name", "description", "thumbnail", "material_count")
+    )
+    return [
+        {
+            "id": course.id,
+            "name": course.name,
+            "description": course.description,
+            "thumbnail_url": _file_url(course.thumbnail),
+            "material_count": course.material_count,
+        }
+        for course in courses
+    ]
+
+
+SECTIONS = {
+    "profile": build_profile,
+    "courses": build_courses,
+}
+
+
+# =====================================================
+# ✍️ WRITE SIDE
+# =====================================================
+def rebuild(student_id):
+    """Recompute the whole document and return the saved ``StudentDashboard``."""
+    document = {name: builder(student_id) for name, builder in SECTIONS.items()}
+    dashboard, _ = StudentDashboard.objects.update_or_create(
+        student_id=student_id, defaults={"document": document, "stale": False},
+    )
+    return dashboard
+
+
+def refresh(student_id, *sections):
+    """Patch ``sections`` of an existing document. Students without one are built lazily."""
+    with transaction.atomic():
+        dashboard = StudentDashboard.objects.select_for_update().filter(student_id=student_id).first()
+        if dashboard is None or dashboard.stale:
+            return
+        for name in sections:
+            dashboard.document[name] = SECTIONS[name](student_id)
+        dashboard.save(update_fields=["document", "updated_at"])
+
+
+def mark_stale(**filters):
+    """Flag documents for rebuild, e.g. ``mark_stale(student__college_id=3)``."""
+    return StudentDashboard.objects.filter(**filters).update(stale=True)
+
+
+# =====================================================
+# 📖 READ SIDE
+# =====================================================
+def get_dashboard(student_id):
+    """Return the student's ``StudentDashboard`` (with ``student`` loaded), rebuilding it if needed."""
+    dashboard = StudentDashboard.objects.select_related("student").filter(student_id=student_id).first()
+    if dashboard is None or dashboard.stale:
+        if not Student.objects.filter(id=student_id).exists():
+            raise Http404("No Student matches the given query.")
+        dashboard = rebuild(student_id)
+    return dashboard
+
+
+async def aget_dashboard(student_id):
+    """Async ``get_dashboard``; ``student.college`` is loaded too, for the page header."""
+    dashboard = await (
+        StudentDashboard.objects.select_related("student__college").filter(student_id=student_id).afirst()
+    )
+    if dashboard is None or dashboard.stale:
+        # Rare write path (locks, transaction): run the sync version in a thread.
+        dashboard = await sync_to_async(get_dashboard)(student_id)
+        dashboard.student = await Student.objects.select_related("college").aget(id=student_id)
+    return dashboard
+
+
+def get_broadcast():
+    """The current broadcast as ``(message, link)``, cached per broadcast version."""
+    key = f"dashboard-broadcast:{get_version('broadcast')}"
+    broadcast = cache.get(key)
+    if broadcast is None:
+        message = BroadcastMessage.objects.first()
+        broadcast = (message.message, message.link) if message else (None, None)
+        cache.set(key, broadcast, None)
+    return broadcast
+
+
+async def aget_broadcast():
+    """Async ``get_broadcast``."""
+    key = f"dashboard-broadcast:{get_version('broadcast')}"
+    broadcast = await cache.aget(key)
+    if broadcast is None:
+        message = await BroadcastMessage.objects.afirst()
+        broadcast = (message.message, message.link) if message else (None, None)
+        await cache.aset(key, broadcast, None)
+    return broadcast
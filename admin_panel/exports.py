@@ -0,0 +1,120 @@
+"""
+Streaming CSV / XLSX exports.
+
+Rows come from ``values_list(...).iterator(chunk_size=...)``, so no model
+instances are built and only one chunk is held in memory at a time. CSV is
+streamed straight to the response; XLSX (optional ``openpyxl``) is written in
+write-only mode to a temporary file that is then streamed.
+"""
+import csv
+import tempfile
+
+from django.db.models import Max
+
+from .models import CourseAssignment, ProgressReport, Student, Task
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _students():
+    return Student.objects.order_by("id").values_list(
+        "id", "name", "email", "roll", "phone", "college__name", "mode", "status",
+    )
+
+
+def _assignments():
+    return CourseAssignment.objects.filter(student__deleted_at__isnull=True).order_by("id").values_list(
+        "student__roll", "student__name", "course__code", "course__name", "date_assigned", "status",
+    )
+
+
+def _tasks():
+    return Task.objects.filter(student__deleted_at__isnull=True).order_by("id").values_list(
+        "id", "student__roll", "student__name", "course__code", "title",
+        "deadline", "priority", "status", "completed_at",
+    )
+
+
+def _progress():
+    latest_ids = ProgressReport.objects.values("student_id").annotate(latest=Max("id")).values("latest")
+    return (
+        ProgressReport.objects.filter(id__in=latest_ids, student__deleted_at__isnull=True)
+        .order_by("student_id")
+        .values_list(
+            "student__roll", "student__name", "interview_prep", "communication_skills", "resume_prep",
+            "technical_prep", "mock_tests", "mock_interviews", "created_at",
+        )
+    )
+
+
+# name -> (header, queryset factory)
+EXPORTS = {
+    "students": (
+        ["ID", "Name", "Email", "Roll", "Phone", "College", "Mode", "Status"],
+        _students,
+    ),
+    "assignments": (
+        ["Roll", "Student", "Course Code", "Course", "Assigned On", "Status"],
+        _assignments,
+    ),
+    "tasks": (
+        ["ID", "Roll", "Student", "Course Code", "Title", "Deadline", "Priority", "Status", "Completed At"],
+        _tasks,
+    ),
+    "progress": (
+        ["Roll", "Student", "Interview Prep", "Communication Skills", "Resume Prep",
+         "Technical Prep", "Mock Tests", "Mock Interviews", "Reported At"],
+        _progress,
+    ),
+}
+
+CHOICES = [
+    ("students", "Students"),
+    ("assignments", "Course assignments"),
+    ("tasks", "Tasks"),
+    ("progress", "Latest progress"),
+]
+
+
+def iter_rows(name, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the header and then every row of export ``name``."""
+    header, queryset = EXPORTS[name]
+    yield header
+    yield from queryset().iterator(chunk_size=chunk_size)
+
+
+class Echo:
+    """File-like object whose ``write`` returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(name, chunk_size=EXPORT_CHUNK_SIZE):
+    writer = csv.writer(Echo())
+    for row in iter_rows(name, chunk_size):
+        yield writer.writerow(row)
+
+
+def write_xlsx(name, fileobj, chunk_size=EXPORT_CHUNK_SIZE):
+    """Write export ``name`` to ``fileobj`` as XLSX. Raises RuntimeError without openpyxl."""
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise RuntimeError("XLSX export needs the optional 'openpyxl' package (pip install openpyxl).")
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(name.title())
+    for row in iter_rows(name, chunk_size):
+        # Excel has no time zones; write aware datetimes as naive UTC.
+        sheet.append([value.replace(tzinfo=None) if getattr(value, "tzinfo", None) else value for value in row])
+    workbook.save(fileobj)
+
+
+def xlsx_tempfile(name):
+    """Return an open temporary file holding the XLSX export, rewound for reading."""
+    fileobj = tempfile.TemporaryFile()
+    write_xlsx(name, fileobj)
+    fileobj.seek(0)
+    return fileobj
@@ -0,0 +1,252 @@
+"""
+iCalendar (RFC 5545) subscription feeds of the course calendar.
+
+Each student gets a secret ``calendar_token``; ``/student-calendar/<token>.ics``
+serves the events of their assigned courses plus the "All Courses" events.
+Recurring events are written once with their RRULE, EXDATEs for cancelled
+occurrences and RECURRENCE-ID entries for changed ones, so calendar apps expand
+them themselves.
+
+Students with the same courses get the same feed: the body is cached under the
+calendar data version and a hash of the course set, which is also the ETag, so
+an hourly poll usually costs a few cache reads and a 304.
+"""
+import hashlib
+import secrets
+from datetime import timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from .data_versions import bump, get_token, get_version, student_key
+from .models import CalendarEvent, CalendarEventOverride, CourseAssignment, Student
+from .recurrence import WEEKDAYS, parse_rule
+
+
+CONTENT_TYPE = "text/calendar; charset=utf-8"
+FEED_MAX_AGE = 3600
+FEED_CACHE_TIMEOUT = 24 * 3600
+FEED_CACHE_MAX_BYTES = 2 * 1024 * 1024
+FEED_CHUNK_SIZE = 500
+# One-off events that ended longer ago than this are left out of the feed.
+FEED_HISTORY = timedelta(days=180)
+
+TOKEN_KEY = "ics-token:"
+TOKEN_TTL = 3600
+
+
+# =====================================================
+# 🔑 TOKENS
+# =====================================================
+def calendar_token(student, reset=False):
+    """The student's feed token, created on first use or replaced with ``reset``."""
+    if student.calendar_token and not reset:
+        return student.calendar_token
+    old = student.calendar_token
+    student.calendar_token = secrets.token_urlsafe(32)
+    # update() rather than save(): nothing else about the student changed.
+    Student.objects.filter(pk=student.pk).update(calendar_token=student.calendar_token)
+    if old:
+        cache.delete(TOKEN_KEY + old)
+        bump(student_key(student.pk))
+    return student.calendar_token
+
+
+def feed_for_token(token):
+    """``(etag, course_codes)`` of the feed behind ``token``; None for unknown tokens."""
+    student_id = cache.get(TOKEN_KEY + token)
+    if student_id is None:
+        student_id = Student.objects.filter(calendar_token=token).values_list("id", flat=True).first()
+        if student_id is None:
+            return None
+        cache.set(TOKEN_KEY + token, student_id, TOKEN_TTL)
+
+    codes_key = f"ics-courses:{student_id}:{get_token(student_key(student_id), 'courses')}"
+    codes = cache.get(codes_key)
+    if codes is None:
+        codes = sorted(set(
+            CourseAssignment.objects.filter(student_id=student_id, course__deleted_at__isnull=True)
+            .values_list("course__code", flat=True)
+        ))
+        cache.set(codes_key, codes, FEED_CACHE_TIMEOUT)
+
+    course_set = hashlib.md5("\n".join(codes).encode()).hexdigest()
+    return f"{get_version('calendar')}-{course_set}", codes
+
+
+# =====================================================
+# 📝 FORMATTING
+# =====================================================
+def _escape(value):
+    return (
+        (value or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line):
+    """Fold a content line at 75 octets, as RFC 5545 requires."""
+    parts, current, size = [], [], 0
+    for char in line:
+        width = len(char.encode())
+        if size + width > 75:
+            parts.append("".join(current))
+            current, size = [" "], 1
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n".join(parts) + "\r\n"
+
+
+def _utc(moment):
+    return moment.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _moment(name, moment, event):
+    """A DTSTART-style property. Recurring series use local time so they keep the wall-clock time."""
+    if event.all_day:
+        return f"{name};VALUE=DATE:{timezone.localdate(moment):%Y%m%d}"
+    if event.recurrence and settings.TIME_ZONE != "UTC":
+        return f"{name};TZID={settings.TIME_ZONE}:{timezone.localtime(moment):%Y%m%dT%H%M%S}"
+    return f"{name}:{_utc(moment)}"
+
+
+def _end(start, end, event):
+    if event.all_day:
+        # DTEND of an all-day event is exclusive.
+        last = timezone.localdate(end) if end else None
+        first = timezone.localdate(start)
+        day = last if last and last > first else first + timedelta(days=1)
+        return f"DTEND;VALUE=DATE:{day:%Y%m%d}"
+    if end and end > start:
+        return _moment("DTEND", end, event)
+    return None
+
+
+def _rrule(event):
+    rule = parse_rule(event.recurrence)
+    parts = [f"FREQ={rule['freq']}"]
+    if rule["interval"] > 1:
+        parts.append(f"INTERVAL={rule['interval']}")
+    if rule["byday"]:
+        parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in rule["byday"]))
+    if rule["count"]:
+        parts.append(f"COUNT={rule['count']}")
+    elif rule["until"]:
+        # UNTIL must have the same value type as DTSTART.
+        until = f"{timezone.localdate(rule['until']):%Y%m%d}" if event.all_day else _utc(rule["until"])
+        parts.append(f"UNTIL={until}")
+    return "RRULE:" + ";".join(parts)
+
+
+def _vevent(event, stamp, start, end, title, description, meeting_link, extra=()):
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:calendar-event-{event.id}@lms",
+        f"DTSTAMP:{stamp}",
+        _moment("DTSTART", start, event),
+        _end(start, end, event),
+        *extra,
+        f"SUMMARY:{_escape(title)}",
+    ]
+    if description or meeting_link:
+        text = "\n\n".join(part for part in (description, meeting_link) if part)
+        lines.append(f"DESCRIPTION:{_escape(text)}")
+    if meeting_link:
+        lines.append(f"URL:{meeting_link}")
+    if event.course:
+        lines.append(f"CATEGORIES:{_escape(event.course)}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines if line)
+
+
+def _vevents(events, stamp):
+    """Calendar text of a batch of events and the overrides of its recurring ones."""
+    overrides = {}
+    recurring = [event.id for event in events if event.recurrence]
+    if recurring:
+        for override in CalendarEventOverride.objects.filter(event_id__in=recurring).order_by("original_start"):
+            overrides.setdefault(override.event_id, []).append(override)
+
+    parts = []
+    for event in events:
+        if not event.recurrence:
+            parts.append(_vevent(event, stamp, event.start, event.end, event.title,
+                                 event.description, event.meeting_link))
+            continue
+
+        changes = overrides.get(event.id, [])
+        extra = [_rrule(event)]
+        extra += [_moment("EXDATE", change.original_start, event) for change in changes if change.cancelled]
+        parts.append(_vevent(event, stamp, event.start, event.end, event.title,
+                             event.description, event.meeting_link, extra))
+
+        for change in changes:
+            if change.cancelled:
+                continue
+            start = change.start or change.original_start
+            end = change.end or (start + (event.end - event.start) if event.end else None)
+            parts.append(_vevent(
+                event, stamp, start, end, change.title or event.title,
+                change.description if change.description is not None else event.description,
+                change.meeting_link if change.meeting_link is not None else event.meeting_link,
+                [_moment("RECURRENCE-ID", change.original_start, event)],
+            ))
+    return "".join(parts)
+
+
+# =====================================================
+# 📡 FEED
+# =====================================================
+def _body_key(etag):
+    return f"ics-body:{etag}"
+
+
+def cached_feed(etag):
+    return cache.get(_body_key(etag))
+
+
+def iter_feed(course_codes, chunk_size=FEED_CHUNK_SIZE):
+    """Yield the calendar text in chunks of ``chunk_size`` events."""
+    stamp = _utc(timezone.now())
+    yield "".join(_fold(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Manasio LMS//Course calendar//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "X-WR-CALNAME:Course schedule",
+        "X-PUBLISHED-TTL:PT1H",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT1H",
+    ))
+
+    events = (
+        CalendarEvent.objects.filter(Q(course__in=course_codes) | Q(course="All Courses"))
+        .filter(Q(ends_at__gte=timezone.now() - FEED_HISTORY) | Q(ends_at__isnull=True))
+        .order_by("id")
+    )
+    batch = []
+    for event in events.iterator(chunk_size=chunk_size):
+        batch.append(event)
+        if len(batch) >= chunk_size:
+            yield _vevents(batch, stamp)
+            batch = []
+    if batch:
+        yield _vevents(batch, stamp)
+    yield "END:VCALENDAR\r\n"
+
+
+def stream_feed(etag, course_codes):
+    """``iter_feed`` that caches the finished body under ``etag`` (unless it is very large)."""
+    chunks, size = [], 0
+    for chunk in iter_feed(course_codes):
+        yield chunk
+        if chunks is not None:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > FEED_CACHE_MAX_BYTES:
+                chunks = None
+    if chunks is not None:
+        cache.set(_body_key(etag), "".join(chunks), FEED_CACHE_TIMEOUT)
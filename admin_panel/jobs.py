@@ -0,0 +1,149 @@
+"""
+Database-backed background jobs.
+
+Functions decorated with ``@background_task`` can be queued with
+``enqueue(func, *args, **kwargs)``; the ``run_jobs`` management command claims
+queued rows from ``BackgroundJob`` and runs them on a thread or process pool.
+Arguments and return values must be JSON serializable.
+"""
+import contextvars
+import importlib
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from .models import BackgroundJob
+
+
+TASKS = {}
+
+# Seconds to wait before retry n is 2 ** n * RETRY_BACKOFF (capped at an hour).
+RETRY_BACKOFF = 10
+
+_current_job = contextvars.ContextVar("current_job", default=None)
+
+
+def background_task(func):
+    """Register ``func`` so that workers can run it by name."""
+    func.task_name = f"{func.__module__}.{func.__name__}"
+    TASKS[func.task_name] = func
+    return func
+
+
+def get_task(name):
+    if name not in TASKS:
+        # Importing the module runs its @background_task decorators.
+        importlib.import_module(name.rpartition(".")[0])
+    try:
+        return TASKS[name]
+    except KeyError:
+        raise LookupError(f"{name} is not a registered background task.")
+
+
+def enqueue(func, *args, priority=0, max_attempts=3, delay=0, **kwargs):
+    """
+    Queue ``func(*args, **kwargs)`` and return the ``BackgroundJob``.
+
+    With ``BACKGROUND_JOBS_EAGER = True`` the task runs immediately in the
+    calling process instead, which is convenient without a worker.
+    """
+    name = func if isinstance(func, str) else func.task_name
+    get_task(name)
+    job = BackgroundJob.objects.create(
+        task=name,
+        args=list(args),
+        kwargs=kwargs,
+        priority=priority,
+        max_attempts=max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+    if getattr(settings, "BACKGROUND_JOBS_EAGER", False):
+        job.status = "running"
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "started_at"])
+        execute(job.id)
+        job.refresh_from_db()
+    return job
+
+
+def report_progress(**values):
+    """Record progress (e.g. ``done=40, total=200``) for the job currently running."""
+    job_id = _current_job.get()
+    if job_id is None:
+        return
+    BackgroundJob.objects.filter(id=job_id).update(progress=values)
+
+
+# =====================================================
+# 👷 WORKER SIDE
+# =====================================================
+def claim(worker_id, limit=1, tasks=None):
+    """Atomically move up to ``limit`` due jobs to ``running`` for this worker."""
+    due = BackgroundJob.objects.filter(status="queued", run_after__lte=timezone.now())
+    if tasks:
+        due = due.filter(task__in=tasks)
+    due = due.order_by("-priority", "run_after", "id")
+
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = list(due.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+        else:
+            candidates = list(due.values_list("id", flat=True)[:limit])
+
+        claimed = []
+        now = timezone.now()
+        for job_id in candidates:
+            # The status filter makes the claim safe when rows cannot be locked (SQLite).
+            won = BackgroundJob.objects.filter(id=job_id, status="queued").update(
+                status="running", locked_by=worker_id, started_at=now,
+            )
+            if won:
+                claimed.append(job_id)
+    return claimed
+
+
+def _close_old_connections():
+    # Eager jobs run inside the caller's request, possibly in an atomic block,
+    # where closing the connection would abort the caller's transaction.
+    if not connection.in_atomic_block:
+        close_old_connections()
+
+
+def execute(job_id):
+    """Run a claimed job and store its result, or schedule a retry on failure."""
+    _close_old_connections()
+    job = BackgroundJob.objects.get(id=job_id)
+    job.attempts += 1
+    token = _current_job.set(job.id)
+    try:
+        result = get_task(job.task)(*job.args, **job.kwargs)
+    except Exception:
+        job.error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = "queued"
+            job.run_after = timezone.now() + timedelta(seconds=min(2 ** job.attempts * RETRY_BACKOFF, 3600))
+        else:
+            job.status = "failed"
+            job.finished_at = timezone.now()
+    else:
+        job.status = "succeeded"
+        job.result = result
+        job.error = ""
+        job.finished_at = timezone.now()
+    finally:
+        _current_job.reset(token)
+
+    job.locked_by = ""
+    job.save(update_fields=["attempts", "status", "result", "error", "run_after", "finished_at", "locked_by"])
+    _close_old_connections()
+    return job.status
+
+
+def requeue_stale(older_than):
+    """Put back jobs left ``running`` by a worker that died more than ``older_than`` ago."""
+    return BackgroundJob.objects.filter(
+        status="running", started_at__lt=timezone.now() - older_than,
+    ).update(status="queued", locked_by="")
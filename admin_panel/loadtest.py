@@ -0,0 +1,387 @@
+"""
+Asyncio load generator used by the ``loadtest`` management command.
+
+Virtual users run scripted scenarios concurrently against one of three
+transports: the ASGI application in-process, the WSGI application in-process
+(on a thread pool, like a threaded WSGI server) or a live HTTP server.
+"""
+import asyncio
+import io
+import math
+import random
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+
+# Upper bounds (ms) of the latency histogram buckets.
+HISTOGRAM_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, math.inf]
+
+
+class Response:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+# =====================================================
+# 🚚 TRANSPORTS
+# =====================================================
+class ASGITransport:
+    """Call the Django ASGI application directly on the running loop."""
+
+    def __init__(self, application):
+        self.application = application
+
+    async def request(self, method, path, headers, body, client_ip):
+        path, _, query = path.partition("?")
+        done = asyncio.Event()
+        sent_body = False
+        status = None
+        response_headers = []
+        chunks = []
+
+        async def receive():
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.extend(
+                    (name.decode("latin1").lower(), value.decode("latin1"))
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body"):
+                    done.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(name.lower().encode("latin1"), value.encode("latin1")) for name, value in headers],
+            "client": (client_ip, 50000),
+            "server": ("localhost", 80),
+        }
+        await self.application(scope, receive, send)
+        done.set()
+        return Response(status, response_headers, b"".join(chunks))
+
+
+class WSGITransport:
+    """Run the Django WSGI application on a bounded thread pool."""
+
+    def __init__(self, application, workers):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.application = application
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def _call(self, method, path, headers, body, client_ip):
+        path, _, query = path.partition("?")
+        environ = {
+            "REQUEST_METHOD": method,
+            "SCRIPT_NAME": "",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": client_ip,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": io.StringIO(),
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in headers:
+            key = name.upper().replace("-", "_")
+            if key == "CONTENT_TYPE":
+                environ[key] = value
+            else:
+                environ[f"HTTP_{key}"] = value
+
+        captured = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            captured["status"] = int(status.split(" ", 1)[0])
+            captured["headers"] = [(name.lower(), value) for name, value in response_headers]
+
+        result = self.application(environ, start_response)
+        try:
+            content = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        return Response(captured["status"], captured["headers"], content)
+
+    async def request(self, method, path, headers, body, client_ip):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._call, method, path, headers, body, client_ip)
+
+
+class HTTPTransport:
+    """Minimal HTTP/1.1 client (one connection per request) for a live server."""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+
+    async def request(self, method, path, headers, body, client_ip):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: close"]
+            lines += [f"{name}: {value}" for name, value in headers]
+            lines.append(f"Content-Length: {len(body)}")
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin1") + body)
+            await writer.drain()
+            raw = await reader.read()
+        finally:
+            writer.close()
+
+        head, _, content = raw.partition(b"\r\n\r\n")
+        head_lines = head.decode("latin1").split("\r\n")
+        status = int(head_lines[0].split(" ")[1])
+        response_headers = []
+        for line in head_lines[1:]:
+            name, _, value = line.partition(":")
+            response_headers.append((name.strip().lower(), value.strip()))
+        if ("transfer-encoding", "chunked") in response_headers:
+            content = self._dechunk(content)
+        return Response(status, response_headers, content)
+
+    @staticmethod
+    def _dechunk(data):
+        out = bytearray()
+        while data:
+            size_line, _, data = data.partition(b"\r\n")
+            size = int(size_line.split(b";")[0], 16)
+            if not size:
+                break
+            out += data[:size]
+            data = data[size + 2:]
+        return bytes(out)
+
+
+# =====================================================
+# 👤 VIRTUAL USER
+# =====================================================
+class VirtualUser:
+    """A cookie-keeping client that records every request into ``stats``."""
+
+    def __init__(self, transport, stats, scenario, client_ip, cookies=None):
+        self.transport = transport
+        self.stats = stats
+        self.scenario = scenario
+        self.client_ip = client_ip
+        self.cookies = dict(cookies or {})
+
+    async def request(self, name, method, path, data=None):
+        headers = []
+        body = b""
+        if self.cookies:
+            headers.append(("Cookie", "; ".join(f"{k}={v}" for k, v in self.cookies.items())))
+        if method == "POST":
+            body = urlencode(data or {}).encode()
+            headers.append(("Content-Type", "application/x-www-form-urlencoded"))
+            if "csrftoken" in self.cookies:
+                headers.append(("X-CSRFToken", self.cookies["csrftoken"]))
+
+        started = time.perf_counter()
+        try:
+            response = await self.transport.request(method, path, headers, body, self.client_ip)
+        except Exception as exc:
+            self.stats.record(self.scenario, name, (time.perf_counter() - started) * 1000, None, 0, repr(exc))
+            return None
+        elapsed = (time.perf_counter() - started) * 1000
+
+        for header, value in response.headers:
+            if header == "set-cookie":
+                cookie = SimpleCookie()
+                cookie.load(value)
+                for key, morsel in cookie.items():
+                    self.cookies[key] = morsel.value
+        self.stats.record(self.scenario, name, elapsed, response.status, len(response.body))
+        return response
+
+
+# =====================================================
+# 📊 STATS
+# =====================================================
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self.error_samples = {}
+
+    def record(self, scenario, name, elapsed_ms, status, size, error=None):
+        key = f"{scenario}:{name}"
+        self.latencies[key].append(elapsed_ms)
+        self.bytes[key] += size
+        if status is None or status >= 400:
+            self.errors[key] += 1
+            self.error_samples.setdefault(key, error or f"HTTP {status}")
+
+    def summary(self, duration):
+        rows = {}
+        for key, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            histogram = {}
+            for bound in HISTOGRAM_BUCKETS:
+                label = "inf" if bound is math.inf else f"<={bound}ms"
+                histogram[label] = sum(1 for value in ordered if value <= bound) - sum(histogram.values())
+            rows[key] = {
+                "requests": len(ordered),
+                "rps": round(len(ordered) / duration, 2),
+                "error_rate": round(self.errors[key] / len(ordered), 4),
+                "p50_ms": round(_percentile(ordered, 50), 2),
+                "p95_ms": round(_percentile(ordered, 95), 2),
+                "p99_ms": round(_percentile(ordered, 99), 2),
+                "max_ms": round(ordered[-1], 2),
+                "bytes": self.bytes[key],
+                "histogram": histogram,
+                "first_error": self.error_samples.get(key),
+            }
+        total = sum(len(values) for values in self.latencies.values())
+        errors = sum(self.errors.values())
+        return {
+            "duration_s": round(duration, 2),
+            "requests": total,
+            "rps": round(total / duration, 2) if duration else 0,
+            "error_rate": round(errors / total, 4) if total else 0,
+            "endpoints": rows,
+        }
+
+
+def _percentile(ordered, pct):
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# =====================================================
+# 🎬 SCENARIOS
+# =====================================================
+# Each scenario runs one iteration for a virtual user. ``fixtures`` is the
+# plain-data snapshot prepared by the management command before the run.
+
+async def login_storm(user, fixtures, rng):
+    student = rng.choice(fixtures["students"])
+    user.cookies.clear()
+    await user.request("login_page", "GET", "/student-login/")
+    await user.request("login_submit", "POST", "/student-login/", {
+        "email": student["email"],
+        "roll": student["roll"],
+    })
+
+
+async def dashboard(user, fixtures, rng):
+    await user.request("student_dashboard", "GET", "/student-dashboard/")
+    await user.request("dashboard_student", "GET", "/dashboard-student/")
+
+
+async def materials(user, fixtures, rng):
+    await user.request("material_index", "GET", "/material/")
+    course_ids = fixtures["courses_by_student"].get(user.student_id) or fixtures["course_ids"]
+    if course_ids:
+        await user.request("material_course", "GET", f"/material/{rng.choice(course_ids)}/")
+
+
+async def calendar(user, fixtures, rng):
+    await user.request("student_calendar", "GET", "/student-calendar/")
+    month = date.today().replace(day=1)
+    await user.request("student_calendar_events", "GET", (
+        f"/student-calendar/events/?start={month - timedelta(days=7)}&end={month + timedelta(days=42)}"
+    ))
+
+
+async def careers(user, fixtures, rng):
+    await user.request("career_opportunities", "GET", "/career-opportunities/")
+
+
+async def progress(user, fixtures, rng):
+    await user.request("progress_report", "GET", "/student-progress-report/")
+
+
+async def admin_writes(user, fixtures, rng):
+    if "csrftoken" not in user.cookies:
+        await user.request("assign_task_page", "GET", "/admin_panel/assign-task/")
+    student = rng.choice(fixtures["students"])
+    deadline = date.today() + timedelta(days=rng.randint(1, 30))
+    await user.request("assign_task", "POST", "/admin_panel/assign-task/", {
+        "student_id": student["id"],
+        "title": "Load test task",
+        "description": "Created by the loadtest command",
+        "deadline": deadline.isoformat(),
+        "priority": rng.choice(["low", "medium", "high"]),
+    })
+    if fixtures["course_ids"]:
+        await user.request("assign_course", "POST", "/admin_panel/assign-course/", {
+            "student_id": student["id"],
+            "course_id": rng.choice(fixtures["course_ids"]),
+        })
+
+
+SCENARIOS = {
+    "login": login_storm,
+    "dashboard": dashboard,
+    "materials": materials,
+    "calendar": calendar,
+    "careers": careers,
+    "progress": progress,
+    "admin_writes": admin_writes,
+}
+
+# Scenarios whose virtual users start with an admin session instead of a student one.
+ADMIN_SCENARIOS = {"admin_writes"}
+
+
+async def run(transport, mix, fixtures, duration, think_time_ms, seed):
+    """Run every scenario in ``mix`` ({name: users}) concurrently for ``duration`` seconds."""
+    stats = Stats()
+    deadline = time.perf_counter() + duration
+    sessions = iter(fixtures["sessions"])
+    tasks = []
+
+    async def loop(user, scenario, rng):
+        while time.perf_counter() < deadline:
+            await scenario(user, fixtures, rng)
+            if think_time_ms:
+                await asyncio.sleep(rng.uniform(0, think_time_ms) / 1000)
+
+    index = 0
+    for name, users in mix.items():
+        for _ in range(users):
+            index += 1
+            client_ip = f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+            if name in ADMIN_SCENARIOS:
+                cookies, student_id = fixtures["admin_cookies"], None
+            else:
+                student_id, cookies = next(sessions)
+            user = VirtualUser(transport, stats, name, client_ip, cookies)
+            user.student_id = student_id
+            tasks.append(asyncio.create_task(loop(user, SCENARIOS[name], random.Random(seed + index))))
+
+    started = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return stats.summary(time.perf_counter() - started)
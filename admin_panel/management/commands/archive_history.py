@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from admin_panel import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move completed tasks and superseded progress reports older than the "
+        "cut-off into the archive tables, or into Parquet files with --target parquet."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days", type=int, default=settings.ARCHIVE_AFTER_DAYS,
+            help=f"Age cut-off in days (default: ARCHIVE_AFTER_DAYS = {settings.ARCHIVE_AFTER_DAYS}).",
+        )
+        parser.add_argument("--target", choices=["table", "parquet"], default="table")
+        parser.add_argument("--output-dir", default="archive", help="Directory for Parquet files.")
+        parser.add_argument("--batch-size", type=int, default=archive.ARCHIVE_BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived.")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+            self.stdout.write(
+                f"{archive.archivable_tasks(cutoff).count()} task(s) and "
+                f"{archive.archivable_reports(cutoff).count()} progress report(s) would be archived"
+            )
+            return
+
+        try:
+            stats = archive.archive(
+                options["older_than_days"], options["target"], options["output_dir"], options["batch_size"],
+            )
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Archived {stats['tasks']} task(s) and {stats['progress_reports']} progress report(s)"
+        ))
+        for kind, path in stats.get("files", {}).items():
+            self.stdout.write(f"  {kind}: {path}")
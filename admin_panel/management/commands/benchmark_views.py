@@ -0,0 +1,221 @@
+import json
+import logging
+import math
+import time
+from fnmatch import fnmatch
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+
+from admin_panel.models import (
+    College, Student, Course, CourseFolder, CourseMaterial,
+    CareerOpportunities, StudyImage, BackgroundJob, Notification
+)
+
+
+BENCHMARKED_APPS = ("admin_panel", "student_portal", "superuser_admin")
+
+# URL kwarg -> callable returning a sample value from the current database.
+SAMPLE_KWARGS = {
+    "college_id": lambda: College.objects.values_list("id", flat=True).first(),
+    "student_id": lambda: Student.objects.values_list("id", flat=True).first(),
+    "course_id": lambda: Course.objects.values_list("id", flat=True).first(),
+    "course_code": lambda: Course.objects.values_list("code", flat=True).first(),
+    "folder_id": lambda: CourseFolder.objects.values_list("id", flat=True).first(),
+    "material_id": lambda: CourseMaterial.objects.values_list("id", flat=True).first(),
+    "job_id": lambda: CareerOpportunities.objects.values_list("id", flat=True).first(),
+    "image_id": lambda: StudyImage.objects.values_list("id", flat=True).first(),
+    "background_job_id": lambda: BackgroundJob.objects.values_list("id", flat=True).first(),
+    "dataset": lambda: "students",
+    "notification_id": lambda: Notification.objects.values_list("id", flat=True).first(),
+    "token": lambda: Student.objects.exclude(calendar_token=None).values_list("calendar_token", flat=True).first(),
+}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def iter_patterns(patterns):
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield from iter_patterns(entry.url_patterns)
+        elif isinstance(entry, URLPattern):
+            yield entry
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every admin_panel, student_portal and superuser_admin view "
+        "through the test client and write a JSON latency report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--output", default="benchmark_report.json")
+        parser.add_argument("--include", action="append", default=[], help="Only URL names matching this glob.")
+        parser.add_argument("--exclude", action="append", default=[], help="Skip URL names matching this glob.")
+        parser.add_argument("--baseline", help="Previous report to compare against.")
+        parser.add_argument(
+            "--max-p95-regression", type=float, default=0.25,
+            help="Allowed relative p95 increase over the baseline (0.25 = 25%%).",
+        )
+        parser.add_argument(
+            "--max-query-increase", type=int, default=0,
+            help="Allowed increase in query count over the baseline.",
+        )
+        parser.add_argument(
+            "--min-p95-ms", type=float, default=2.0,
+            help="Ignore p95 regressions for views faster than this.",
+        )
+
+    def handle(self, *args, **options):
+        # Failing views are reported by status code; skip the per-request tracebacks.
+        logging.getLogger("django.request").setLevel(logging.CRITICAL)
+        session = self.build_session()
+        results = {}
+
+        for key, name, kwargs in self.collect_targets(options):
+            try:
+                path = reverse(name, kwargs=kwargs)
+            except Exception as exc:
+                self.stderr.write(f"  skip {key}: {exc}")
+                continue
+            results[key] = self.run_view(path, session, options)
+            result = results[key]
+            self.stdout.write(
+                f"  {key:<40} {result['status']}  p50={result['p50_ms']:.1f}ms "
+                f"p95={result['p95_ms']:.1f}ms  q={result['queries']}  {result['bytes']}B"
+            )
+
+        report = {
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "iterations": options["iterations"],
+            "counts": {
+                "colleges": College.objects.count(),
+                "students": Student.objects.count(),
+                "courses": Course.objects.count(),
+            },
+            "results": results,
+        }
+        with open(options["output"], "w") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(f"✅ Report written to {options['output']}"))
+
+        if options["baseline"]:
+            self.compare(report, options)
+
+    # =====================================================
+    # targets
+    # =====================================================
+    def collect_targets(self, options):
+        seen = set()
+        for pattern in iter_patterns(get_resolver().url_patterns):
+            module = getattr(pattern.callback, "__module__", "")
+            if not pattern.name or module.split(".")[0] not in BENCHMARKED_APPS:
+                continue
+
+            params = list(getattr(pattern.pattern, "converters", {}))
+            key = pattern.name + (f"[{','.join(params)}]" if params else "")
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if options["include"] and not any(fnmatch(key, glob) for glob in options["include"]):
+                continue
+            if any(fnmatch(key, glob) for glob in options["exclude"]):
+                continue
+
+            kwargs = {}
+            for param in params:
+                value = SAMPLE_KWARGS[param]() if param in SAMPLE_KWARGS else None
+                if value is None:
+                    break
+                kwargs[param] = value
+            else:
+                yield key, pattern.name, kwargs
+                continue
+            self.stderr.write(f"  skip {key}: no sample value for URL arguments")
+
+    def build_session(self):
+        student = (
+            Student.objects.filter(status="active", courseassignment__isnull=False).first()
+            or Student.objects.first()
+        )
+        return {
+            "admin_logged_in": True,
+            "admin_username": "benchmark",
+            "superuser_logged_in": True,
+            "student_id": student.id if student else None,
+        }
+
+    # =====================================================
+    # measurement
+    # =====================================================
+    def run_view(self, path, session_data, options):
+        client = Client(raise_request_exception=False)
+        timings = []
+        queries = 0
+        status = None
+        size = 0
+
+        for iteration in range(options["warmup"] + options["iterations"]):
+            # Logout views flush the session, so it is re-seeded every time.
+            session = client.session
+            session.update(session_data)
+            session.save()
+
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(path)
+                if response.streaming:
+                    body = b"".join(response.streaming_content)
+                else:
+                    body = response.content
+                elapsed = (time.perf_counter() - started) * 1000
+
+            if iteration >= options["warmup"]:
+                timings.append(elapsed)
+                queries = len(captured)
+                status = response.status_code
+                size = len(body)
+
+        return {
+            "path": path,
+            "status": status,
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "mean_ms": round(sum(timings) / len(timings), 3),
+            "queries": queries,
+            "bytes": size,
+        }
+
+    def compare(self, report, options):
+        with open(options["baseline"]) as fh:
+            baseline = json.load(fh)["results"]
+
+        regressions = []
+        for key, current in report["results"].items():
+            previous = baseline.get(key)
+            if not previous:
+                continue
+            limit = previous["p95_ms"] * (1 + options["max_p95_regression"])
+            if current["p95_ms"] > max(limit, options["min_p95_ms"]):
+                regressions.append(f"{key}: p95 {previous['p95_ms']:.1f}ms -> {current['p95_ms']:.1f}ms")
+            if current["queries"] > previous["queries"] + options["max_query_increase"]:
+                regressions.append(f"{key}: queries {previous['queries']} -> {current['queries']}")
+
+        if regressions:
+            for line in regressions:
+                self.stderr.write(f"  ❌ {line}")
+            raise CommandError(f"{len(regressions)} regression(s) against {options['baseline']}.")
+        self.stdout.write(self.style.SUCCESS("✅ No regressions against baseline."))
@@ -0,0 +1,38 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel import exports
+
+
+class Command(BaseCommand):
+    help = "Export students, course assignments, tasks or latest progress reports as CSV or XLSX."
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=list(exports.EXPORTS))
+        parser.add_argument("--format", choices=["csv", "xlsx"], default="csv")
+        parser.add_argument("--output", "-o", help="File to write (default: stdout for CSV).")
+        parser.add_argument("--chunk-size", type=int, default=exports.EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        dataset = options["dataset"]
+
+        if options["format"] == "xlsx":
+            if not options["output"]:
+                raise CommandError("--output is required for XLSX exports.")
+            try:
+                with open(options["output"], "wb") as fh:
+                    exports.write_xlsx(dataset, fh, options["chunk_size"])
+            except RuntimeError as exc:
+                raise CommandError(str(exc))
+        else:
+            fh = open(options["output"], "w", newline="") if options["output"] else sys.stdout
+            try:
+                for line in exports.iter_csv(dataset, options["chunk_size"]):
+                    fh.write(line)
+            finally:
+                if fh is not sys.stdout:
+                    fh.close()
+
+        if options["output"]:
+            self.stderr.write(self.style.SUCCESS(f"✅ {dataset} exported to {options['output']}"))
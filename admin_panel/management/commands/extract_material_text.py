@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel.material_text import EXTRACT_BATCH_SIZE, queue_extraction
+from admin_panel.models import CourseMaterial
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue text extraction for uploaded course documents that have not been "
+        "indexed yet (e.g. after a bulk load). Run the jobs with "
+        "'manage.py run_jobs --pool process'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Re-queue every material, not only unindexed ones.")
+        parser.add_argument("--failed", action="store_true", help="Also retry materials whose extraction failed.")
+        parser.add_argument("--batch-size", type=int, default=EXTRACT_BATCH_SIZE, help="Materials per job.")
+
+    def handle(self, *args, **options):
+        materials = CourseMaterial.objects.filter(course__deleted_at__isnull=True)
+        if not options["all"]:
+            pending = materials.filter(extracted__isnull=True)
+            if options["failed"]:
+                pending = pending | materials.filter(extracted__status="failed")
+            materials = pending
+
+        ids = list(materials.order_by("id").values_list("id", flat=True))
+        jobs = queue_extraction(ids, options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(ids)} materials queued in {len(jobs)} job(s)"))
@@ -0,0 +1,298 @@
+import random
+from datetime import timedelta
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from admin_panel import counters, search
+from admin_panel.models import (
+    College, Student, Course, CourseAssignment,
+    CourseFolder, CourseMaterial, Task,
+    CalendarEvent, ProgressReport, CareerOpportunities
+)
+
+
+FIRST_NAMES = [
+    "Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Kavya", "Meera",
+    "Rohan", "Saanvi", "Arjun", "Nisha", "Karthik", "Priya", "Rahul", "Sneha",
+]
+LAST_NAMES = [
+    "Sharma", "Iyer", "Reddy", "Nair", "Patel", "Kumar", "Menon", "Rao",
+    "Gupta", "Das", "Pillai", "Singh", "Joshi", "Varma",
+]
+CITIES = ["Chennai", "Bengaluru", "Hyderabad", "Pune", "Kochi", "Coimbatore", "Mumbai", "Delhi"]
+SUBJECTS = [
+    "Python", "Data Analytics", "Java", "Web Development", "Machine Learning",
+    "SQL", "Cloud Computing", "Aptitude", "Soft Skills", "DevOps",
+]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Zoho", "Freshworks", "HCL", "Accenture", "Cognizant"]
+ROLES = ["Software Engineer", "Data Analyst", "QA Engineer", "Support Engineer", "Intern", "DevOps Engineer"]
+
+
+def chunked(iterable, size):
+    """Yield lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic dataset (colleges, students, courses, "
+        "materials, assignments, tasks, progress reports, calendar events and "
+        "career posts) for performance work."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--colleges", type=int, default=10)
+        parser.add_argument("--students-per-college", type=int, default=100)
+        parser.add_argument("--courses", type=int, default=20)
+        parser.add_argument("--folders-per-course", type=int, default=4)
+        parser.add_argument("--materials-per-folder", type=int, default=5)
+        parser.add_argument("--courses-per-student", type=int, default=3)
+        parser.add_argument("--tasks-per-student", type=int, default=5)
+        parser.add_argument("--reports-per-student", type=int, default=3)
+        parser.add_argument("--events", type=int, default=200)
+        parser.add_argument("--careers", type=int, default=500)
+        parser.add_argument(
+            "--history-days", type=int, default=540,
+            help="Spread task and progress report timestamps over this many past days "
+                 "(longer than ARCHIVE_AFTER_DAYS so there is history to archive).",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--prefix", default="gen",
+            help="Prefix for generated emails, roll numbers and course codes.",
+        )
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.prefix = options["prefix"]
+        self.now = timezone.now()
+        self.history_days = max(options["history_days"], 1)
+
+        if Course.objects.filter(code__startswith=self._code_prefix()).exists():
+            raise CommandError(
+                f"Generated data with prefix '{self.prefix}' already exists. "
+                "Use a different --prefix."
+            )
+
+        courses = self.create_courses(options)
+        self.create_events(options["events"], courses)
+        self.create_careers(options["careers"])
+
+        course_ids = [course.id for course in courses]
+        for index in range(options["colleges"]):
+            with transaction.atomic():
+                self.create_college(index, course_ids, options)
+            self.stdout.write(f"  college {index + 1}/{options['colleges']} done")
+
+        # bulk_create skips the signals that maintain the admin search index and counters.
+        search.rebuild_index()
+        counters.reconcile()
+
+        self.stdout.write(self.style.SUCCESS("✅ Dataset generated."))
+
+    # =====================================================
+    # helpers
+    # =====================================================
+    def _code_prefix(self):
+        return f"{self.prefix.upper()}-"
+
+    def _code(self, index):
+        return f"{self._code_prefix()}{index:04d}"
+
+    def _bulk_create(self, model, objs):
+        total = 0
+        for chunk in chunked(objs, self.batch_size):
+            model.objects.bulk_create(chunk, batch_size=self.batch_size)
+            total += len(chunk)
+        return total
+
+    def _name(self):
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    # =====================================================
+    # 📚 COURSES, FOLDERS, MATERIALS
+    # =====================================================
+    def create_courses(self, options):
+        rng = self.rng
+        Course.objects.bulk_create([
+            Course(
+                name=f"{rng.choice(SUBJECTS)} {index + 1}",
+                code=self._code(index),
+                description=f"Generated course {index + 1}.",
+            )
+            for index in range(options["courses"])
+        ], batch_size=self.batch_size)
+        courses = list(Course.objects.filter(code__startswith=self._code_prefix()).order_by("code"))
+
+        folders = []
+        for course in courses:
+            for index in range(options["folders_per_course"]):
+                folder_type = "video" if index % 2 else "material"
+                folders.append(CourseFolder(course=course, name=f"Module {index + 1}", type=folder_type))
+        self._bulk_create(CourseFolder, folders)
+
+        folders = CourseFolder.objects.filter(course__in=courses).order_by("id")
+        materials = (
+            CourseMaterial(
+                course_id=folder.course_id,
+                folder_id=folder.id,
+                type=folder.type,
+                title=f"{folder.name} - Part {index + 1}",
+                link=(
+                    f"https://www.youtube.com/embed/{rng.randrange(16 ** 11):011x}"
+                    if folder.type == "video"
+                    else f"https://drive.google.com/file/d/{rng.randrange(16 ** 16):016x}/preview"
+                ),
+            )
+            for folder in folders.iterator(chunk_size=self.batch_size)
+            for index in range(options["materials_per_folder"])
+        )
+        count = self._bulk_create(CourseMaterial, materials)
+        self.stdout.write(f"  {len(courses)} courses, {count} materials")
+        return courses
+
+    # =====================================================
+    # 📅 CALENDAR EVENTS / 💼 CAREERS
+    # =====================================================
+    def create_events(self, count, courses):
+        rng = self.rng
+        codes = [course.code for course in courses] + ["All Courses"]
+
+        def events():
+            for index in range(count):
+                start = self.now + timedelta(days=rng.randint(-60, 120), hours=rng.randint(8, 18))
+                all_day = rng.random() < 0.3
+                end = None if all_day else start + timedelta(hours=1)
+                # bulk_create skips CalendarEvent.save(), which normally sets ends_at.
+                yield CalendarEvent(
+                    title=f"Session {index + 1}",
+                    course=rng.choice(codes),
+                    description="Generated event",
+                    meeting_link="https://meet.google.com/gen-erat-ed",
+                    start=start,
+                    end=end,
+                    all_day=all_day,
+                    ends_at=end or start,
+                )
+
+        self._bulk_create(CalendarEvent, events())
+
+    def create_careers(self, count):
+        rng = self.rng
+
+        def careers():
+            for index in range(count):
+                role = rng.choice(ROLES)
+                company = rng.choice(COMPANIES)
+                yield CareerOpportunities(
+                    job_title=role,
+                    company_name=company,
+                    location=rng.choice(CITIES),
+                    stipend=f"{rng.randint(10, 60)},000 / month",
+                    experience=rng.choice(["Fresher", "0-1 years", "1-3 years"]),
+                    link=f"https://careers.example.com/{self.prefix}/{index}",
+                    job_description=f"<p>{company} is hiring a {role}.</p>",
+                    mode=rng.choice(["online", "offline"]),
+                    status="active" if rng.random() < 0.8 else "inactive",
+                )
+
+        self._bulk_create(CareerOpportunities, careers())
+
+    # =====================================================
+    # 🎓 COLLEGE + STUDENTS + PER-STUDENT HISTORY
+    # =====================================================
+    def create_college(self, index, course_ids, options):
+        rng = self.rng
+        per_college = options["students_per_college"]
+
+        college = College.objects.create(
+            name=f"Generated College {index + 1}",
+            email=f"{self.prefix}-college-{index}@example.com",
+            address=rng.choice(CITIES),
+            mode=rng.choice(["online", "offline", "hybrid"]),
+        )
+
+        students = (
+            Student(
+                name=self._name(),
+                email=f"{self.prefix}-{index}-{number}@example.com",
+                roll=f"{self.prefix.upper()}{index:04d}{number:06d}",
+                college=college,
+                mode=rng.choice(["online", "offline"]),
+                status="active" if rng.random() < 0.95 else "inactive",
+            )
+            for number in range(per_college)
+        )
+        self._bulk_create(Student, students)
+        student_ids = list(Student.objects.filter(college=college).values_list("id", flat=True))
+
+        per_student = min(options["courses_per_student"], len(course_ids))
+        self._bulk_create(CourseAssignment, (
+            CourseAssignment(student_id=student_id, course_id=course_id)
+            for student_id in student_ids
+            for course_id in rng.sample(course_ids, per_student)
+        ))
+
+        self._bulk_create(Task, (
+            self._task(student_id, number, course_ids)
+            for student_id in student_ids
+            for number in range(options["tasks_per_student"])
+        ))
+
+        # Each student's reports are created oldest first, so the newest one
+        # also has the highest id (the "latest" report kept by archival).
+        self._bulk_create(ProgressReport, (
+            ProgressReport(
+                student_id=student_id,
+                interview_prep=rng.randint(0, 100),
+                communication_skills=rng.randint(0, 100),
+                resume_prep=rng.randint(0, 100),
+                technical_prep=rng.randint(0, 100),
+                mock_tests=rng.randint(0, 100),
+                mock_interviews=rng.randint(0, 100),
+                created_at=created_at,
+            )
+            for student_id in student_ids
+            for created_at in sorted(self._past() for _ in range(options["reports_per_student"]))
+        ))
+
+    def _past(self):
+        """A random moment within the last ``--history-days`` days."""
+        return self.now - timedelta(seconds=self.rng.randint(0, self.history_days * 86400))
+
+    def _task(self, student_id, number, course_ids):
+        rng = self.rng
+        created_at = self._past()
+        deadline = created_at + timedelta(days=rng.randint(1, 45))
+        # Most tasks whose deadline has passed were done; some are left overdue.
+        if deadline < self.now and rng.random() < 0.85:
+            status = "completed"
+        else:
+            status = rng.choice(["pending", "in_progress", "completed"])
+        completed_at = None
+        if status == "completed":
+            # Finished some time after it was set, mostly before the deadline.
+            done_by = min(deadline + timedelta(days=7), self.now)
+            completed_at = created_at + (done_by - created_at) * rng.random()
+        # bulk_create skips Task.save(), which normally sets completed_at.
+        return Task(
+            student_id=student_id,
+            course_id=rng.choice(course_ids) if course_ids else None,
+            title=f"Task {number + 1}",
+            description="Generated task",
+            deadline=deadline.date(),
+            created_at=created_at,
+            completed_at=completed_at,
+            priority=rng.choice(["low", "medium", "high"]),
+            status=status,
+        )
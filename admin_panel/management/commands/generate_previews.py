@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel.models import CourseMaterial
+from admin_panel.previews import PREVIEW_BATCH_SIZE, queue_previews
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue preview generation for uploaded course documents that have no "
+        "preview yet (e.g. after a bulk load). Run the jobs with "
+        "'manage.py run_jobs --pool process'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Re-queue every material with a file.")
+        parser.add_argument("--failed", action="store_true", help="Also retry materials whose preview failed.")
+        parser.add_argument("--batch-size", type=int, default=PREVIEW_BATCH_SIZE, help="Materials per job.")
+
+    def handle(self, *args, **options):
+        materials = CourseMaterial.objects.filter(course__deleted_at__isnull=True).exclude(file="")
+        if not options["all"]:
+            pending = materials.filter(preview__isnull=True)
+            if options["failed"]:
+                pending = pending | materials.filter(preview__status="failed")
+            materials = pending
+
+        ids = list(materials.order_by("id").values_list("id", flat=True))
+        jobs = queue_previews(ids, options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(ids)} materials queued in {len(jobs)} job(s)"))
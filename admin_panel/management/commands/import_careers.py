@@ -0,0 +1,51 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel.career_feed import import_feed, read_feed
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a CSV or JSON (array or JSON Lines) career feed. Posts are "
+        "matched by normalized link or company/title, upserted in batches, and "
+        "active posts from the same source missing from the feed are deactivated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Feed file, or '-' for stdin.")
+        parser.add_argument("--source", required=True, help="Feed name stored on every imported post.")
+        parser.add_argument("--format", choices=["auto", "csv", "json"], default="auto")
+        parser.add_argument("--mode", choices=["online", "offline"], default="offline", help="Mode for rows without one.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--keep-missing", action="store_true",
+            help="Do not deactivate posts from this source that are absent from the feed.",
+        )
+
+    def handle(self, *args, **options):
+        source = options["source"].strip()[:50]
+        if not source:
+            raise CommandError("--source must not be empty.")
+
+        path = options["path"]
+        fileobj = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            stats = import_feed(
+                read_feed(fileobj, options["format"], name=path),
+                source,
+                default_mode=options["mode"],
+                batch_size=options["batch_size"],
+                deactivate_missing=not options["keep_missing"],
+            )
+        except (ValueError, csv.Error) as exc:
+            raise CommandError(f"Could not read feed: {exc}")
+        finally:
+            if fileobj is not sys.stdin.buffer:
+                fileobj.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {source}: {stats['created']} created, {stats['updated']} updated, "
+            f"{stats['skipped']} skipped, {stats['deactivated']} deactivated"
+        ))
@@ -0,0 +1,135 @@
+import asyncio
+import json
+from itertools import cycle
+
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_panel import loadtest
+from admin_panel.models import Course, CourseAssignment, Student
+
+
+DEFAULT_MIX = "login=10,dashboard=40,materials=20,calendar=20,admin_writes=2"
+
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(","):
+        name, _, users = part.partition("=")
+        name = name.strip()
+        if name not in loadtest.SCENARIOS:
+            raise CommandError(f"Unknown scenario '{name}'. Choose from: {', '.join(loadtest.SCENARIOS)}")
+        mix[name] = int(users or 1)
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the site with concurrent virtual users (login storm, dashboards, "
+        "materials, calendar, careers, progress and admin writes) and report "
+        "throughput, error rate and latency histograms. Admin scenarios write "
+        "to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target", default="asgi",
+            help="'asgi' or 'wsgi' to run in-process, or a base URL such as http://127.0.0.1:8000.",
+        )
+        parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario=users list (default: {DEFAULT_MIX}).")
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+        parser.add_argument("--wsgi-workers", type=int, default=8, help="Thread pool size for --target wsgi.")
+        parser.add_argument("--think-time", type=float, default=0, help="Max random pause between iterations (ms).")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--output", help="Write the JSON summary to this file.")
+
+    def handle(self, *args, **options):
+        mix = parse_mix(options["mix"])
+        student_users = sum(users for name, users in mix.items() if name not in loadtest.ADMIN_SCENARIOS)
+        fixtures = self.build_fixtures(student_users)
+        transport = self.build_transport(options)
+
+        self.stdout.write(f"Running {sum(mix.values())} virtual users for {options['duration']}s against {options['target']}")
+        summary = asyncio.run(loadtest.run(
+            transport, mix, fixtures, options["duration"], options["think_time"], options["seed"],
+        ))
+        summary["target"] = options["target"]
+        summary["mix"] = mix
+
+        self.print_summary(summary)
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                json.dump(summary, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"✅ Summary written to {options['output']}"))
+
+    def build_transport(self, options):
+        target = options["target"]
+        if target == "asgi":
+            from ManasioLMS.asgi import application
+            return loadtest.ASGITransport(application)
+        if target == "wsgi":
+            from ManasioLMS.wsgi import application
+            return loadtest.WSGITransport(application, options["wsgi_workers"])
+        if target.startswith("http://"):
+            return loadtest.HTTPTransport(target)
+        raise CommandError("--target must be 'asgi', 'wsgi' or an http:// URL.")
+
+    def build_fixtures(self, session_count):
+        """Snapshot the data scenarios need and pre-create logged-in sessions."""
+        students = list(
+            Student.objects.filter(status="active")
+            .order_by("id")
+            .values("id", "email", "roll")[:max(session_count, 200)]
+        )
+        if not students:
+            raise CommandError("No active students. Run generate_dataset first.")
+
+        student_ids = [student["id"] for student in students]
+        courses_by_student = {}
+        for student_id, course_id in CourseAssignment.objects.filter(
+            student_id__in=student_ids
+        ).values_list("student_id", "course_id"):
+            courses_by_student.setdefault(student_id, []).append(course_id)
+
+        sessions = []
+        for student, _ in zip(cycle(students), range(session_count)):
+            store = SessionStore()
+            store["student_id"] = student["id"]
+            store.create()
+            sessions.append((student["id"], {settings.SESSION_COOKIE_NAME: store.session_key}))
+
+        admin = SessionStore()
+        admin["admin_logged_in"] = True
+        admin["admin_username"] = "loadtest"
+        admin.create()
+
+        return {
+            "students": students,
+            "course_ids": list(Course.objects.values_list("id", flat=True)[:500]),
+            "courses_by_student": courses_by_student,
+            "sessions": sessions,
+            "admin_cookies": {settings.SESSION_COOKIE_NAME: admin.session_key},
+        }
+
+    def print_summary(self, summary):
+        self.stdout.write(
+            f"\n{summary['requests']} requests in {summary['duration_s']}s — "
+            f"{summary['rps']} req/s, error rate {summary['error_rate']:.2%}\n"
+        )
+        self.stdout.write(f"  {'endpoint':<34}{'reqs':>7}{'rps':>9}{'err%':>8}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for key, row in summary["endpoints"].items():
+            self.stdout.write(
+                f"  {key:<34}{row['requests']:>7}{row['rps']:>9}{row['error_rate']:>8.1%}"
+                f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}"
+            )
+            if row["first_error"]:
+                self.stdout.write(f"      first error: {row['first_error']}")
+        self.stdout.write("\n  latency histogram (all endpoints)")
+        totals = {}
+        for row in summary["endpoints"].values():
+            for bucket, count in row["histogram"].items():
+                totals[bucket] = totals.get(bucket, 0) + count
+        peak = max(totals.values() or [1]) or 1
+        for bucket, count in totals.items():
+            self.stdout.write(f"  {bucket:>9} {count:>7} {'#' * int(40 * count / peak)}")
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel import dashboards
+from admin_panel.models import Student
+
+
+class Command(BaseCommand):
+    help = (
+        "Build student dashboard documents ahead of time (e.g. before a peak "
+        "login window) so no student pays for a lazy rebuild."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Rebuild every active student, not only missing or stale documents.")
+
+    def handle(self, *args, **options):
+        students = Student.objects.filter(status="active")
+        if not options["all"]:
+            students = students.exclude(dashboard__stale=False)
+
+        rebuilt = 0
+        for student_id in students.values_list("id", flat=True).order_by("id"):
+            dashboards.rebuild(student_id)
+            rebuilt += 1
+            if rebuilt % 1000 == 0:
+                self.stdout.write(f"  {rebuilt} dashboards built")
+        self.stdout.write(self.style.SUCCESS(f"✅ {rebuilt} dashboards built"))
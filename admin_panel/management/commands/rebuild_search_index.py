@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel import search
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the admin search index in place (e.g. after migrating or a bulk "
+        "load that bypassed model signals). Search stays available while it runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind", action="append", choices=list(search.INDEXED),
+            help="Only re-index this kind (repeatable). Default: all kinds.",
+        )
+        parser.add_argument("--batch-size", type=int, default=search.INDEX_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        def progress(kind, stats):
+            self.stdout.write(f"  {kind}: {stats['indexed']} indexed, {stats['pruned']} pruned")
+
+        search.rebuild_index(options["kind"], options["batch_size"], progress=progress)
+        self.stdout.write(self.style.SUCCESS("✅ Search index rebuilt"))
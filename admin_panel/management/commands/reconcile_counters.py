@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel import counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the denormalized student, enrolment, folder and material counters on "
+        "colleges and courses and repair the rows that drifted, in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=counters.RECONCILE_BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows drifted.")
+
+    def handle(self, *args, **options):
+        repaired = counters.reconcile(options["batch_size"], dry_run=options["dry_run"])
+        summary = ", ".join(f"{count} {name}(s)" for name, count in repaired.items())
+        if options["dry_run"]:
+            self.stdout.write(f"Drifted: {summary}")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✅ Repaired: {summary}"))
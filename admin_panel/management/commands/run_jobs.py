@@ -0,0 +1,86 @@
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+import django
+from django.core.management.base import BaseCommand
+
+# Process-pool children unpickle functions from this module before Django is
+# set up, so nothing here may import models at module level.
+
+
+def _setup_process():
+    django.setup()
+
+
+def _execute(job_id):
+    from admin_panel import jobs
+
+    return jobs.execute(job_id)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs on a thread or process pool. Jobs are "
+        "claimed from the database by priority, retried with backoff and their "
+        "results stored on the BackgroundJob row."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Pool size.")
+        parser.add_argument("--pool", choices=["thread", "process"], default="thread")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument("--task", action="append", default=[], help="Only run these task names.")
+        parser.add_argument("--once", action="store_true", help="Exit when no job is due instead of polling.")
+        parser.add_argument(
+            "--stale-after", type=int, default=3600,
+            help="Requeue jobs left running for this many seconds (crashed worker).",
+        )
+
+    def handle(self, *args, **options):
+        from admin_panel import jobs
+
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        requeued = jobs.requeue_stale(timedelta(seconds=options["stale_after"]))
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s)")
+
+        size = options["workers"]
+        if options["pool"] == "process":
+            # Spawned (not forked) children open their own database connections.
+            pool = ProcessPoolExecutor(
+                max_workers=size, mp_context=multiprocessing.get_context("spawn"), initializer=_setup_process,
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=size)
+
+        self.stdout.write(f"Worker {worker_id} running {size} {options['pool']}(s)")
+        running = {}
+        try:
+            while True:
+                free = size - len(running)
+                claimed = jobs.claim(worker_id, free, options["task"]) if free else []
+                for job_id in claimed:
+                    running[pool.submit(_execute, job_id)] = job_id
+
+                if not running:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                done, _ = wait(running, timeout=options["poll_interval"], return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_id = running.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as exc:
+                        status = f"crashed ({exc!r})"
+                    self.stdout.write(f"  job #{job_id}: {status}")
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping; waiting for running jobs…")
+        finally:
+            pool.shutdown(wait=True)
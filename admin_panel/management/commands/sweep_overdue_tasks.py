@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from admin_panel.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Mark open tasks whose deadline has passed as overdue with one UPDATE. "
+        "Schedule it daily (e.g. cron at 00:05)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", help="Treat this day (YYYY-MM-DD) as today.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many tasks are overdue.")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        if options["date"]:
+            today = parse_date(options["date"])
+            if today is None:
+                raise CommandError("--date must be YYYY-MM-DD.")
+
+        due = Task.objects.open().filter(deadline__lt=today)
+        if options["dry_run"]:
+            self.stdout.write(f"{due.count()} task(s) would be marked overdue")
+            return
+
+        swept = Task.objects.sweep_overdue(today)
+        self.stdout.write(self.style.SUCCESS(f"✅ {swept} task(s) marked overdue"))
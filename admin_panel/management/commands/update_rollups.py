@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from admin_panel import rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the daily progress and task rollups read by the admin trend charts. "
+        "Only rows created or completed since the last run are read. "
+        "Schedule it regularly (e.g. cron every 15 minutes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full", action="store_true",
+            help="Recompute every day that has source rows (archived rows are not counted).",
+        )
+
+    def handle(self, *args, **options):
+        stats = rollups.update_rollups(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {stats['days']} day(s) rolled up into {stats['rows']} row(s)"
+        ))
@@ -0,0 +1,77 @@
+"""
+Extracted-text index of uploaded course documents.
+
+Saving a ``CourseMaterial`` queues ``extract_material_text``; the parsing is
+CPU-bound, so run it with ``manage.py run_jobs --pool process``. The text is
+stored in ``MaterialText``, which is mirrored into a full-text index (see
+``admin_panel.search.search_materials``).
+"""
+from django.utils import timezone
+
+from .jobs import background_task, enqueue, report_progress
+from .models import CourseMaterial, MaterialText
+from .text_extraction import extract_text
+
+
+EXTRACT_BATCH_SIZE = 50
+
+
+def _read(material):
+    try:
+        return material.file.path
+    except NotImplementedError:
+        # Remote storage: hand the extractor the bytes instead of a path.
+        with material.file.open("rb") as fileobj:
+            return fileobj.read()
+
+
+def extract(material):
+    """Create or refresh the ``MaterialText`` of one material."""
+    entry = MaterialText.objects.filter(material_id=material.id).first() or MaterialText(material=material)
+    entry.course_id = material.course_id
+    entry.title = str(material)[:255]
+    source = material.file.name if material.file else ""
+
+    if not entry._state.adding and entry.source == source and entry.status != "failed":
+        # Only the title or course changed; the file was already read.
+        entry.save(update_fields=["course_id", "title"])
+        return entry
+
+    entry.source = source
+    entry.text = ""
+    entry.error = ""
+    if not source:
+        entry.status = "empty"
+    else:
+        try:
+            text = extract_text(_read(material), source)
+        except Exception as exc:  # corrupt upload, missing optional dependency, ...
+            entry.status = "failed"
+            entry.error = f"{type(exc).__name__}: {exc}"[:300]
+        else:
+            entry.status = "unsupported" if text is None else "extracted"
+            entry.text = text or ""
+    entry.extracted_at = timezone.now()
+    entry.save()
+    return entry
+
+
+@background_task
+def extract_material_text(material_ids):
+    """Background job: (re-)extract the text of the given materials."""
+    materials = CourseMaterial.objects.filter(id__in=material_ids).select_related("course")
+    stats = {}
+    for done, material in enumerate(materials, start=1):
+        status = extract(material).status
+        stats[status] = stats.get(status, 0) + 1
+        report_progress(done=done, total=len(material_ids))
+    return stats
+
+
+def queue_extraction(material_ids, batch_size=EXTRACT_BATCH_SIZE):
+    """Queue extraction jobs of ``batch_size`` materials each. Returns the jobs."""
+    material_ids = list(material_ids)
+    return [
+        enqueue(extract_material_text, material_ids[start:start + batch_size], priority=-1)
+        for start in range(0, len(material_ids), batch_size)
+    ]
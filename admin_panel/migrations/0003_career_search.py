@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:29
+
+from django.db import migrations, models
+
+
+FTS_COLUMNS = "job_title, company_name, location, job_description"
+TSVECTOR = (
+    "to_tsvector('english', coalesce(job_title, '') || ' ' || coalesce(company_name, '') "
+    "|| ' ' || coalesce(location, '') || ' ' || coalesce(job_description, ''))"
+)
+
+SQLITE_FORWARD = [
+    f"""CREATE VIRTUAL TABLE admin_panel_career_fts USING fts5(
+        {FTS_COLUMNS},
+        content='admin_panel_careeropportunities', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER admin_panel_career_fts_ai AFTER INSERT ON admin_panel_careeropportunities BEGIN
+        INSERT INTO admin_panel_career_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.job_title, new.company_name, new.location, new.job_description);
+    END""",
+    f"""CREATE TRIGGER admin_panel_career_fts_ad AFTER DELETE ON admin_panel_careeropportunities BEGIN
+        INSERT INTO admin_panel_career_fts(admin_panel_career_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.job_description);
+    END""",
+    f"""CREATE TRIGGER admin_panel_career_fts_au AFTER UPDATE ON admin_panel_careeropportunities BEGIN
+        INSERT INTO admin_panel_career_fts(admin_panel_career_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.job_description);
+        INSERT INTO admin_panel_career_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.job_title, new.company_name, new.location, new.job_description);
+    END""",
+    "INSERT INTO admin_panel_career_fts(admin_panel_career_fts) VALUES ('rebuild')",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS admin_panel_career_fts_ai",
+    "DROP TRIGGER IF EXISTS admin_panel_career_fts_ad",
+    "DROP TRIGGER IF EXISTS admin_panel_career_fts_au",
+    "DROP TABLE IF EXISTS admin_panel_career_fts",
+]
+POSTGRES_FORWARD = [
+    f"CREATE INDEX career_fts_idx ON admin_panel_careeropportunities USING GIN ({TSVECTOR})",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS career_fts_idx",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_REVERSE, "postgresql": POSTGRES_REVERSE}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0002_alter_calendarevent_course'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='careeropportunities',
+            index=models.Index(fields=['mode', 'status', '-updated_at'], name='career_mode_status_updated'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
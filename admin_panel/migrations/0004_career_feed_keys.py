@@ -0,0 +1,114 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:31
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.db import migrations, models
+
+
+# Frozen copies of admin_panel.career_feed.normalize_link / dedupe_key as of
+# this migration, so later changes to the live helpers do not alter it.
+TRACKING_PARAMS = {"ref", "source", "gclid", "fbclid", "mc_cid", "mc_eid"}
+
+
+def normalize_link(url):
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(((parts.scheme or "https").lower(), host, path, urlencode(query), ""))[:255]
+
+
+def _normalize_text(value):
+    return re.sub(r"[^a-z0-9]+", " ", (value or "").lower()).strip()
+
+
+def dedupe_key(company_name, job_title):
+    raw = f"{_normalize_text(company_name)}|{_normalize_text(job_title)}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+# SQLite rebuilds the table for the AddFields below, which drops the FTS
+# triggers created in 0003; recreate them and resync the index.
+FTS_COLUMNS = "job_title, company_name, location, job_description"
+SQLITE_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS admin_panel_career_fts_ai AFTER INSERT ON admin_panel_careeropportunities BEGIN
+        INSERT INTO admin_panel_career_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.job_title, new.company_name, new.location, new.job_description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS admin_panel_career_fts_ad AFTER DELETE ON admin_panel_careeropportunities BEGIN
+        INSERT INTO admin_panel_career_fts(admin_panel_career_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.job_description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS admin_panel_career_fts_au AFTER UPDATE ON admin_panel_careeropportunities BEGIN
+        INSERT INTO admin_panel_career_fts(admin_panel_career_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.job_description);
+        INSERT INTO admin_panel_career_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.job_title, new.company_name, new.location, new.job_description);
+    END""",
+    "INSERT INTO admin_panel_career_fts(admin_panel_career_fts) VALUES ('rebuild')",
+]
+
+
+def restore_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for sql in SQLITE_TRIGGERS:
+            schema_editor.execute(sql)
+
+
+def backfill_keys(apps, schema_editor):
+    CareerOpportunities = apps.get_model("admin_panel", "CareerOpportunities")
+    batch = []
+    for job in CareerOpportunities.objects.only("id", "link", "company_name", "job_title").iterator(chunk_size=1000):
+        job.link_key = normalize_link(job.link)
+        job.dedupe_key = dedupe_key(job.company_name, job.job_title)
+        batch.append(job)
+        if len(batch) >= 1000:
+            CareerOpportunities.objects.bulk_update(batch, ["link_key", "dedupe_key"])
+            batch = []
+    CareerOpportunities.objects.bulk_update(batch, ["link_key", "dedupe_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0003_career_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='careeropportunities',
+            name='dedupe_key',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='careeropportunities',
+            name='last_seen_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='careeropportunities',
+            name='link_key',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='careeropportunities',
+            name='source',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='careeropportunities',
+            index=models.Index(fields=['source', 'status', 'last_seen_at'], name='career_source_seen'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+        migrations.RunPython(backfill_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0005_background_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='unread_notifications',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', 'Task'), ('event', 'Calendar Event'), ('material', 'Course Material'), ('general', 'General')], default='general', max_length=10)),
+                ('title', models.CharField(max_length=200)),
+                ('body', models.CharField(blank=True, max_length=300)),
+                ('link', models.CharField(blank=True, max_length=300)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='admin_panel.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', '-created_at', '-id'], name='notification_inbox')],
+            },
+        ),
+    ]
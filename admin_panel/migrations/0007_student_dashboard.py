@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0006_notifications'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentDashboard',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard', serialize=False, to='admin_panel.student')),
+                ('document', models.JSONField(default=dict)),
+                ('stale', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:37
+
+from django.db import migrations, models
+
+
+def mark_dashboards_stale(apps, schema_editor):
+    # The dashboard "tasks" section changed shape (upcoming / overdue windows).
+    apps.get_model("admin_panel", "StudentDashboard").objects.update(stale=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0007_student_dashboard'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('overdue', 'Overdue')], default='pending', max_length=15),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['student', 'status', 'deadline'], name='task_student_status_deadline'),
+        ),
+        migrations.RunPython(mark_dashboards_stale, migrations.RunPython.noop),
+    ]
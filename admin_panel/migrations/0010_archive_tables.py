@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0009_soft_delete'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedProgressReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('student_id', models.BigIntegerField(db_index=True)),
+                ('interview_prep', models.PositiveSmallIntegerField(default=0)),
+                ('communication_skills', models.PositiveSmallIntegerField(default=0)),
+                ('resume_prep', models.PositiveSmallIntegerField(default=0)),
+                ('technical_prep', models.PositiveSmallIntegerField(default=0)),
+                ('mock_tests', models.PositiveSmallIntegerField(default=0)),
+                ('mock_interviews', models.PositiveSmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('student_id', models.BigIntegerField(db_index=True)),
+                ('course_id', models.BigIntegerField(blank=True, null=True)),
+                ('title', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('deadline', models.DateField()),
+                ('priority', models.CharField(max_length=10)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='progressreport',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='progressreport',
+            index=models.Index(fields=['student', '-id'], name='progress_student_latest'),
+        ),
+    ]
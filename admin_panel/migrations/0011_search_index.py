@@ -0,0 +1,157 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:45
+
+from urllib.parse import urlencode
+
+from django.db import migrations, models
+from django.urls import reverse
+
+
+FTS_COLUMNS = "title, subtitle, body, kind"
+TSVECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(subtitle, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(body, '')), 'D')"
+)
+
+SQLITE_FORWARD = [
+    # ``kind`` is indexed too so a kind filter is a doclist intersection, not a scan.
+    f"""CREATE VIRTUAL TABLE admin_panel_search_fts USING fts5(
+        {FTS_COLUMNS},
+        content='admin_panel_searchentry', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    # Term list of the index, used to correct misspelt query terms.
+    "CREATE VIRTUAL TABLE admin_panel_search_vocab USING fts5vocab(admin_panel_search_fts, 'col')",
+    f"""CREATE TRIGGER admin_panel_search_fts_ai AFTER INSERT ON admin_panel_searchentry BEGIN
+        INSERT INTO admin_panel_search_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.title, new.subtitle, new.body, new.kind);
+    END""",
+    f"""CREATE TRIGGER admin_panel_search_fts_ad AFTER DELETE ON admin_panel_searchentry BEGIN
+        INSERT INTO admin_panel_search_fts(admin_panel_search_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.subtitle, old.body, old.kind);
+    END""",
+    f"""CREATE TRIGGER admin_panel_search_fts_au AFTER UPDATE ON admin_panel_searchentry BEGIN
+        INSERT INTO admin_panel_search_fts(admin_panel_search_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.subtitle, old.body, old.kind);
+        INSERT INTO admin_panel_search_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.title, new.subtitle, new.body, new.kind);
+    END""",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS admin_panel_search_fts_ai",
+    "DROP TRIGGER IF EXISTS admin_panel_search_fts_ad",
+    "DROP TRIGGER IF EXISTS admin_panel_search_fts_au",
+    "DROP TABLE IF EXISTS admin_panel_search_vocab",
+    "DROP TABLE IF EXISTS admin_panel_search_fts",
+]
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX search_entry_fts_idx ON admin_panel_searchentry USING GIN (({TSVECTOR}))",
+    "CREATE INDEX search_entry_title_trgm_idx ON admin_panel_searchentry USING GIN (title gin_trgm_ops)",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS search_entry_title_trgm_idx",
+    "DROP INDEX IF EXISTS search_entry_fts_idx",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_REVERSE, "postgresql": POSTGRES_REVERSE}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+INDEX_BATCH_SIZE = 1000
+
+
+# Frozen copies of the entry builders in admin_panel.search at the time of this
+# migration; keep them as they are even if the live ones change.
+def _query_url(name, value):
+    return f"{reverse(name)}?{urlencode({'q': value})}"
+
+
+def _entries(apps):
+    """(kind, queryset, builder) for every row that belongs in the index."""
+    College = apps.get_model("admin_panel", "College")
+    Student = apps.get_model("admin_panel", "Student")
+    Course = apps.get_model("admin_panel", "Course")
+    CourseMaterial = apps.get_model("admin_panel", "CourseMaterial")
+    CareerOpportunities = apps.get_model("admin_panel", "CareerOpportunities")
+    return [
+        ("college", College.objects.filter(deleted_at__isnull=True), lambda college: (
+            college.name, college.email, f"{college.address} {college.description}",
+            _query_url("manage_colleges", college.name),
+        )),
+        ("student", Student.objects.filter(deleted_at__isnull=True), lambda student: (
+            student.name, f"{student.roll} · {student.email}", student.phone,
+            _query_url("manage_students", student.roll),
+        )),
+        ("course", Course.objects.filter(deleted_at__isnull=True), lambda course: (
+            course.name, course.code, course.description, reverse("manage_course", args=[course.code]),
+        )),
+        ("material", CourseMaterial.objects.filter(course__deleted_at__isnull=True).select_related("course"),
+         lambda material: (
+            material.title or material.link or "Material", material.course.name,
+            material.get_type_display(), reverse("manage_course", args=[material.course.code]),
+        )),
+        ("career", CareerOpportunities.objects.all(), lambda job: (
+            job.job_title, job.company_name, f"{job.location} {job.job_description}",
+            _query_url("career_opportunities", job.job_title),
+        )),
+    ]
+
+
+def index_existing_rows(apps, schema_editor):
+    """Fill the index from the rows that exist already (same as ``manage.py rebuild_search_index``)."""
+    SearchEntry = apps.get_model("admin_panel", "SearchEntry")
+    for kind, queryset, build in _entries(apps):
+        last = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last).order_by("pk")[:INDEX_BATCH_SIZE])
+            if not batch:
+                break
+            entries = []
+            for obj in batch:
+                title, subtitle, body, url = build(obj)
+                entries.append(SearchEntry(
+                    kind=kind, object_id=obj.pk, title=title[:255],
+                    subtitle=subtitle[:255], body=body or "", url=url[:300],
+                ))
+            SearchEntry.objects.bulk_create(entries, ignore_conflicts=True)
+            last = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0010_archive_tables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('college', 'College'), ('student', 'Student'), ('course', 'Course'), ('material', 'Course Material'), ('career', 'Career Opportunity')], max_length=10)),
+                ('object_id', models.BigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('subtitle', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('url', models.CharField(blank=True, max_length=300)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:50
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+FTS_COLUMNS = "title, text, course_id"
+TSVECTOR = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(text, ''))"
+
+SQLITE_FORWARD = [
+    # course_id is indexed as a token so a course filter narrows the MATCH itself.
+    f"""CREATE VIRTUAL TABLE admin_panel_material_fts USING fts5(
+        {FTS_COLUMNS},
+        content='admin_panel_materialtext', content_rowid='material_id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER admin_panel_material_fts_ai AFTER INSERT ON admin_panel_materialtext BEGIN
+        INSERT INTO admin_panel_material_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.material_id, new.title, new.text, new.course_id);
+    END""",
+    f"""CREATE TRIGGER admin_panel_material_fts_ad AFTER DELETE ON admin_panel_materialtext BEGIN
+        INSERT INTO admin_panel_material_fts(admin_panel_material_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.material_id, old.title, old.text, old.course_id);
+    END""",
+    f"""CREATE TRIGGER admin_panel_material_fts_au AFTER UPDATE ON admin_panel_materialtext BEGIN
+        INSERT INTO admin_panel_material_fts(admin_panel_material_fts, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.material_id, old.title, old.text, old.course_id);
+        INSERT INTO admin_panel_material_fts(rowid, {FTS_COLUMNS})
+        VALUES (new.material_id, new.title, new.text, new.course_id);
+    END""",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS admin_panel_material_fts_ai",
+    "DROP TRIGGER IF EXISTS admin_panel_material_fts_ad",
+    "DROP TRIGGER IF EXISTS admin_panel_material_fts_au",
+    "DROP TABLE IF EXISTS admin_panel_material_fts",
+]
+POSTGRES_FORWARD = [
+    f"CREATE INDEX material_text_fts_idx ON admin_panel_materialtext USING GIN (({TSVECTOR}))",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS material_text_fts_idx",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_REVERSE, "postgresql": POSTGRES_REVERSE}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0011_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaterialText',
+            fields=[
+                ('material', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='extracted', serialize=False, to='admin_panel.coursematerial')),
+                ('course_id', models.BigIntegerField(db_index=True)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('text', models.TextField(blank=True)),
+                ('source', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('extracted', 'Extracted'), ('empty', 'No file'), ('unsupported', 'Unsupported type'), ('failed', 'Failed')], default='extracted', max_length=12)),
+                ('error', models.CharField(blank=True, max_length=300)),
+                ('extracted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0012_material_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaterialPreview',
+            fields=[
+                ('material', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='preview', serialize=False, to='admin_panel.coursematerial')),
+                ('source', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('ready', 'Ready'), ('counted', 'Page count only'), ('unsupported', 'Unsupported type'), ('failed', 'Failed')], default='ready', max_length=12)),
+                ('page_count', models.PositiveIntegerField(blank=True, null=True)),
+                ('cover', models.CharField(blank=True, max_length=300)),
+                ('pages', models.JSONField(blank=True, default=list)),
+                ('error', models.CharField(blank=True, max_length=300)),
+                ('generated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
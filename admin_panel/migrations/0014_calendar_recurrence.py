@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_ends_at(apps, schema_editor):
+    # Existing events do not repeat: the series ends with the event itself.
+    CalendarEvent = apps.get_model("admin_panel", "CalendarEvent")
+    CalendarEvent.objects.update(ends_at=Coalesce("end", "start"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0013_material_preview'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarEventOverride',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_start', models.DateTimeField()),
+                ('cancelled', models.BooleanField(default=False)),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('meeting_link', models.URLField(blank=True, null=True)),
+                ('start', models.DateTimeField(blank=True, null=True)),
+                ('end', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='ends_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurrence',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['start', 'ends_at'], name='calendar_event_window'),
+        ),
+        migrations.RunPython(backfill_ends_at, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='calendareventoverride',
+            name='event',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='overrides', to='admin_panel.calendarevent'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='calendareventoverride',
+            unique_together={('event', 'original_start')},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0014_calendar_recurrence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='calendar_token',
+            field=models.CharField(blank=True, editable=False, max_length=43, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0015_student_calendar_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('covered_until', models.DateTimeField()),
+            ],
+        ),
+        # Added without a default first so existing tasks keep NULL instead of
+        # all appearing to be created at migration time.
+        migrations.AddField(
+            model_name='task',
+            name='created_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='created_at',
+            field=models.DateTimeField(blank=True, db_index=True, default=django.utils.timezone.now, null=True),
+        ),
+        migrations.AlterField(
+            model_name='progressreport',
+            name='created_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='DailyProgressRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('college_id', models.BigIntegerField()),
+                ('mode', models.CharField(max_length=10)),
+                ('reports', models.PositiveIntegerField(default=0)),
+                ('students', models.PositiveIntegerField(default=0)),
+                ('interview_prep_sum', models.PositiveIntegerField(default=0)),
+                ('communication_skills_sum', models.PositiveIntegerField(default=0)),
+                ('resume_prep_sum', models.PositiveIntegerField(default=0)),
+                ('technical_prep_sum', models.PositiveIntegerField(default=0)),
+                ('mock_tests_sum', models.PositiveIntegerField(default=0)),
+                ('mock_interviews_sum', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('day', 'college_id', 'mode')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyTaskRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('college_id', models.BigIntegerField()),
+                ('course_id', models.BigIntegerField(blank=True, null=True)),
+                ('mode', models.CharField(max_length=10)),
+                ('tasks_created', models.PositiveIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('active_students', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('day', 'college_id', 'course_id', 'mode')},
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:09
+
+from django.db import migrations, models
+from django.db.models import F, Func, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset):
+    return Coalesce(Subquery(queryset.order_by().values(n=Func(F("pk"), function="COUNT"))), 0)
+
+
+def count_existing_rows(apps, schema_editor):
+    """Replace the hand-typed student counts with real ones (see admin_panel.counters)."""
+    College = apps.get_model("admin_panel", "College")
+    Course = apps.get_model("admin_panel", "Course")
+    Student = apps.get_model("admin_panel", "Student")
+    CourseAssignment = apps.get_model("admin_panel", "CourseAssignment")
+    CourseFolder = apps.get_model("admin_panel", "CourseFolder")
+    CourseMaterial = apps.get_model("admin_panel", "CourseMaterial")
+
+    students = Student.objects.filter(college_id=OuterRef("pk"), deleted_at__isnull=True)
+    College.objects.update(
+        student_count=_count(students),
+        active_student_count=_count(students.filter(status="active")),
+    )
+    Course.objects.update(
+        enrolled_count=_count(CourseAssignment.objects.filter(
+            course_id=OuterRef("pk"), student__deleted_at__isnull=True
+        )),
+        folder_count=_count(CourseFolder.objects.filter(course_id=OuterRef("pk"))),
+        material_count=_count(CourseMaterial.objects.filter(course_id=OuterRef("pk"))),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0016_daily_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='college',
+            name='active_student_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='enrolled_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='folder_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='material_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='college',
+            name='student_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+# The porter stemmer also stems prefix queries ("deploy"* is searched as
+# "deploi"*), so partially typed words missed stemmed documents. Material
+# search matches every term as a prefix, which covers plurals and suffixes.
+FTS_COLUMNS = "title, text, course_id"
+
+
+def _recreate(tokenize):
+    return [
+        "DROP TABLE IF EXISTS admin_panel_material_fts",
+        f"""CREATE VIRTUAL TABLE admin_panel_material_fts USING fts5(
+            {FTS_COLUMNS},
+            content='admin_panel_materialtext', content_rowid='material_id',
+            tokenize='{tokenize}'
+        )""",
+        "INSERT INTO admin_panel_material_fts(admin_panel_material_fts) VALUES ('rebuild')",
+    ]
+
+
+def drop_stemmer(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for sql in _recreate("unicode61 remove_diacritics 2"):
+            schema_editor.execute(sql)
+
+
+def restore_stemmer(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for sql in _recreate("porter unicode61 remove_diacritics 2"):
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0017_maintained_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_stemmer, restore_stemmer),
+    ]
@@ -1,6 +1,18 @@
 from django.db import models
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+from datetime import timedelta
+
+
+# =====================================================
+# 🗑 SOFT DELETE
+# =====================================================
+class ActiveManager(models.Manager):
+    """Default manager that hides soft-deleted rows (``deleted_at`` set)."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 # =====================================================
@@ -14,7 +26,10 @@ class College(models.Model):
     logo_image = models.ImageField(upload_to="college_logos/", blank=True, null=True)
     poster_image = models.ImageField(upload_to="college_posters/", blank=True, null=True)
     description = models.TextField(blank=True)
-    student_count = models.PositiveIntegerField(default=0)
+
+    # Maintained by admin_panel.counters; repaired by manage.py reconcile_counters.
+    student_count = models.PositiveIntegerField(default=0, editable=False)
+    active_student_count = models.PositiveIntegerField(default=0, editable=False)
 
     mode = models.CharField(
         max_length=10,
@@ -28,6 +43,12 @@ class College(models.Model):
         default="active",
     )
 
+    # Set by admin_panel.purge.soft_delete; the row is purged by a background job.
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return self.name
 
@@ -53,6 +74,27 @@ class Student(models.Model):
 
     status = models.CharField(max_length=10, default="active")
 
+    # Denormalized count of unread Notification rows, kept in step with F() updates.
+    unread_notifications = models.PositiveIntegerField(default=0)
+
+    # Secret in the student's iCalendar subscription URL (see admin_panel.ical);
+    # created on first use, replaced when the student resets the link.
+    calendar_token = models.CharField(max_length=43, unique=True, null=True, blank=True, editable=False)
+
+    # Set by admin_panel.purge.soft_delete; the row is purged by a background job.
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # What the college counters counted for this row (see admin_panel.counters).
+        if not instance.get_deferred_fields() & {"college_id", "status", "deleted_at"}:
+            instance._counted = None if instance.deleted_at else (instance.college_id, instance.status == "active")
+        return instance
+
     def __str__(self):
         return self.name
 
@@ -67,6 +109,17 @@ class Course(models.Model):
     description = models.TextField(blank=True)
     thumbnail = models.ImageField(upload_to="course_thumbnails/", blank=True, null=True)
 
+    # Maintained by admin_panel.counters; repaired by manage.py reconcile_counters.
+    enrolled_count = models.PositiveIntegerField(default=0, editable=False)
+    folder_count = models.PositiveIntegerField(default=0, editable=False)
+    material_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Set by admin_panel.purge.soft_delete; the row is purged by a background job.
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return self.name
 
@@ -110,6 +163,7 @@ class CourseFolder(models.Model):
 # 📄 COURSE MATERIAL
 # =====================================================
 from django.db import models
+from django.core.files.storage import default_storage
 from django.core.validators import MinValueValidator, MaxValueValidator
 from urllib.parse import urlparse, parse_qs
 
@@ -198,10 +252,93 @@ class CourseMaterial(models.Model):
         return self.title or self.link or "Material"
 
 
+class MaterialText(models.Model):
+    """Text extracted from a material's uploaded file (see admin_panel.material_text)."""
+
+    STATUS_CHOICES = (
+        ("extracted", "Extracted"),
+        ("empty", "No file"),
+        ("unsupported", "Unsupported type"),
+        ("failed", "Failed"),
+    )
+
+    material = models.OneToOneField(CourseMaterial, on_delete=models.CASCADE, primary_key=True, related_name="extracted")
+    # Copied from the material so the full-text index can filter and rank on its own table.
+    course_id = models.BigIntegerField(db_index=True)
+    title = models.CharField(max_length=255, blank=True)
+    text = models.TextField(blank=True)
+    source = models.CharField(max_length=255, blank=True)  # file name the text came from
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default="extracted")
+    error = models.CharField(max_length=300, blank=True)
+    extracted_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Text of material {self.material_id} ({self.status})"
+
+
+class MaterialPreview(models.Model):
+    """Page images and page count of a material's file (see admin_panel.previews)."""
+
+    STATUS_CHOICES = (
+        ("ready", "Ready"),
+        ("counted", "Page count only"),
+        ("unsupported", "Unsupported type"),
+        ("failed", "Failed"),
+    )
+
+    material = models.OneToOneField(CourseMaterial, on_delete=models.CASCADE, primary_key=True, related_name="preview")
+    source = models.CharField(max_length=255, blank=True)  # file name the preview was made from
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default="ready")
+    page_count = models.PositiveIntegerField(null=True, blank=True)
+    # Storage names of the rendered images: a large first page, then one thumbnail per page.
+    cover = models.CharField(max_length=300, blank=True)
+    pages = models.JSONField(default=list, blank=True)
+    error = models.CharField(max_length=300, blank=True)
+    generated_at = models.DateTimeField(default=timezone.now)
+
+    @property
+    def cover_url(self):
+        return default_storage.url(self.cover) if self.cover else ""
+
+    @property
+    def page_urls(self):
+        return [default_storage.url(name) for name in self.pages]
+
+    def __str__(self):
+        return f"Preview of material {self.material_id} ({self.status})"
+
+
 # =====================================================
 # 📝 TASK
 # =====================================================
 
+class TaskQuerySet(models.QuerySet):
+    OPEN_STATUSES = ("pending", "in_progress")
+
+    def open(self):
+        return self.filter(status__in=self.OPEN_STATUSES)
+
+    def upcoming(self, days=None, today=None):
+        """Open tasks due today or later (within ``days`` if given), soonest first."""
+        today = today or timezone.localdate()
+        tasks = self.open().filter(deadline__gte=today)
+        if days is not None:
+            tasks = tasks.filter(deadline__lte=today + timedelta(days=days))
+        return tasks.order_by("deadline", "id")
+
+    def overdue(self, today=None):
+        """Swept overdue tasks plus open ones whose deadline passed since the last sweep."""
+        today = today or timezone.localdate()
+        return self.filter(
+            models.Q(status="overdue") | models.Q(status__in=self.OPEN_STATUSES, deadline__lt=today)
+        ).order_by("-deadline", "-id")
+
+    def sweep_overdue(self, today=None):
+        """Flip open tasks past their deadline to ``overdue`` in one UPDATE."""
+        today = today or timezone.localdate()
+        return self.open().filter(deadline__lt=today).update(status="overdue")
+
+
 class Task(models.Model):
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
     course = models.ForeignKey(Course, on_delete=models.SET_NULL, null=True, blank=True)
@@ -218,9 +355,31 @@ class Task(models.Model):
 
     status = models.CharField(
         max_length=15,
-        choices=[("pending", "Pending"), ("in_progress", "In Progress"), ("completed", "Completed")],
+        choices=[
+            ("pending", "Pending"),
+            ("in_progress", "In Progress"),
+            ("completed", "Completed"),
+            ("overdue", "Overdue"),
+        ],
         default="pending",
     )
+    # NULL for tasks created before the field existed.
+    created_at = models.DateTimeField(default=timezone.now, null=True, blank=True, db_index=True)
+    completed_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["student", "status", "deadline"], name="task_student_status_deadline"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.status == "completed" and self.completed_at is None:
+            self.completed_at = timezone.now()
+        elif self.status != "completed":
+            self.completed_at = None
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.title} → {self.student.name}"
@@ -252,10 +411,49 @@ class CalendarEvent(models.Model):
     end = models.DateTimeField(null=True, blank=True)
     all_day = models.BooleanField(default=True)
 
+    # RRULE subset (see admin_panel.recurrence), e.g. "FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20261220".
+    # Occurrences are expanded per requested window and never stored.
+    recurrence = models.CharField(max_length=200, blank=True, default="")
+    # End of the last occurrence (an upper bound for UNTIL rules); null when the
+    # event repeats forever. Lets window queries skip finished series.
+    ends_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["start", "ends_at"], name="calendar_event_window"),
+        ]
+
+    def save(self, *args, **kwargs):
+        from .recurrence import series_end
+
+        self.ends_at = series_end(self)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.title
 
 
+class CalendarEventOverride(models.Model):
+    """Cancels or changes one occurrence of a recurring event."""
+
+    event = models.ForeignKey(CalendarEvent, on_delete=models.CASCADE, related_name="overrides")
+    original_start = models.DateTimeField()  # identifies the occurrence
+    cancelled = models.BooleanField(default=False)
+
+    # Blank / null fields keep the series value.
+    title = models.CharField(max_length=200, blank=True)
+    description = models.TextField(blank=True, null=True)
+    meeting_link = models.URLField(blank=True, null=True)
+    start = models.DateTimeField(null=True, blank=True)
+    end = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("event", "original_start")
+
+    def __str__(self):
+        return f"{self.event} @ {self.original_start:%Y-%m-%d %H:%M}"
+
+
 # =====================================================
 # 📊 PROGRESS REPORT
 # =====================================================
@@ -270,10 +468,110 @@ class ProgressReport(models.Model):
     mock_tests = models.IntegerField(default=0, validators=[MinValueValidator(0), MaxValueValidator(100)])
     mock_interviews = models.IntegerField(default=0, validators=[MinValueValidator(0), MaxValueValidator(100)])
 
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["student", "-id"], name="progress_student_latest"),
+        ]
+
     def __str__(self):
         return self.student.roll
 
 
+# =====================================================
+# 🗄 ARCHIVE (cold history, see admin_panel.archive)
+# =====================================================
+# Plain integer references instead of foreign keys: archived rows are never
+# joined on the hot path and survive purges of the rows they point to.
+
+class ArchivedTask(models.Model):
+    original_id = models.BigIntegerField(unique=True)
+    student_id = models.BigIntegerField(db_index=True)
+    course_id = models.BigIntegerField(null=True, blank=True)
+    title = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    deadline = models.DateField()
+    priority = models.CharField(max_length=10)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.title} (archived)"
+
+
+class ArchivedProgressReport(models.Model):
+    original_id = models.BigIntegerField(unique=True)
+    student_id = models.BigIntegerField(db_index=True)
+    interview_prep = models.PositiveSmallIntegerField(default=0)
+    communication_skills = models.PositiveSmallIntegerField(default=0)
+    resume_prep = models.PositiveSmallIntegerField(default=0)
+    technical_prep = models.PositiveSmallIntegerField(default=0)
+    mock_tests = models.PositiveSmallIntegerField(default=0)
+    mock_interviews = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Report {self.original_id} of {self.student_id} (archived)"
+
+
+# =====================================================
+# 📉 DAILY ROLLUPS (trend charts, see admin_panel.rollups)
+# =====================================================
+# Plain integer references, as in the archive: rollups outlive the rows they
+# summarize. Score sums (not averages) are stored so that days and groups can
+# be combined exactly.
+
+class DailyProgressRollup(models.Model):
+    day = models.DateField()
+    college_id = models.BigIntegerField()
+    mode = models.CharField(max_length=10)
+
+    reports = models.PositiveIntegerField(default=0)
+    students = models.PositiveIntegerField(default=0)
+    interview_prep_sum = models.PositiveIntegerField(default=0)
+    communication_skills_sum = models.PositiveIntegerField(default=0)
+    resume_prep_sum = models.PositiveIntegerField(default=0)
+    technical_prep_sum = models.PositiveIntegerField(default=0)
+    mock_tests_sum = models.PositiveIntegerField(default=0)
+    mock_interviews_sum = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("day", "college_id", "mode")
+
+    def __str__(self):
+        return f"Progress {self.day} college {self.college_id} ({self.mode})"
+
+
+class DailyTaskRollup(models.Model):
+    day = models.DateField()
+    college_id = models.BigIntegerField()
+    course_id = models.BigIntegerField(null=True, blank=True)
+    mode = models.CharField(max_length=10)
+
+    tasks_created = models.PositiveIntegerField(default=0)
+    tasks_completed = models.PositiveIntegerField(default=0)
+    # Students with a task created or completed that day.
+    active_students = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("day", "college_id", "course_id", "mode")
+
+    def __str__(self):
+        return f"Tasks {self.day} college {self.college_id} course {self.course_id} ({self.mode})"
+
+
+class RollupWatermark(models.Model):
+    """How far the rollups have read the source tables."""
+
+    name = models.CharField(max_length=50, unique=True)
+    covered_until = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name} until {self.covered_until}"
+
+
 # =====================================================
 # 💼 CAREER OPPORTUNITIES
 # =====================================================
@@ -291,8 +589,28 @@ class CareerOpportunities(models.Model):
     mode = models.CharField(max_length=10, default="offline")
     status = models.CharField(max_length=10, default="active")
 
+    # Feed ingestion: normalized keys used to match re-imported posts, and the
+    # feed a post came from ("" for posts created by hand).
+    source = models.CharField(max_length=50, blank=True, default="")
+    link_key = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    dedupe_key = models.CharField(max_length=40, blank=True, default="", db_index=True)
+    last_seen_at = models.DateTimeField(null=True, blank=True)
+
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["mode", "status", "-updated_at"], name="career_mode_status_updated"),
+            models.Index(fields=["source", "status", "last_seen_at"], name="career_source_seen"),
+        ]
+
+    def save(self, *args, **kwargs):
+        from .career_feed import dedupe_key, normalize_link
+
+        self.link_key = normalize_link(self.link)
+        self.dedupe_key = dedupe_key(self.company_name, self.job_title)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.job_title} - {self.company_name}"
 
@@ -303,3 +621,115 @@ class StudyImage(models.Model):
 
     def __str__(self):
         return self.title
+
+
+# =====================================================
+# 🔔 NOTIFICATIONS
+# =====================================================
+class Notification(models.Model):
+    KIND_CHOICES = (
+        ("task", "Task"),
+        ("event", "Calendar Event"),
+        ("material", "Course Material"),
+        ("general", "General"),
+    )
+
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="notifications")
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default="general")
+    title = models.CharField(max_length=200)
+    body = models.CharField(max_length=300, blank=True)
+    link = models.CharField(max_length=300, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["student", "-created_at", "-id"], name="notification_inbox"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} → {self.student_id}"
+
+
+# =====================================================
+# 🧾 STUDENT DASHBOARD READ MODEL
+# =====================================================
+class StudentDashboard(models.Model):
+    """Denormalized dashboard document, maintained by admin_panel.dashboards."""
+
+    student = models.OneToOneField(Student, on_delete=models.CASCADE, primary_key=True, related_name="dashboard")
+    document = models.JSONField(default=dict)
+    stale = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Dashboard of {self.student_id}"
+
+
+# =====================================================
+# ⚙️ BACKGROUND JOBS
+# =====================================================
+class BackgroundJob(models.Model):
+    STATUS_CHOICES = (
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    )
+
+    task = models.CharField(max_length=200)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+
+    priority = models.IntegerField(default=0)  # higher runs first
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+
+    progress = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    locked_by = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "-priority", "run_after"], name="job_claim_order"),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.task} ({self.status})"
+
+
+# =====================================================
+# 🔎 ADMIN SEARCH INDEX (see admin_panel.search)
+# =====================================================
+class SearchEntry(models.Model):
+    """One searchable row per college, student, course, material or career post."""
+
+    KIND_CHOICES = (
+        ("college", "College"),
+        ("student", "Student"),
+        ("course", "Course"),
+        ("material", "Course Material"),
+        ("career", "Career Opportunity"),
+    )
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=300, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("kind", "object_id")
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
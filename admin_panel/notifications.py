@@ -0,0 +1,107 @@
+"""
+Student notification inbox.
+
+A fan-out writes one ``Notification`` row per recipient with batched
+``bulk_create`` calls and bumps ``Student.unread_notifications`` with a single
+``UPDATE ... SET unread_notifications = unread_notifications + 1`` per batch,
+so the portal can show the unread count without counting rows. The
+recipients' student versions are bumped too, because pages cached or
+revalidated per student show that count in the header.
+"""
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .data_versions import bump, student_key
+from .jobs import background_task, enqueue
+from .models import CourseAssignment, Notification, Student
+
+
+FAN_OUT_BATCH_SIZE = 1000
+
+
+def notify(student_ids, kind, title, body="", link=""):
+    """Create the notification for every id in ``student_ids``. Returns the number sent."""
+    created_at = timezone.now()
+    sent = 0
+    batch = []
+
+    def flush():
+        with transaction.atomic():
+            Notification.objects.bulk_create([
+                Notification(student_id=student_id, kind=kind, title=title[:200],
+                             body=body[:300], link=link, created_at=created_at)
+                for student_id in batch
+            ])
+            Student.objects.filter(id__in=batch).update(unread_notifications=F("unread_notifications") + 1)
+        bump(*(student_key(student_id) for student_id in batch))
+
+    for student_id in student_ids:
+        batch.append(student_id)
+        if len(batch) >= FAN_OUT_BATCH_SIZE:
+            flush()
+            sent += len(batch)
+            batch = []
+    if batch:
+        flush()
+        sent += len(batch)
+    return sent
+
+
+def course_audience(course_id=None, course_code=None):
+    """Ids of active students assigned to a course; every active student when no course is given."""
+    if course_id is None and course_code is None:
+        return _keyset_ids(Student.objects.filter(status="active"), "id")
+
+    assignments = CourseAssignment.objects.filter(student__status="active", student__deleted_at__isnull=True)
+    if course_id is not None:
+        assignments = assignments.filter(course_id=course_id)
+    else:
+        assignments = assignments.filter(course__code=course_code)
+    return _keyset_ids(assignments, "student_id")
+
+
+def _keyset_ids(queryset, field):
+    # Ids are read a page at a time (no open cursor) because the fan-out
+    # writes to the same tables while it iterates.
+    last = 0
+    while True:
+        ids = list(
+            queryset.filter(**{f"{field}__gt": last})
+            .order_by(field).values_list(field, flat=True).distinct()[:FAN_OUT_BATCH_SIZE]
+        )
+        if not ids:
+            return
+        yield from ids
+        last = ids[-1]
+
+
+@background_task
+def fan_out(kind, title, body="", link="", course_id=None, course_code=None):
+    """Background job: notify a course audience (or everyone). Returns the number sent."""
+    return notify(course_audience(course_id, course_code), kind, title, body, link)
+
+
+def notify_course(kind, title, body="", link="", course_id=None, course_code=None):
+    """Queue a fan-out so the admin request does not wait for thousands of inserts."""
+    return enqueue(
+        fan_out, kind, title, body=body, link=link,
+        course_id=course_id, course_code=course_code, priority=1,
+    )
+
+
+def mark_read(student, notification_ids=None):
+    """Mark the student's unread notifications (all, or the given ids) as read."""
+    unread = Notification.objects.filter(student=student, read_at__isnull=True)
+    if notification_ids is not None:
+        unread = unread.filter(id__in=notification_ids)
+    with transaction.atomic():
+        count = unread.update(read_at=timezone.now())
+        if count:
+            Student.objects.filter(id=student.id).update(
+                unread_notifications=Greatest(F("unread_notifications") - count, 0)
+            )
+    if count:
+        bump(student_key(student.id))
+    return count
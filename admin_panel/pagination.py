@@ -0,0 +1,78 @@
+"""
+Keyset ("cursor") pagination.
+
+Pages are fetched with ``WHERE (field, id) < (cursor)`` instead of OFFSET, so
+every page costs the same index range scan no matter how deep it is.
+"""
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class CursorPage:
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def _page_queryset(queryset, cursor, page_size, field):
+    model_field = queryset.model._meta.get_field(field)
+    queryset = queryset.order_by(f"-{field}", "-id")
+
+    if cursor:
+        try:
+            raw_value, last_id = decode_cursor(cursor)
+            value = model_field.to_python(raw_value)
+            last_id = int(last_id)
+        except (ValueError, TypeError, ValidationError):
+            value = None
+        if value is not None:
+            queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": last_id}))
+    return queryset[:page_size + 1]
+
+
+def _page(items, page_size, field):
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        raw_value = getattr(last, field)
+        if hasattr(raw_value, "isoformat"):
+            raw_value = raw_value.isoformat()
+        next_cursor = encode_cursor([raw_value, last.id])
+    return CursorPage(items, next_cursor)
+
+
+def cursor_paginate(queryset, cursor=None, page_size=20, field="updated_at"):
+    """
+    Return one ``CursorPage`` of ``queryset`` ordered newest first by
+    ``(field, id)``. An invalid cursor restarts from the first page.
+    """
+    return _page(list(_page_queryset(queryset, cursor, page_size, field)), page_size, field)
+
+
+async def acursor_paginate(queryset, cursor=None, page_size=20, field="updated_at"):
+    """Async ``cursor_paginate``."""
+    items = [item async for item in _page_queryset(queryset, cursor, page_size, field)]
+    return _page(items, page_size, field)
@@ -0,0 +1,206 @@
+"""
+Preview images for uploaded course documents.
+
+``generate_preview`` (a background task; run it with ``run_jobs --pool
+process``) renders a large first page and a small thumbnail per page, stores
+them next to the uploaded file (``<file name>.preview/``) and records the page
+count on ``MaterialPreview``, so the materials page never has to fetch the
+original document.
+
+PDFs are rendered with the optional ``pypdfium2`` package. docx/pptx files are
+converted to PDF first when LibreOffice is installed (``PREVIEW_SOFFICE``);
+without it only their page count is read from the document metadata.
+"""
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import zipfile
+from xml.etree.ElementTree import fromstring
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from .jobs import background_task, enqueue, report_progress
+from .models import CourseMaterial, MaterialPreview
+from .text_extraction import SLIDE_RE
+
+
+COVER_WIDTH = 960
+THUMBNAIL_WIDTH = 240
+PREVIEW_MAX_PAGES = 30
+PREVIEW_BATCH_SIZE = 20
+CONVERT_TIMEOUT = 120
+
+OFFICE_EXTENSIONS = {".docx", ".pptx", ".doc", ".ppt", ".odt", ".odp"}
+APP_PROPERTIES_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}"
+
+
+def preview_prefix(name):
+    return f"{name}.preview/"
+
+
+# =====================================================
+# 📏 PAGE COUNTS
+# =====================================================
+def _office_page_count(path):
+    """Slide count of a pptx, or the page count Word saved in a docx's metadata."""
+    with zipfile.ZipFile(path) as archive:
+        if path.lower().endswith(".pptx"):
+            return sum(1 for name in archive.namelist() if SLIDE_RE.match(name)) or None
+        try:
+            properties = fromstring(archive.read("docProps/app.xml"))
+        except KeyError:
+            return None
+    pages = properties.find(f"{APP_PROPERTIES_NS}Pages")
+    return int(pages.text) if pages is not None and (pages.text or "").isdigit() else None
+
+
+def _pdf_page_count(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise RuntimeError(
+            "PDF previews need the optional 'pypdfium2' package (pip install pypdfium2); "
+            "'pypdf' alone is enough for page counts."
+        )
+    return len(PdfReader(path).pages)
+
+
+# =====================================================
+# 🖼 RENDERING
+# =====================================================
+def _to_pdf(path, workdir):
+    """Convert an office document with LibreOffice; None when it is not installed."""
+    soffice = shutil.which(getattr(settings, "PREVIEW_SOFFICE", "soffice"))
+    if soffice is None:
+        return None
+    subprocess.run(
+        [soffice, "--headless", "--convert-to", "pdf", "--outdir", workdir, path],
+        check=True, capture_output=True, timeout=CONVERT_TIMEOUT,
+    )
+    pdf = os.path.join(workdir, os.path.splitext(os.path.basename(path))[0] + ".pdf")
+    return pdf if os.path.exists(pdf) else None
+
+
+def _save_image(image, name):
+    buffer = io.BytesIO()
+    image.convert("RGB").save(buffer, "WEBP", quality=70)
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def _render(pdf_path, prefix):
+    """Render ``pdf_path``; returns ``(page_count, cover, pages)`` storage names."""
+    try:
+        import pypdfium2
+    except ImportError:
+        return _pdf_page_count(pdf_path), "", []
+
+    document = pypdfium2.PdfDocument(pdf_path)
+    try:
+        page_count = len(document)
+        cover, pages = "", []
+        for index in range(min(page_count, PREVIEW_MAX_PAGES)):
+            page = document[index]
+            width = page.get_width()
+            if index == 0:
+                image = page.render(scale=COVER_WIDTH / width).to_pil()
+                cover = _save_image(image, f"{prefix}cover.webp")
+            image = page.render(scale=THUMBNAIL_WIDTH / width).to_pil()
+            pages.append(_save_image(image, f"{prefix}page-{index + 1:03d}.webp"))
+            page.close()
+    finally:
+        document.close()
+    return page_count, cover, pages
+
+
+def _local_path(material, workdir):
+    try:
+        return material.file.path
+    except NotImplementedError:
+        # Remote storage: renderers need a real file.
+        path = os.path.join(workdir, os.path.basename(material.file.name))
+        with material.file.open("rb") as source, open(path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        return path
+
+
+def delete_files(names):
+    for name in names:
+        if name and default_storage.exists(name):
+            default_storage.delete(name)
+
+
+# =====================================================
+# ⚙️ PIPELINE
+# =====================================================
+def generate(material):
+    """Create or refresh the ``MaterialPreview`` of one material (None if it has no file)."""
+    preview = MaterialPreview.objects.filter(material_id=material.id).first()
+    source = material.file.name if material.file else ""
+    if preview is None:
+        preview = MaterialPreview(material=material)
+    elif preview.source == source and preview.status != "failed":
+        return preview
+
+    old_files = [preview.cover, *preview.pages]
+    if not source:
+        if not preview._state.adding:
+            preview.delete()
+        return None
+
+    preview.source = source
+    preview.cover, preview.pages, preview.page_count, preview.error = "", [], None, ""
+    extension = os.path.splitext(source)[1].lower()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = _local_path(material, workdir)
+            pdf = path if extension == ".pdf" else None
+            if extension in (".docx", ".pptx"):
+                preview.page_count = _office_page_count(path)
+            if extension in OFFICE_EXTENSIONS:
+                pdf = _to_pdf(path, workdir)
+            if pdf:
+                preview.page_count, preview.cover, preview.pages = _render(pdf, preview_prefix(source))
+    except Exception as exc:  # corrupt upload, conversion timeout, missing optional dependency, ...
+        preview.status = "failed"
+        preview.error = f"{type(exc).__name__}: {exc}"[:300]
+    else:
+        if preview.pages:
+            preview.status = "ready"
+        elif preview.page_count:
+            preview.status = "counted"
+        else:
+            preview.status = "unsupported"
+
+    preview.generated_at = timezone.now()
+    preview.save()
+    delete_files(name for name in old_files if name not in (preview.cover, *preview.pages))
+    return preview
+
+
+@background_task
+def generate_preview(material_ids):
+    """Background job: (re-)generate previews of the given materials."""
+    materials = CourseMaterial.objects.filter(id__in=material_ids)
+    stats = {}
+    for done, material in enumerate(materials, start=1):
+        preview = generate(material)
+        status = preview.status if preview else "no file"
+        stats[status] = stats.get(status, 0) + 1
+        report_progress(done=done, total=len(material_ids))
+    return stats
+
+
+def queue_previews(material_ids, batch_size=PREVIEW_BATCH_SIZE):
+    """Queue preview jobs of ``batch_size`` materials each. Returns the jobs."""
+    material_ids = list(material_ids)
+    return [
+        enqueue(generate_preview, material_ids[start:start + batch_size], priority=-1)
+        for start in range(0, len(material_ids), batch_size)
+    ]
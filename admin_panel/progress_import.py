@@ -0,0 +1,122 @@
+"""
+Bulk entry of progress scores, from the cohort grid or an uploaded CSV.
+
+Both paths produce rows of ``{column: value}``. Roll numbers are resolved to
+students in one query, every score is checked against the bounds of the model
+validators in a single pass, and the reports are inserted with ``bulk_create``.
+A submission with any invalid row is rejected as a whole, so a batch is never
+half recorded.
+"""
+import csv
+import io
+
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import transaction
+
+from .models import ProgressReport, Student
+
+
+SCORE_FIELDS = [
+    "interview_prep", "communication_skills", "resume_prep",
+    "technical_prep", "mock_tests", "mock_interviews",
+]
+ROLL_ALIASES = ("roll", "roll_no", "roll_number")
+MAX_ROWS = 5000
+BATCH_SIZE = 500
+
+
+def _bounds(name):
+    low, high = None, None
+    for validator in ProgressReport._meta.get_field(name).validators:
+        if isinstance(validator, MinValueValidator):
+            low = validator.limit_value
+        elif isinstance(validator, MaxValueValidator):
+            high = validator.limit_value
+    return low, high
+
+
+def _column(name):
+    return (name or "").strip().lower().replace("-", "_").replace(" ", "_")
+
+
+def read_csv(upload):
+    """Rows of an uploaded CSV with normalized column names (``Interview Prep`` -> ``interview_prep``)."""
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        reader.fieldnames = [_column(name) for name in reader.fieldnames or []]
+        missing = [name for name in SCORE_FIELDS if name not in reader.fieldnames]
+        if not any(alias in reader.fieldnames for alias in ROLL_ALIASES):
+            missing.insert(0, "roll")
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}.")
+
+        rows = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) > MAX_ROWS:
+                raise ValueError(f"At most {MAX_ROWS} rows can be uploaded at once.")
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise ValueError(f"Could not read the file as UTF-8 CSV ({exc}).")
+    return rows
+
+
+def build_reports(rows):
+    """
+    ``(reports, errors)`` for ``rows``. Rows whose scores are all blank are
+    skipped (the grid lists the whole cohort); ``errors`` are ``"Row n: ..."``
+    messages, 1-based in submission order.
+    """
+    errors, parsed = [], []
+    for number, row in enumerate(rows, start=1):
+        roll = next((str(row[alias]).strip() for alias in ROLL_ALIASES if row.get(alias)), "")
+        raw = [str(row.get(name) or "").strip() for name in SCORE_FIELDS]
+        if not any(raw):
+            continue
+        if not roll:
+            errors.append(f"Row {number}: roll number is missing.")
+            continue
+        parsed.append((number, roll, raw))
+
+    # One query for every roll number in the submission.
+    student_ids = dict(
+        Student.objects.filter(roll__in={roll for _, roll, _ in parsed}).values_list("roll", "id")
+    )
+
+    bounds = [_bounds(name) for name in SCORE_FIELDS]
+    seen, reports = {}, []
+    for number, roll, raw in parsed:
+        problems = []
+        if roll not in student_ids:
+            problems.append(f"unknown roll number {roll}")
+        elif roll in seen:
+            problems.append(f"{roll} is already on row {seen[roll]}")
+        seen.setdefault(roll, number)
+
+        scores = {}
+        for name, value, (low, high) in zip(SCORE_FIELDS, raw, bounds):
+            label = name.replace("_", " ")
+            try:
+                score = int(value)
+            except ValueError:
+                problems.append(f"{label} must be a whole number" if value else f"{label} is missing")
+                continue
+            if (low is not None and score < low) or (high is not None and score > high):
+                problems.append(f"{label} must be between {low} and {high}")
+            scores[name] = score
+
+        if problems:
+            errors.append(f"Row {number}: {'; '.join(problems)}.")
+        else:
+            reports.append(ProgressReport(student_id=student_ids[roll], **scores))
+    return reports, errors
+
+
+def import_reports(rows):
+    """Validate and insert ``rows``; returns ``(created, errors)`` and inserts nothing on errors."""
+    reports, errors = build_reports(rows)
+    if errors:
+        return 0, errors
+    with transaction.atomic():
+        ProgressReport.objects.bulk_create(reports, batch_size=BATCH_SIZE)
+    return len(reports), []
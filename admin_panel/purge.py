@@ -0,0 +1,104 @@
+"""
+Two-phase deletion for colleges, courses and students.
+
+``soft_delete`` hides the row (and, for a college, its students) with a few
+set-based UPDATEs and queues ``purge``. The job then deletes dependent rows in
+small batches, each in its own short transaction, so a large cascade never
+holds the database lock for long, and reports its progress on the job row.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .data_versions import bump, student_key
+from .jobs import background_task, enqueue, report_progress
+from .models import (
+    College, Course, CourseAssignment, CourseFolder, CourseMaterial,
+    Notification, ProgressReport, Student, StudentDashboard, Task
+)
+from . import counters, dashboards, search
+
+
+PURGE_BATCH_SIZE = 500
+
+PURGEABLE = {
+    "college": College,
+    "course": Course,
+    "student": Student,
+}
+
+
+def soft_delete(obj):
+    """Hide ``obj`` immediately and queue its purge. Returns the ``BackgroundJob``."""
+    now = timezone.now()
+    model = type(obj)
+    counters.soft_deleted(obj)
+    model.all_objects.filter(pk=obj.pk).update(deleted_at=now)
+
+    if model is College:
+        Student.objects.filter(college_id=obj.pk).update(deleted_at=now)
+        StudentDashboard.objects.filter(student__college_id=obj.pk).delete()
+        search.unindex("college", [obj.pk])
+        search.unindex("student", Student.all_objects.filter(college_id=obj.pk).values("id"))
+        bump("colleges")
+    elif model is Course:
+        dashboards.mark_stale(student__courseassignment__course_id=obj.pk)
+        search.unindex("course", [obj.pk])
+        search.unindex("material", CourseMaterial.objects.filter(course_id=obj.pk).values("id"))
+        bump("courses")
+    else:
+        StudentDashboard.objects.filter(student_id=obj.pk).delete()
+        search.unindex("student", [obj.pk])
+        bump(student_key(obj.pk))
+
+    return enqueue(purge, model._meta.model_name, obj.pk, priority=-1)
+
+
+def _plan(kind, pk):
+    """Ordered (label, queryset) stages; children go before their parents."""
+    if kind == "course":
+        return [
+            ("materials", CourseMaterial.objects.filter(course_id=pk)),
+            ("folders", CourseFolder.objects.filter(course_id=pk)),
+            ("course assignments", CourseAssignment.objects.filter(course_id=pk)),
+        ]
+
+    if kind == "college":
+        students = Student.all_objects.filter(college_id=pk)
+    else:
+        students = Student.all_objects.filter(pk=pk)
+    stages = [
+        ("tasks", Task.objects.filter(student__in=students)),
+        ("progress reports", ProgressReport.objects.filter(student__in=students)),
+        ("course assignments", CourseAssignment.objects.filter(student__in=students)),
+        ("notifications", Notification.objects.filter(student__in=students)),
+    ]
+    if kind == "college":
+        stages.append(("students", students))
+    return stages
+
+
+@background_task
+def purge(kind, pk, batch_size=PURGE_BATCH_SIZE):
+    """Background job: delete a soft-deleted row and everything under it in batches."""
+    model = PURGEABLE[kind]
+    if not model.all_objects.filter(pk=pk, deleted_at__isnull=False).exists():
+        return {"purged": 0, "skipped": "not soft-deleted"}
+
+    stages = _plan(kind, pk)
+    total = sum(queryset.count() for _, queryset in stages) + 1
+    done = 0
+    for label, queryset in stages:
+        while True:
+            ids = list(queryset.order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            with transaction.atomic():
+                queryset.model._base_manager.filter(pk__in=ids).delete()
+            done += len(ids)
+            report_progress(stage=label, done=done, total=total)
+
+    with transaction.atomic():
+        model.all_objects.filter(pk=pk).delete()
+    done += 1
+    report_progress(stage="done", done=done, total=total)
+    return {"purged": done}
@@ -0,0 +1,352 @@
+"""
+Recurring calendar events.
+
+``CalendarEvent.recurrence`` holds a subset of RFC 5545 RRULE: FREQ (DAILY,
+WEEKLY, MONTHLY, YEARLY), INTERVAL, BYDAY (weekly rules only), COUNT and
+UNTIL. A semester of classes stays one row: occurrences are computed only for
+the window a calendar asks for, in local time so a class keeps its wall-clock
+time, and ``CalendarEventOverride`` rows cancel or change single occurrences.
+"""
+import calendar
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import CalendarEventOverride
+
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MAX_COUNT = 1000
+
+# Overrides are looked up by their original or new start within this margin of
+# the window, so an occurrence moved by up to a month still shows up.
+OVERRIDE_MARGIN = timedelta(days=31)
+
+
+# =====================================================
+# 📜 RULES
+# =====================================================
+def _parse_until(value):
+    if "T" in value:
+        moment = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+        if value.endswith("Z"):
+            return moment.replace(tzinfo=dt_timezone.utc)
+        return timezone.make_aware(moment)
+    # A date-only UNTIL includes that whole day.
+    day = datetime.strptime(value, "%Y%m%d").date()
+    return timezone.make_aware(datetime.combine(day, time.max))
+
+
+def parse_rule(text):
+    """Parse an RRULE string into a dict. Raises ValueError for anything unsupported."""
+    rule = {"freq": None, "interval": 1, "byday": None, "count": None, "until": None}
+    for part in text.strip().removeprefix("RRULE:").split(";"):
+        if not part:
+            continue
+        key, _, value = part.partition("=")
+        key, value = key.strip().upper(), value.strip().upper()
+        if key == "FREQ":
+            if value not in FREQUENCIES:
+                raise ValueError(f"Unsupported frequency: {value}")
+            rule["freq"] = value
+        elif key == "INTERVAL":
+            rule["interval"] = int(value)
+            if rule["interval"] < 1:
+                raise ValueError("INTERVAL must be at least 1.")
+        elif key == "BYDAY":
+            try:
+                rule["byday"] = sorted({WEEKDAYS.index(day) for day in value.split(",")})
+            except ValueError:
+                raise ValueError(f"Unsupported BYDAY value: {value}")
+        elif key == "COUNT":
+            rule["count"] = int(value)
+            if not 1 <= rule["count"] <= MAX_COUNT:
+                raise ValueError(f"COUNT must be between 1 and {MAX_COUNT}.")
+        elif key == "UNTIL":
+            rule["until"] = _parse_until(value)
+        elif key == "WKST" and value == "MO":
+            continue
+        else:
+            raise ValueError(f"Unsupported RRULE part: {key}")
+
+    if rule["freq"] is None:
+        raise ValueError("RRULE needs a FREQ.")
+    if rule["byday"] is not None and rule["freq"] != "WEEKLY":
+        raise ValueError("BYDAY is only supported for weekly rules.")
+    if rule["count"] and rule["until"]:
+        raise ValueError("COUNT and UNTIL cannot be combined.")
+    return rule
+
+
+def build_rule(freq, interval=1, byday=None, count=None, until=None):
+    """RRULE string for the admin form; ``until`` is a date."""
+    parts = [f"FREQ={freq}"]
+    if interval and int(interval) > 1:
+        parts.append(f"INTERVAL={int(interval)}")
+    if byday:
+        parts.append("BYDAY=" + ",".join(byday))
+    if count:
+        parts.append(f"COUNT={int(count)}")
+    elif until:
+        parts.append(f"UNTIL={until:%Y%m%d}")
+    rule = ";".join(parts)
+    parse_rule(rule)
+    return rule
+
+
+# =====================================================
+# 🔁 EXPANSION
+# =====================================================
+def _add_months(day, months):
+    """``day`` moved by ``months``, or None when that month has no such day."""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    if day.day > calendar.monthrange(year, month)[1]:
+        return None
+    return date(year, month, day.day)
+
+
+def _dates(rule, first, skip_to):
+    """
+    Occurrence dates of ``rule`` from ``first`` on, in order. Whole periods
+    before ``skip_to`` are jumped over instead of enumerated.
+    """
+    interval = rule["interval"]
+
+    if rule["freq"] == "DAILY":
+        step = 0
+        if skip_to > first:
+            step = (skip_to - first).days // interval
+        while True:
+            yield first + timedelta(days=step * interval)
+            step += 1
+
+    elif rule["freq"] == "WEEKLY":
+        weekdays = rule["byday"] or [first.weekday()]
+        monday = first - timedelta(days=first.weekday())
+        week = 0
+        if skip_to > first:
+            # Every week has the same occurrences, so a COUNT index can still be derived.
+            week = (skip_to - monday).days // (7 * interval)
+        while True:
+            start_of_week = monday + timedelta(days=week * 7 * interval)
+            for weekday in weekdays:
+                day = start_of_week + timedelta(days=weekday)
+                if day >= first:
+                    yield day
+            week += 1
+
+    else:
+        months_per_step = interval * (12 if rule["freq"] == "YEARLY" else 1)
+        step = 0
+        if skip_to > first:
+            months = (skip_to.year - first.year) * 12 + skip_to.month - first.month
+            step = max(0, months // months_per_step - 1)
+        while True:
+            day = _add_months(first, step * months_per_step)
+            if day is not None:
+                yield day
+            step += 1
+
+
+def _weekly_index(rule, first, day):
+    """Zero-based position of weekly occurrence ``day`` in the series."""
+    weekdays = rule["byday"] or [first.weekday()]
+    monday = first - timedelta(days=first.weekday())
+    week = (day - monday).days // (7 * rule["interval"])
+    skipped = sum(1 for weekday in weekdays if weekday < first.weekday())
+    return week * len(weekdays) + weekdays.index(day.weekday()) - skipped
+
+
+def occurrence_starts(event, rule, skip_to=None):
+    """Aware start of every occurrence of ``event`` (from about ``skip_to`` on) in order."""
+    local_start = timezone.localtime(event.start)
+    first, wall_clock = local_start.date(), local_start.time().replace(tzinfo=None)
+    skip_date = timezone.localtime(skip_to).date() if skip_to else first
+    if rule["count"] is not None and rule["freq"] in ("MONTHLY", "YEARLY"):
+        skip_date = first  # months without the day are not counted; enumerate from the start
+
+    days = _dates(rule, first, skip_date)
+    index = None
+    for day in days:
+        if rule["count"] is not None:
+            if index is None:
+                if rule["freq"] == "WEEKLY":
+                    index = _weekly_index(rule, first, day)
+                elif rule["freq"] == "DAILY":
+                    index = (day - first).days // rule["interval"]
+                else:
+                    index = 0
+            if index >= rule["count"]:
+                return
+            index += 1
+        start = timezone.make_aware(datetime.combine(day, wall_clock))
+        if rule["until"] and start > rule["until"]:
+            return
+        yield start
+
+
+def _overlaps(start, end, window_start, window_end):
+    if start >= window_end:
+        return False
+    if end and end > start:
+        return end > window_start
+    return start >= window_start
+
+
+def occurrences(event, window_start, window_end):
+    """``(start, end)`` of each occurrence of ``event`` overlapping ``[window_start, window_end)``."""
+    duration = event.end - event.start if event.end else None
+    if not event.recurrence:
+        if _overlaps(event.start, event.end, window_start, window_end):
+            yield event.start, event.end
+        return
+
+    rule = parse_rule(event.recurrence)
+    for start in occurrence_starts(event, rule, skip_to=window_start - (duration or timedelta(0))):
+        if start >= window_end:
+            return
+        end = start + duration if duration is not None else None
+        if _overlaps(start, end, window_start, window_end):
+            yield start, end
+
+
+def series_end(event):
+    """Value for ``CalendarEvent.ends_at``: end of the last occurrence, None if endless."""
+    duration = event.end - event.start if event.end else timedelta(0)
+    if not event.recurrence:
+        return event.end or event.start
+    rule = parse_rule(event.recurrence)
+    if rule["until"]:
+        return rule["until"] + duration
+    if rule["count"]:
+        last = None
+        for last in occurrence_starts(event, rule):
+            pass
+        return last + duration if last else event.start
+    return None
+
+
+# =====================================================
+# 📅 WINDOW QUERIES
+# =====================================================
+def _payload(event, start, end, override=None, occurrence=None):
+    title = event.title
+    description = event.description
+    meeting_link = event.meeting_link
+    if override is not None:
+        title = override.title or title
+        description = override.description if override.description is not None else description
+        meeting_link = override.meeting_link if override.meeting_link is not None else meeting_link
+
+    payload = {
+        "eventId": event.id,
+        "title": title,
+        "course": event.course or "",
+        "description": description or "",
+        "meetingLink": meeting_link or "",
+        "start": start.isoformat(),
+        "end": end.isoformat() if end else None,
+    }
+    if event.all_day:
+        payload["allDay"] = "true"
+    if occurrence is not None:
+        payload["groupId"] = str(event.id)
+        payload["recurring"] = True
+        payload["occurrence"] = occurrence.isoformat()
+    return payload
+
+
+def _window_events(queryset, window_start, window_end):
+    return (
+        queryset.filter(start__lt=window_end)
+        .filter(Q(ends_at__gte=window_start) | Q(ends_at__isnull=True))
+        .order_by("start")
+    )
+
+
+def _window_overrides(events, window_start, window_end):
+    low, high = window_start - OVERRIDE_MARGIN, window_end + OVERRIDE_MARGIN
+    return CalendarEventOverride.objects.filter(
+        event_id__in=[event.id for event in events if event.recurrence]
+    ).filter(Q(original_start__gte=low, original_start__lt=high) | Q(start__gte=low, start__lt=high))
+
+
+def events_between(queryset, window_start, window_end):
+    """
+    Occurrences of the events in ``queryset`` overlapping the window, with
+    overrides applied, as calendar payload dicts sorted by start. Two queries.
+    """
+    events = list(_window_events(queryset, window_start, window_end))
+    overrides = []
+    if any(event.recurrence for event in events):
+        overrides = list(_window_overrides(events, window_start, window_end))
+    return _expand(events, overrides, window_start, window_end)
+
+
+async def aevents_between(queryset, window_start, window_end):
+    """Async ``events_between``."""
+    events = [event async for event in _window_events(queryset, window_start, window_end)]
+    overrides = []
+    if any(event.recurrence for event in events):
+        overrides = [override async for override in _window_overrides(events, window_start, window_end)]
+    return _expand(events, overrides, window_start, window_end)
+
+
+def _expand(events, override_list, window_start, window_end):
+    recurring = {event.id: event for event in events if event.recurrence}
+    overrides = {(override.event_id, override.original_start): override for override in override_list}
+
+    payloads = []
+    for event in events:
+        if not event.recurrence:
+            payloads.extend(_payload(event, start, end) for start, end in occurrences(event, window_start, window_end))
+            continue
+        for start, end in occurrences(event, window_start, window_end):
+            if (event.id, start) not in overrides:
+                payloads.append(_payload(event, start, end, occurrence=start))
+
+    # Overridden occurrences, wherever they were moved to.
+    for (event_id, original_start), override in overrides.items():
+        if override.cancelled:
+            continue
+        event = recurring[event_id]
+        if not any(start == original_start for start, _ in occurrences(event, original_start, original_start + timedelta(seconds=1))):
+            continue  # no longer an occurrence of the (edited) rule
+        start = override.start or original_start
+        if override.end:
+            end = override.end
+        elif event.end:
+            end = start + (event.end - event.start)
+        else:
+            end = None
+        if _overlaps(start, end, window_start, window_end):
+            payloads.append(_payload(event, start, end, override, occurrence=original_start))
+
+    payloads.sort(key=lambda payload: payload["start"])
+    return payloads
+
+
+def parse_window(start_raw, end_raw, default_days=42, max_days=370):
+    """
+    ``[start, end)`` of a calendar feed request (ISO dates or datetimes, as sent
+    by FullCalendar). Missing bounds default to a six-week view around today;
+    the window is capped at ``max_days``. Raises ValueError for bad input.
+    """
+    def moment(raw):
+        value = parse_datetime(raw)
+        if value is None:
+            day = parse_date(raw)
+            if day is None:
+                raise ValueError(f"Invalid date: {raw}")
+            value = datetime.combine(day, time.min)
+        return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+    start = moment(start_raw) if start_raw else timezone.now() - timedelta(days=7)
+    end = moment(end_raw) if end_raw else start + timedelta(days=default_days)
+    if end <= start:
+        raise ValueError("The window must end after it starts.")
+    return start, min(end, start + timedelta(days=max_days))
@@ -0,0 +1,169 @@
+"""
+Daily rollups of progress reports and tasks for the admin trend charts.
+
+``DailyProgressRollup`` holds, per day, college and mode, the number of
+reports and students and the sum of each skill score; ``DailyTaskRollup``
+holds, per day, college, course and mode, the tasks created and completed and
+the students active on tasks. Charts read only these tables (see ``trends``).
+
+``update_rollups`` is run on a schedule (``manage.py update_rollups``). It
+reads only rows created or completed since the previous run and recomputes
+just the days they fall on, so a run costs a few indexed queries per day
+touched. Days are local dates (``TIME_ZONE``).
+"""
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .data_versions import bump
+from .models import (
+    DailyProgressRollup, DailyTaskRollup, ProgressReport, RollupWatermark, Task,
+)
+from .progress_import import SCORE_FIELDS
+
+
+WATERMARK = "daily_rollups"
+# Rows committed shortly after a run started may carry an earlier timestamp;
+# re-reading a short overlap is harmless because days are recomputed whole.
+OVERLAP = timedelta(minutes=10)
+MAX_TREND_DAYS = 366
+
+
+# =====================================================
+# 🧮 COMPUTING
+# =====================================================
+def _day_bounds(day):
+    return (
+        timezone.make_aware(datetime.combine(day, time.min)),
+        timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min)),
+    )
+
+
+def touched_days(since=None):
+    """Local dates with reports or tasks created, or tasks completed, at or after ``since`` (all when None)."""
+    sources = (
+        (ProgressReport.objects.all(), "created_at"),
+        (Task.objects.all(), "created_at"),
+        (Task.objects.all(), "completed_at"),
+    )
+    days = set()
+    for queryset, field in sources:
+        if since is None:
+            queryset = queryset.filter(**{f"{field}__isnull": False})
+        else:
+            queryset = queryset.filter(**{f"{field}__gte": since})
+        days.update(queryset.dates(field, "day"))
+    return sorted(days)
+
+
+def rollup_day(day):
+    """Replace the rollup rows of ``day`` with fresh aggregates."""
+    start, end = _day_bounds(day)
+
+    reports = (
+        ProgressReport.objects.filter(created_at__gte=start, created_at__lt=end)
+        .values(college_id=F("student__college_id"), mode=F("student__mode"))
+        .annotate(
+            reports=Count("id"),
+            students=Count("student_id", distinct=True),
+            **{f"{name}_sum": Sum(name) for name in SCORE_FIELDS},
+        )
+        .order_by()
+    )
+
+    created = Q(created_at__gte=start, created_at__lt=end)
+    completed = Q(completed_at__gte=start, completed_at__lt=end)
+    tasks = (
+        Task.objects.filter(created | completed)
+        .values("course_id", college_id=F("student__college_id"), mode=F("student__mode"))
+        .annotate(
+            tasks_created=Count("id", filter=created),
+            tasks_completed=Count("id", filter=completed),
+            active_students=Count("student_id", distinct=True),
+        )
+        .order_by()
+    )
+
+    progress_rows = [DailyProgressRollup(day=day, **row) for row in reports]
+    task_rows = [DailyTaskRollup(day=day, **row) for row in tasks]
+    with transaction.atomic():
+        DailyProgressRollup.objects.filter(day=day).delete()
+        DailyTaskRollup.objects.filter(day=day).delete()
+        DailyProgressRollup.objects.bulk_create(progress_rows)
+        DailyTaskRollup.objects.bulk_create(task_rows)
+    return len(progress_rows) + len(task_rows)
+
+
+def update_rollups(full=False, now=None):
+    """
+    Bring the rollups up to date. ``full`` recomputes every day that still has
+    source rows (archived tasks and reports are not counted again).
+    """
+    now = now or timezone.now()
+    mark = RollupWatermark.objects.filter(name=WATERMARK).first()
+    since = None if full or mark is None else mark.covered_until - OVERLAP
+
+    days = touched_days(since)
+    rows = sum(rollup_day(day) for day in days)
+    RollupWatermark.objects.update_or_create(name=WATERMARK, defaults={"covered_until": now})
+
+    # A new local day moves the chart window even when nothing changed.
+    if days or mark is None or timezone.localdate(mark.covered_until) != timezone.localdate(now):
+        bump("rollups")
+    return {"days": len(days), "rows": rows, "since": since.isoformat() if since else None}
+
+
+# =====================================================
+# 📈 READING
+# =====================================================
+def trends(days=30, college_id=None, course_id=None, mode=None, today=None):
+    """
+    Daily series for the ``days`` days up to ``today``, read from the rollups.
+    Progress has no course, so ``course_id`` filters only the task series.
+    """
+    today = today or timezone.localdate()
+    first = today - timedelta(days=days - 1)
+
+    progress = DailyProgressRollup.objects.filter(day__gte=first, day__lte=today)
+    tasks = DailyTaskRollup.objects.filter(day__gte=first, day__lte=today)
+    if college_id:
+        progress = progress.filter(college_id=college_id)
+        tasks = tasks.filter(college_id=college_id)
+    if mode:
+        progress = progress.filter(mode=mode)
+        tasks = tasks.filter(mode=mode)
+    if course_id:
+        tasks = tasks.filter(course_id=course_id)
+
+    progress = {
+        row["day"]: row
+        for row in progress.values("day").annotate(
+            reports=Sum("reports"), **{name: Sum(f"{name}_sum") for name in SCORE_FIELDS}
+        ).order_by()
+    }
+    tasks = {
+        row["day"]: row
+        for row in tasks.values("day").annotate(
+            created=Sum("tasks_created"), completed=Sum("tasks_completed"), active=Sum("active_students"),
+        ).order_by()
+    }
+
+    labels = [first + timedelta(days=offset) for offset in range(days)]
+    empty = {}
+    return {
+        "days": [day.isoformat() for day in labels],
+        "reports": [progress.get(day, empty).get("reports", 0) for day in labels],
+        "average_scores": {
+            name: [
+                round(progress[day][name] / progress[day]["reports"], 1) if day in progress else None
+                for day in labels
+            ]
+            for name in SCORE_FIELDS
+        },
+        "tasks_created": [tasks.get(day, empty).get("created", 0) for day in labels],
+        "tasks_completed": [tasks.get(day, empty).get("completed", 0) for day in labels],
+        # Summed over courses: a student active in two courses counts twice.
+        "active_students": [tasks.get(day, empty).get("active", 0) for day in labels],
+    }
@@ -0,0 +1,462 @@
+"""
+Full-text search helpers.
+
+SQLite uses FTS5 external-content tables kept in sync by triggers, PostgreSQL
+uses a GIN-indexed ``to_tsvector`` expression. Other backends fall back to
+``icontains`` filters so the views keep working everywhere.
+
+The admin search index (``SearchEntry``) holds one row per college, student,
+course, course material and career post. Model signals keep it current;
+``manage.py rebuild_search_index`` rebuilds it after bulk loads.
+
+``search_materials`` searches the text extracted from uploaded course
+documents (``MaterialText``), limited to a student's assigned courses.
+"""
+import difflib
+import re
+from urllib.parse import urlencode
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import escape
+
+from .models import (
+    CareerOpportunities, College, Course, CourseAssignment, CourseMaterial,
+    MaterialText, SearchEntry, Student
+)
+
+
+CAREER_FTS_TABLE = "admin_panel_career_fts"
+CAREER_SEARCH_FIELDS = ("job_title", "company_name", "location", "job_description")
+CAREER_TSVECTOR = (
+    "to_tsvector('english', coalesce(job_title, '') || ' ' || coalesce(company_name, '') "
+    "|| ' ' || coalesce(location, '') || ' ' || coalesce(job_description, ''))"
+)
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(query):
+    return TERM_RE.findall(query or "")[:10]
+
+
+def fts5_query(terms):
+    """Prefix-match every term (AND), quoted so user input is never FTS syntax."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_careers(queryset, query):
+    """Filter a CareerOpportunities queryset to rows matching ``query``."""
+    terms = search_terms(query)
+    if not terms:
+        return queryset
+
+    if connection.vendor == "sqlite":
+        matches = RawSQL(
+            f"SELECT rowid FROM {CAREER_FTS_TABLE} WHERE {CAREER_FTS_TABLE} MATCH %s",
+            [fts5_query(terms)],
+        )
+        return queryset.filter(id__in=matches)
+
+    if connection.vendor == "postgresql":
+        matches = RawSQL(
+            f"SELECT id FROM admin_panel_careeropportunities "
+            f"WHERE {CAREER_TSVECTOR} @@ to_tsquery('english', %s)",
+            [" & ".join(f"{term}:*" for term in terms)],
+        )
+        return queryset.filter(id__in=matches)
+
+    for term in terms:
+        condition = Q()
+        for field in CAREER_SEARCH_FIELDS:
+            condition |= Q(**{f"{field}__icontains": term})
+        queryset = queryset.filter(condition)
+    return queryset
+
+
+# =====================================================
+# 🔎 ADMIN SEARCH INDEX
+# =====================================================
+SEARCH_FTS_TABLE = "admin_panel_search_fts"
+SEARCH_VOCAB_TABLE = "admin_panel_search_vocab"
+SEARCH_TSVECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(subtitle, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(body, '')), 'D')"
+)
+SEARCH_RESULT_LIMIT = 20
+INDEX_BATCH_SIZE = 1000
+
+# Most recent matches ranked per query on SQLite; narrower queries are ranked exactly.
+RANK_WINDOW = 2000
+
+# Typo tolerance: a query term with no indexed prefix is replaced by up to
+# MAX_CORRECTIONS vocabulary terms that share its first letter and are close
+# enough by difflib's ratio.
+MAX_CORRECTIONS = 3
+CORRECTION_CUTOFF = 0.75
+
+
+def _query_url(name, value):
+    return f"{reverse(name)}?{urlencode({'q': value})}"
+
+
+def _college_entry(college):
+    return {
+        "title": college.name,
+        "subtitle": college.email,
+        "body": f"{college.address} {college.description}",
+        "url": _query_url("manage_colleges", college.name),
+    }
+
+
+def _student_entry(student):
+    return {
+        "title": student.name,
+        "subtitle": f"{student.roll} · {student.email}",
+        "body": student.phone,
+        "url": _query_url("manage_students", student.roll),
+    }
+
+
+def _course_entry(course):
+    return {
+        "title": course.name,
+        "subtitle": course.code,
+        "body": course.description,
+        "url": reverse("manage_course", args=[course.code]),
+    }
+
+
+def _material_entry(material):
+    return {
+        "title": str(material),
+        "subtitle": material.course.name,
+        "body": material.get_type_display(),
+        "url": reverse("manage_course", args=[material.course.code]),
+    }
+
+
+def _career_entry(job):
+    return {
+        "title": job.job_title,
+        "subtitle": job.company_name,
+        "body": f"{job.location} {job.job_description}",
+        "url": _query_url("career_opportunities", job.job_title),
+    }
+
+
+# kind -> (model, entry builder, fields searched when there is no full-text backend)
+INDEXED = {
+    "college": (College, _college_entry, ("name", "email", "address")),
+    "student": (Student, _student_entry, ("name", "email", "roll")),
+    "course": (Course, _course_entry, ("name", "code")),
+    "material": (CourseMaterial, _material_entry, ("title",)),
+    "career": (CareerOpportunities, _career_entry, ("job_title", "company_name")),
+}
+KIND_OF = {model: kind for kind, (model, _, _) in INDEXED.items()}
+
+
+def indexable(kind):
+    """Rows of ``kind`` that belong in the index."""
+    if kind == "material":
+        return CourseMaterial.objects.filter(course__deleted_at__isnull=True).select_related("course")
+    return INDEXED[kind][0].objects.all()
+
+
+def index_objects(kind, objs):
+    """Insert or refresh the entries of ``objs`` (instances of one kind)."""
+    build = INDEXED[kind][1]
+    entries = []
+    for obj in objs:
+        entry = build(obj)
+        entries.append(SearchEntry(
+            kind=kind, object_id=obj.pk, title=entry["title"][:255],
+            subtitle=entry["subtitle"][:255], body=entry["body"], url=entry["url"][:300],
+        ))
+    if entries:
+        SearchEntry.objects.bulk_create(
+            entries, update_conflicts=True, unique_fields=["kind", "object_id"],
+            update_fields=["title", "subtitle", "body", "url", "updated_at"],
+        )
+    return len(entries)
+
+
+def index_instance(obj):
+    """Index one saved model instance, or drop it when it is soft-deleted."""
+    kind = KIND_OF[type(obj)]
+    if getattr(obj, "deleted_at", None):
+        unindex(kind, [obj.pk])
+    else:
+        index_objects(kind, [obj])
+
+
+def unindex(kind, object_ids):
+    """Drop entries; ``object_ids`` may be a list or a ``values("id")`` subquery."""
+    return SearchEntry.objects.filter(kind=kind, object_id__in=object_ids).delete()[0]
+
+
+def index_queryset(kind, queryset, batch_size=INDEX_BATCH_SIZE):
+    """Index every row of ``queryset`` in keyset-paged batches. Returns the number indexed."""
+    indexed = 0
+    last = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last).order_by("pk")[:batch_size])
+        if not batch:
+            return indexed
+        indexed += index_objects(kind, batch)
+        last = batch[-1].pk
+
+
+def rebuild_index(kinds=None, batch_size=INDEX_BATCH_SIZE, progress=None):
+    """
+    Re-index ``kinds`` (default: all) in place and prune entries whose object
+    is gone. Search keeps working while it runs. Returns counts per kind.
+    """
+    stats = {}
+    for kind in kinds or INDEXED:
+        started = timezone.now()
+        indexed = index_queryset(kind, indexable(kind), batch_size)
+        pruned = SearchEntry.objects.filter(kind=kind, updated_at__lt=started).delete()[0]
+        stats[kind] = {"indexed": indexed, "pruned": pruned}
+        if progress:
+            progress(kind, stats[kind])
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}) VALUES ('optimize')")
+    return stats
+
+
+# =====================================================
+# 🔍 QUERYING THE INDEX
+# =====================================================
+def _prefix_upper_bound(prefix):
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _close_terms(cursor, term):
+    """Indexed terms that look like a misspelling of ``term``."""
+    cursor.execute(
+        f"SELECT DISTINCT term FROM {SEARCH_VOCAB_TABLE} WHERE term >= %s AND term < %s "
+        f"AND col != 'kind' AND length(term) BETWEEN %s AND %s",
+        [term[0], _prefix_upper_bound(term[0]), len(term) - 2, len(term) + 2],
+    )
+    candidates = [row[0] for row in cursor.fetchall()]
+    return difflib.get_close_matches(term, candidates, n=MAX_CORRECTIONS, cutoff=CORRECTION_CUTOFF)
+
+
+def _fts5_match(terms, kinds=None):
+    """
+    Build the FTS5 expression for ``terms``: a prefix match for terms that occur
+    in the index, an OR of close spellings for terms that do not, optionally
+    limited to ``kinds``. Returns ``(expression, corrections)``; the expression
+    is None when some term has no plausible match at all.
+    """
+    parts, corrections = [], {}
+    with connection.cursor() as cursor:
+        for term in terms:
+            cursor.execute(
+                f"SELECT 1 FROM {SEARCH_VOCAB_TABLE} WHERE term >= %s AND term < %s AND col != 'kind' LIMIT 1",
+                [term, _prefix_upper_bound(term)],
+            )
+            if cursor.fetchone():
+                parts.append(f'"{term}"*')
+                continue
+            close = _close_terms(cursor, term)
+            if not close:
+                return None, corrections
+            corrections[term] = close
+            parts.append("(" + " OR ".join(f'"{word}"' for word in close) + ")")
+
+    expression = "{title subtitle body} : (" + " AND ".join(parts) + ")"
+    if kinds:
+        expression += " AND kind : (" + " OR ".join(f'"{kind}"' for kind in kinds) + ")"
+    return expression, corrections
+
+
+def _kind_filter(kinds, column):
+    if not kinds:
+        return "", []
+    return f" AND {column} IN ({', '.join(['%s'] * len(kinds))})", list(kinds)
+
+
+def search_index(query, kinds=None, limit=SEARCH_RESULT_LIMIT):
+    """
+    Ranked admin search. Returns ``(results, corrections)`` where results are
+    dicts (kind, id, title, subtitle, url), best first, and corrections maps
+    misspelt query terms to the indexed terms searched instead.
+    """
+    terms = [term.lower() for term in search_terms(query)]
+    if not terms:
+        return [], {}
+    columns = ("kind", "id", "title", "subtitle", "url")
+
+    if connection.vendor == "sqlite":
+        expression, corrections = _fts5_match(terms, kinds)
+        if expression is None:
+            return [], corrections
+        # bm25 is computed for the newest RANK_WINDOW matches only, so a broad
+        # query ("a") stays cheap at any index size.
+        sql = (
+            f"SELECT e.kind, e.object_id, e.title, e.subtitle, e.url FROM ("
+            f"SELECT rowid, bm25({SEARCH_FTS_TABLE}, 10.0, 4.0, 1.0, 0.0) AS score "
+            f"FROM {SEARCH_FTS_TABLE} WHERE {SEARCH_FTS_TABLE} MATCH %s "
+            f"ORDER BY rowid DESC LIMIT %s"
+            f") f JOIN admin_panel_searchentry e ON e.id = f.rowid ORDER BY f.score LIMIT %s"
+        )
+        params = [expression, RANK_WINDOW, limit]
+
+    elif connection.vendor == "postgresql":
+        corrections = {}
+        kind_sql, kind_params = _kind_filter(kinds, "kind")
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        sql = (
+            f"SELECT kind, object_id, title, subtitle, url FROM admin_panel_searchentry "
+            f"WHERE {SEARCH_TSVECTOR} @@ to_tsquery('simple', %s){kind_sql} "
+            f"ORDER BY ts_rank({SEARCH_TSVECTOR}, to_tsquery('simple', %s)) DESC LIMIT %s"
+        )
+        params = [tsquery, *kind_params, tsquery, limit]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        if rows:
+            return [dict(zip(columns, row)) for row in rows], corrections
+        # Nothing matched exactly: fall back to pg_trgm similarity on titles.
+        text = " ".join(terms)
+        sql = (
+            f"SELECT kind, object_id, title, subtitle, url FROM admin_panel_searchentry "
+            f"WHERE title %% %s{kind_sql} ORDER BY similarity(title, %s) DESC LIMIT %s"
+        )
+        params = [text, *kind_params, text, limit]
+
+    else:
+        entries = SearchEntry.objects.all()
+        if kinds:
+            entries = entries.filter(kind__in=kinds)
+        for term in terms:
+            entries = entries.filter(Q(title__icontains=term) | Q(subtitle__icontains=term))
+        rows = entries.order_by("kind", "title").values_list("kind", "object_id", "title", "subtitle", "url")
+        return [dict(zip(columns, row)) for row in rows[:limit]], {}
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [dict(zip(columns, row)) for row in cursor.fetchall()], corrections
+
+
+def search_objects(queryset, kind, query):
+    """Filter a queryset of ``kind`` objects to those whose index entry matches ``query``."""
+    terms = [term.lower() for term in search_terms(query)]
+    if not terms:
+        return queryset
+
+    if connection.vendor == "sqlite":
+        expression, _ = _fts5_match(terms, [kind])
+        if expression is None:
+            return queryset.none()
+        matches = RawSQL(
+            f"SELECT e.object_id FROM {SEARCH_FTS_TABLE} f "
+            f"JOIN admin_panel_searchentry e ON e.id = f.rowid "
+            f"WHERE {SEARCH_FTS_TABLE} MATCH %s",
+            [expression],
+        )
+        return queryset.filter(id__in=matches)
+
+    if connection.vendor == "postgresql":
+        matches = RawSQL(
+            f"SELECT object_id FROM admin_panel_searchentry "
+            f"WHERE kind = %s AND {SEARCH_TSVECTOR} @@ to_tsquery('simple', %s)",
+            [kind, " & ".join(f"{term}:*" for term in terms)],
+        )
+        return queryset.filter(id__in=matches)
+
+    for term in terms:
+        condition = Q()
+        for field in INDEXED[kind][2]:
+            condition |= Q(**{f"{field}__icontains": term})
+        queryset = queryset.filter(condition)
+    return queryset
+
+
+# =====================================================
+# 📄 COURSE DOCUMENTS
+# =====================================================
+# Tokenized without a stemmer (migration 0018): FTS5 stems prefix queries too,
+# so with porter a partially typed "deploy" missed "deployments".
+MATERIAL_FTS_TABLE = "admin_panel_material_fts"
+MATERIAL_TSVECTOR = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(text, ''))"
+MATERIAL_RESULT_LIMIT = 20
+
+# Snippet markers that cannot occur in extracted text; swapped for <mark> after escaping.
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+
+def _highlight(snippet):
+    return escape(snippet).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def search_materials(student, query, limit=MATERIAL_RESULT_LIMIT):
+    """
+    Materials of the student's assigned courses whose title or document text
+    matches ``query``, best first, as dicts with an HTML-safe ``snippet``.
+    """
+    terms = search_terms(query)
+    course_ids = list(
+        CourseAssignment.objects.filter(student=student, course__deleted_at__isnull=True)
+        .values_list("course_id", flat=True)
+    )
+    if not terms or not course_ids:
+        return []
+    courses = dict(Course.objects.filter(id__in=course_ids).values_list("id", "name"))
+    columns = ("material_id", "course_id", "title", "snippet")
+
+    if connection.vendor == "sqlite":
+        # The course filter is part of the MATCH so only in-scope doclists are read.
+        expression = (
+            "{title text} : (" + fts5_query(terms) + ") AND course_id : ("
+            + " OR ".join(f'"{course_id}"' for course_id in course_ids) + ")"
+        )
+        sql = (
+            f"SELECT rowid, course_id, title, "
+            f"snippet({MATERIAL_FTS_TABLE}, 1, %s, %s, '…', 16) "
+            f"FROM {MATERIAL_FTS_TABLE} WHERE {MATERIAL_FTS_TABLE} MATCH %s "
+            f"ORDER BY bm25({MATERIAL_FTS_TABLE}, 5.0, 1.0, 0.0) LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [_MARK_OPEN, _MARK_CLOSE, expression, limit])
+            rows = cursor.fetchall()
+
+    elif connection.vendor == "postgresql":
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        sql = (
+            f"SELECT material_id, course_id, title, ts_headline('english', text, to_tsquery('english', %s), "
+            f"'StartSel=' || chr(2) || ', StopSel=' || chr(3) || ', MaxWords=16, MinWords=8') FROM ("
+            f"SELECT material_id, course_id, title, text FROM admin_panel_materialtext "
+            f"WHERE course_id = ANY(%s) AND {MATERIAL_TSVECTOR} @@ to_tsquery('english', %s) "
+            f"ORDER BY ts_rank({MATERIAL_TSVECTOR}, to_tsquery('english', %s)) DESC LIMIT %s) ranked"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [tsquery, course_ids, tsquery, tsquery, limit])
+            rows = cursor.fetchall()
+
+    else:
+        entries = MaterialText.objects.filter(course_id__in=course_ids)
+        for term in terms:
+            entries = entries.filter(Q(title__icontains=term) | Q(text__icontains=term))
+        rows = [
+            (material_id, course_id, title, text[:120])
+            for material_id, course_id, title, text in
+            entries.order_by("title").values_list("material_id", "course_id", "title", "text")[:limit]
+        ]
+
+    results = []
+    for row in rows:
+        result = dict(zip(columns, row))
+        result["snippet"] = _highlight(result["snippet"] or "")
+        result["course_name"] = courses.get(result["course_id"], "")
+        result["url"] = f"{reverse('matrical_page', args=[result['course_id']])}#material-{result['material_id']}"
+        results.append(result)
+    return results
@@ -0,0 +1,182 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import counters, dashboards, search
+from .material_text import queue_extraction
+from .previews import delete_files, queue_previews
+from .data_versions import bump, student_key
+from .models import (
+    College, Student, Course, CourseAssignment,
+    CourseFolder, CourseMaterial, BroadcastMessage, StudyImage,
+    CalendarEvent, CalendarEventOverride, CareerOpportunities, MaterialPreview
+)
+
+
+# =====================================================
+# 🔁 DATA VERSION COUNTERS
+# =====================================================
+@receiver([post_save, post_delete], sender=BroadcastMessage)
+def broadcast_changed(sender, instance, **kwargs):
+    bump("broadcast")
+
+
+@receiver([post_save, post_delete], sender=StudyImage)
+def study_images_changed(sender, instance, **kwargs):
+    bump("study_images")
+
+
+@receiver([post_save, post_delete], sender=CalendarEvent)
+@receiver([post_save, post_delete], sender=CalendarEventOverride)
+def calendar_changed(sender, instance, **kwargs):
+    bump("calendar")
+
+
+@receiver([post_save, post_delete], sender=CareerOpportunities)
+def careers_changed(sender, instance, **kwargs):
+    bump("careers")
+
+
+@receiver([post_save, post_delete], sender=College)
+def college_changed(sender, instance, **kwargs):
+    bump("colleges")
+
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=CourseFolder)
+@receiver([post_save, post_delete], sender=CourseMaterial)
+def course_changed(sender, instance, **kwargs):
+    bump("courses")
+
+
+@receiver([post_save, post_delete], sender=Student)
+def student_changed(sender, instance, **kwargs):
+    bump(student_key(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=CourseAssignment)
+def assignment_changed(sender, instance, **kwargs):
+    # "enrolments" covers the enrolled counts on the admin course list.
+    bump(student_key(instance.student_id), "enrolments")
+
+
+# =====================================================
+# 🧾 DASHBOARD READ MODEL
+# =====================================================
+@receiver(post_save, sender=Student)
+def dashboard_profile_changed(sender, instance, created, **kwargs):
+    if not created:
+        dashboards.refresh(instance.pk, "profile")
+
+
+@receiver([post_save, post_delete], sender=CourseAssignment)
+def dashboard_courses_changed(sender, instance, **kwargs):
+    dashboards.refresh(instance.student_id, "courses")
+
+
+@receiver(post_save, sender=College)
+def dashboard_college_changed(sender, instance, created, **kwargs):
+    if not created:
+        dashboards.mark_stale(student__college_id=instance.pk)
+
+
+@receiver(post_save, sender=Course)
+def dashboard_course_changed(sender, instance, created, **kwargs):
+    if not created:
+        dashboards.mark_stale(student__courseassignment__course_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=CourseMaterial)
+def dashboard_material_changed(sender, instance, **kwargs):
+    dashboards.mark_stale(student__courseassignment__course_id=instance.course_id)
+
+
+# =====================================================
+# 🔢 COLLEGE / COURSE COUNTERS
+# =====================================================
+@receiver(post_save, sender=Student)
+def student_counters_saved(sender, instance, created, **kwargs):
+    counters.student_saved(instance, created)
+
+
+@receiver(post_delete, sender=Student)
+def student_counters_deleted(sender, instance, **kwargs):
+    counters.student_deleted(instance)
+
+
+@receiver(post_save, sender=CourseAssignment)
+def assignment_counters_saved(sender, instance, created, **kwargs):
+    if created:
+        counters.assignment_changed(instance, 1)
+
+
+@receiver(post_delete, sender=CourseAssignment)
+def assignment_counters_deleted(sender, instance, **kwargs):
+    counters.assignment_changed(instance, -1)
+
+
+@receiver(post_save, sender=CourseFolder)
+def folder_counters_saved(sender, instance, created, **kwargs):
+    if created:
+        counters.change(Course, instance.course_id, folder_count=1)
+
+
+@receiver(post_delete, sender=CourseFolder)
+def folder_counters_deleted(sender, instance, **kwargs):
+    counters.change(Course, instance.course_id, folder_count=-1)
+
+
+@receiver(post_save, sender=CourseMaterial)
+def material_counters_saved(sender, instance, created, **kwargs):
+    if created:
+        counters.change(Course, instance.course_id, material_count=1)
+
+
+@receiver(post_delete, sender=CourseMaterial)
+def material_counters_deleted(sender, instance, **kwargs):
+    counters.change(Course, instance.course_id, material_count=-1)
+
+
+# =====================================================
+# 🔎 ADMIN SEARCH INDEX
+# =====================================================
+@receiver(post_save, sender=College)
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=CourseMaterial)
+@receiver(post_save, sender=CareerOpportunities)
+def search_entry_saved(sender, instance, created, **kwargs):
+    search.index_instance(instance)
+    if sender is Course and not created:
+        # Material entries show their course's name and link to its code.
+        search.index_queryset("material", search.indexable("material").filter(course_id=instance.pk))
+
+
+@receiver(post_delete, sender=College)
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=CourseMaterial)
+@receiver(post_delete, sender=CareerOpportunities)
+def search_entry_deleted(sender, instance, **kwargs):
+    search.unindex(search.KIND_OF[sender], [instance.pk])
+
+
+# =====================================================
+# 📄 DOCUMENT TEXT EXTRACTION
+# =====================================================
+@receiver(post_save, sender=CourseMaterial)
+def material_text_changed(sender, instance, **kwargs):
+    queue_extraction([instance.pk])
+
+
+# =====================================================
+# 🖼 DOCUMENT PREVIEWS
+# =====================================================
+@receiver(post_save, sender=CourseMaterial)
+def material_preview_changed(sender, instance, **kwargs):
+    if instance.file:
+        queue_previews([instance.pk])
+
+
+@receiver(post_delete, sender=MaterialPreview)
+def material_preview_deleted(sender, instance, **kwargs):
+    delete_files([instance.cover, *instance.pages])
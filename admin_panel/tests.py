@@ -1,3 +1,395 @@
-from django.test import TestCase
+import csv
+import gzip
+from datetime import datetime, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.signals import post_delete
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from ManasioLMS import middleware, throttling
+
+from . import archive, exports, jobs, recurrence
+from .jobs import background_task
+from .models import (
+    ArchivedProgressReport, ArchivedTask, BackgroundJob, CalendarEvent, CalendarEventOverride, CareerOpportunities, College, Course, CourseAssignment,
+    Notification, ProgressReport, Student, StudentDashboard, Task,
+)
+from .purge import purge, soft_delete
+from .search import search_careers
+
+
+@background_task
+def add(a, b):
+    return a + b
+
+
+@background_task
+def fail():
+    raise RuntimeError("boom")
+
+
+class AdminTestCase(TestCase):
+    def setUp(self):
+        session = self.client.session
+        session["admin_logged_in"] = True
+        session["admin_username"] = "admin"
+        session.save()
+
+
+class CareerSearchTests(TestCase):
+    def test_new_and_updated_careers_are_searchable(self):
+        job = CareerOpportunities.objects.create(
+            job_title="Cloud Engineer", company_name="Infosys", link="https://example.com/jobs/1",
+        )
+        CareerOpportunities.objects.create(job_title="Data Analyst", company_name="Infosys")
+        CareerOpportunities.objects.create(job_title="Designer", company_name="Wipro")
+
+        self.assertEqual(search_careers(CareerOpportunities.objects.all(), "Infosys").count(), 2)
+
+        job.job_title = "Platform Engineer"
+        job.save()
+        self.assertEqual(list(search_careers(CareerOpportunities.objects.all(), "platform")), [job])
+        self.assertFalse(search_careers(CareerOpportunities.objects.all(), "cloud").exists())
+
+
+class CourseListTests(AdminTestCase):
+    def test_enrolment_changes_invalidate_the_course_list(self):
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        course = Course.objects.create(name="Cloud Basics", code="CLD101")
+        students = [
+            Student.objects.create(name=f"S{n}", email=f"s{n}@example.com", roll=f"R{n}", college=college)
+            for n in range(2)
+        ]
+        CourseAssignment.objects.create(student=students[0], course=course)
+
+        first = self.client.get(reverse("manage_courses"))
+        self.assertContains(first, "1 enrolled")
+
+        CourseAssignment.objects.create(student=students[1], course=course)
+        second = self.client.get(reverse("manage_courses"), HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertContains(second, "2 enrolled")
+
+        soft_delete(Student.objects.get(pk=students[1].pk))
+        third = self.client.get(reverse("manage_courses"), HTTP_IF_NONE_MATCH=second["ETag"])
+        self.assertContains(third, "1 enrolled")
+
+        soft_delete(Student.objects.get(pk=students[0].pk))
+        soft_delete(college)
+        self.assertEqual(Course.objects.get().enrolled_count, 0)
+
+
+class ProgressTrackingTests(AdminTestCase):
+    def test_malformed_college_is_ignored(self):
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        Student.objects.create(name="Asha", email="asha@example.com", roll="R001", college=college)
+
+        response = self.client.get(reverse("progress_tracking_view"), {"college": "abc"})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'name="roll"')
+
+        response = self.client.get(reverse("progress_tracking_view"), {"college": college.id})
+        self.assertContains(response, 'name="roll" value="R001"')
+
+
+class ArchiveTests(TestCase):
+    def test_only_superseded_old_reports_are_archived(self):
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        asha, ravi = (
+            Student.objects.create(name=name, email=f"{roll}@example.com", roll=roll, college=college)
+            for name, roll in (("Asha", "R001"), ("Ravi", "R002"))
+        )
+        old = timezone.now() - timedelta(days=400)
+        superseded = ProgressReport.objects.create(student=asha, created_at=old)
+        latest = ProgressReport.objects.create(student=asha, created_at=old)
+        only = ProgressReport.objects.create(student=ravi, created_at=old)
+
+        cutoff = timezone.now() - timedelta(days=365)
+        self.assertEqual(list(archive.archivable_reports(cutoff)), [superseded])
+
+        stats = archive.archive(365, batch_size=1)
+        self.assertEqual(stats["progress_reports"], 1)
+        self.assertEqual(set(ProgressReport.objects.values_list("id", flat=True)), {latest.id, only.id})
+        self.assertTrue(ArchivedProgressReport.objects.filter(original_id=superseded.id).exists())
+
+    def test_archiving_tasks_sends_no_per_row_signals(self):
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        student = Student.objects.create(name="Asha", email="asha@example.com", roll="R001", college=college)
+        old = timezone.now() - timedelta(days=400)
+        for n in range(3):
+            Task.objects.create(
+                student=student, title=f"Task {n}", description="-", deadline=old.date(),
+                status="completed", completed_at=old,
+            )
+
+        deleted = mock.Mock()
+        post_delete.connect(deleted, sender=Task)
+        self.addCleanup(post_delete.disconnect, deleted, sender=Task)
+        stats = archive.archive(365)
+        deleted.assert_not_called()
+        self.assertEqual(stats["tasks"], 3)
+        self.assertEqual(ArchivedTask.objects.count(), 3)
+        self.assertFalse(Task.objects.exists())
+
+
+class CompressionTests(TestCase):
+    def test_pages_with_a_csrf_token_are_padded_gzip(self):
+        fake_brotli = mock.Mock(compress=lambda data, quality: b"br")
+        with mock.patch.object(middleware, "brotli", fake_brotli):
+            response = self.client.get(reverse("student_login"), HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        # GZipMiddleware pads the FNAME header field with random bytes (BREACH).
+        self.assertTrue(response.content[3] & 0x08)
+        self.assertIn(b"csrfmiddlewaretoken", gzip.decompress(response.content))
+
+    def test_other_pages_use_brotli_when_accepted(self):
+        fake_brotli = mock.Mock(compress=lambda data, quality: b"br")
+        with mock.patch.object(middleware, "brotli", fake_brotli):
+            response = self.client.get(reverse("candidate_home"), HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(response.content, b"br")
+
+
+class JobTests(TestCase):
+    @override_settings(BACKGROUND_JOBS_EAGER=True)
+    def test_eager_job_keeps_the_callers_transaction(self):
+        # The in-memory test database ignores close(), so watch the call itself.
+        with transaction.atomic(), mock.patch.object(jobs, "close_old_connections") as close:
+            job = jobs.enqueue(add, 2, 3)
+            self.assertTrue(connection.in_atomic_block)
+            self.assertEqual((job.status, job.result), ("succeeded", 5))
+            close.assert_not_called()
+            College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        self.assertTrue(College.objects.exists())
+
+    def test_failed_job_is_retried_with_backoff_then_fails(self):
+        job = jobs.enqueue(fail, max_attempts=2)
+        self.assertEqual(jobs.claim("w1"), [job.id])
+        self.assertEqual(jobs.execute(job.id), "queued")
+
+        job.refresh_from_db()
+        self.assertEqual((job.attempts, job.locked_by), (1, ""))
+        self.assertIn("RuntimeError: boom", job.error)
+        delay = (job.run_after - timezone.now()).total_seconds()
+        self.assertAlmostEqual(delay, 2 * jobs.RETRY_BACKOFF, delta=5)
+        self.assertEqual(jobs.claim("w1"), [])  # not due yet
+
+        BackgroundJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        self.assertEqual(jobs.claim("w1"), [job.id])
+        self.assertEqual(jobs.execute(job.id), "failed")
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 2)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_claim_takes_due_jobs_by_priority_once(self):
+        low = jobs.enqueue(add, 1, 1)
+        high = jobs.enqueue(add, 2, 2, priority=5)
+        jobs.enqueue(add, 3, 3, priority=9, delay=3600)
+        other = jobs.enqueue(fail)
+
+        self.assertEqual(jobs.claim("w1", limit=2, tasks=[add.task_name]), [high.id, low.id])
+        self.assertEqual(jobs.claim("w2", limit=5, tasks=[add.task_name]), [])
+        self.assertEqual(jobs.claim("w2", limit=5), [other.id])
+        self.assertEqual(
+            set(BackgroundJob.objects.filter(status="running").values_list("locked_by", flat=True)), {"w1", "w2"}
+        )
+
+        self.assertEqual(jobs.execute(high.id), "succeeded")
+        self.assertEqual(BackgroundJob.objects.get(id=high.id).result, 4)
+
+    def test_stale_running_jobs_are_requeued(self):
+        job = jobs.enqueue(add, 1, 1)
+        jobs.claim("w1")
+        BackgroundJob.objects.filter(id=job.id).update(started_at=timezone.now() - timedelta(hours=2))
+
+        self.assertEqual(jobs.requeue_stale(timedelta(hours=1)), 1)
+        self.assertEqual(jobs.claim("w2"), [job.id])
+
+
+class SoftDeleteTests(AdminTestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        self.student = Student.objects.create(name="Asha", email="asha@example.com", roll="R001", college=self.college)
+        self.course = Course.objects.create(name="Cloud Basics", code="CLD101")
+        CourseAssignment.objects.create(student=self.student, course=self.course)
+        Task.objects.create(student=self.student, title="Mock interview", description="-", deadline=timezone.localdate())
+        ProgressReport.objects.create(student=self.student)
+
+    def test_college_is_hidden_then_purged(self):
+        self.client.post(reverse("delete_college", args=[self.college.id]))
+        job = BackgroundJob.objects.get()
+
+        self.assertFalse(College.objects.exists())
+        self.assertFalse(Student.objects.exists())
+        self.assertTrue(Student.all_objects.filter(pk=self.student.pk).exists())
+        self.assertEqual(Course.objects.get().enrolled_count, 0)
+        self.assertEqual(self.client.get(reverse("manage_students")).status_code, 200)
+
+        self.assertEqual(jobs.claim("w1"), [job.id])
+        self.assertEqual(jobs.execute(job.id), "succeeded")
+        self.assertEqual(BackgroundJob.objects.get().result, {"purged": 5})
+        self.assertFalse(College.all_objects.exists())
+        self.assertFalse(Student.all_objects.exists())
+        for model in (Task, ProgressReport, CourseAssignment, Notification, StudentDashboard):
+            self.assertFalse(model.objects.exists(), model.__name__)
+        self.assertTrue(Course.objects.exists())
+
+    def test_purge_skips_rows_that_were_not_soft_deleted(self):
+        job = jobs.enqueue(purge, "student", self.student.pk)
+        jobs.claim("w1")
+        jobs.execute(job.id)
+        self.assertEqual(BackgroundJob.objects.get(id=job.id).result["skipped"], "not soft-deleted")
+        self.assertTrue(Task.objects.exists())
+
+    def test_soft_deleted_rows_still_block_duplicates_on_add(self):
+        soft_delete(self.student)
+        soft_delete(self.college)
+        other = College.objects.create(name="Other College", email="other@example.com", address="Pune")
+
+        response = self.client.post(reverse("add_college"), {"name": "Again", "email": "college@example.com"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("College with this email already exists.", map(str, get_messages(response.wsgi_request)))
+        response = self.client.post(reverse("add_student"), {
+            "name": "Asha", "email": "new@example.com", "roll": "R001", "college": other.id,
+        })
+        self.assertIn("Student with this roll number already exists.", map(str, get_messages(response.wsgi_request)))
+        self.assertEqual(College.all_objects.count(), 2)
+        self.assertEqual(Student.all_objects.count(), 1)
+
+
+class ExportTests(AdminTestCase):
+    def setUp(self):
+        super().setUp()
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        self.students = [
+            Student.objects.create(name=name, email=f"{roll}@example.com", roll=roll, college=college)
+            for name, roll in (("Asha", "R001"), ("Ravi, Jr.", "R002"), ("Gone", "R003"))
+        ]
+        soft_delete(self.students[2])
+        for student, scores in ((self.students[0], (10, 60)), (self.students[1], (20, 70))):
+            for score in scores:
+                ProgressReport.objects.create(student=student, interview_prep=score)
+
+    def test_iter_csv_streams_header_then_rows_in_chunks(self):
+        rows = list(csv.reader("".join(exports.iter_csv("students", chunk_size=1)).splitlines()))
+        self.assertEqual(rows[0], exports.EXPORTS["students"][0])
+        self.assertEqual(
+            [row[1:4] for row in rows[1:]],
+            [["Asha", "R001@example.com", "R001"], ["Ravi, Jr.", "R002@example.com", "R002"]],
+        )
+
+    def test_progress_export_has_each_students_latest_report(self):
+        rows = list(csv.reader("".join(exports.iter_csv("progress")).splitlines()))
+        self.assertEqual([row[:3] for row in rows[1:]], [["R001", "Asha", "60"], ["R002", "Ravi, Jr.", "70"]])
+
+    def test_export_view_streams_csv(self):
+        response = self.client.get(reverse("export", args=["students"]))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="students-', response["Content-Disposition"])
+        body = b"".join(response.streaming_content).decode()
+        self.assertTrue(body.startswith("ID,Name,Email,Roll,"))
+        self.assertIn('"Ravi, Jr."', body)
+        self.assertEqual(self.client.get(reverse("export", args=["nope"])).status_code, 404)
+
+
+def at(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class RecurrenceTests(TestCase):
+    def event(self, start, recurrence, hours=1):
+        return CalendarEvent.objects.create(
+            title="Class", start=start, end=start + timedelta(hours=hours), all_day=False, recurrence=recurrence,
+        )
+
+    def starts(self, event, window_start, window_end):
+        return [start for start, _ in recurrence.occurrences(event, window_start, window_end)]
+
+    def test_weekly_count_stops_inside_a_later_window(self):
+        # Mon 5 Jan: Mon 5, Wed 7, Mon 12, Wed 14, Mon 19 and nothing after.
+        event = self.event(at(2026, 1, 5, 10), "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=5")
+        self.assertEqual(self.starts(event, at(2026, 1, 13), at(2026, 2, 1)), [at(2026, 1, 14, 10), at(2026, 1, 19, 10)])
+        self.assertEqual(event.ends_at, at(2026, 1, 19, 11))
+        # An occurrence already running when the window opens is included.
+        self.assertEqual(self.starts(event, at(2026, 1, 14, 10, 30), at(2026, 1, 15))[0], at(2026, 1, 14, 10))
+
+    def test_until_includes_the_whole_last_day(self):
+        event = self.event(at(2026, 1, 1, 18), "FREQ=DAILY;INTERVAL=2;UNTIL=20260109")
+        self.assertEqual(
+            self.starts(event, at(2026, 1, 6), at(2026, 2, 1)), [at(2026, 1, 7, 18), at(2026, 1, 9, 18)]
+        )
+        self.assertEqual(self.starts(event, at(2026, 1, 10), at(2026, 2, 1)), [])
+
+    def test_monthly_count_skips_months_without_the_day(self):
+        event = self.event(at(2026, 1, 31, 9), "FREQ=MONTHLY;COUNT=3")
+        self.assertEqual(
+            self.starts(event, at(2026, 1, 1), at(2027, 1, 1)),
+            [at(2026, 1, 31, 9), at(2026, 3, 31, 9), at(2026, 5, 31, 9)],
+        )
+
+    @override_settings(TIME_ZONE="Europe/London")
+    def test_occurrences_keep_their_wall_clock_time_across_dst(self):
+        event = self.event(at(2026, 3, 23, 10), "FREQ=WEEKLY;COUNT=2")
+        self.assertEqual(
+            [timezone.localtime(start).hour for start in self.starts(event, at(2026, 3, 1), at(2026, 5, 1))], [10, 10]
+        )
+
+    def test_overrides_move_and_cancel_occurrences_across_the_window(self):
+        # Mondays 5, 12, 19 and 26 Jan; the window is 15-25 Jan.
+        event = self.event(at(2026, 1, 5, 10), "FREQ=WEEKLY;COUNT=4")
+        CalendarEventOverride.objects.create(
+            event=event, original_start=at(2026, 1, 12, 10), start=at(2026, 1, 16, 15), title="Moved in",
+        )
+        CalendarEventOverride.objects.create(event=event, original_start=at(2026, 1, 19, 10), cancelled=True)
+        CalendarEventOverride.objects.create(event=event, original_start=at(2026, 1, 26, 10), start=at(2026, 1, 10, 10))
+
+        payloads = recurrence.events_between(CalendarEvent.objects.all(), at(2026, 1, 15), at(2026, 1, 25))
+        self.assertEqual(
+            [(payload["title"], payload["start"], payload["end"], payload["occurrence"]) for payload in payloads],
+            [("Moved in", at(2026, 1, 16, 15).isoformat(), at(2026, 1, 16, 16).isoformat(),
+              at(2026, 1, 12, 10).isoformat())],
+        )
+
+
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def login(self, username, ip="10.0.0.1"):
+        return self.client.post(
+            reverse("admin_login"), {"username": username, "password": "wrong"}, REMOTE_ADDR=ip,
+        )
+
+    def test_empty_identity_bucket_answers_429_with_retry_after(self):
+        capacity, per_minute = settings.LOGIN_THROTTLE_IDENTITY
+        for _ in range(capacity):
+            self.assertEqual(self.login("Boss").status_code, 200)
+
+        response = self.login(" boss ")  # same identity after normalizing
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], str(60 // per_minute))
+        self.assertEqual(self.login("someone-else").status_code, 200)
+        self.assertEqual(self.client.get(reverse("admin_login")).status_code, 200)
+
+    @override_settings(LOGIN_THROTTLE_IP=(2, 60))
+    def test_ip_bucket_is_shared_by_every_identity(self):
+        self.assertEqual(self.login("a").status_code, 200)
+        self.assertEqual(self.login("b").status_code, 200)
+        self.assertEqual(self.login("c").status_code, 429)
+        self.assertEqual(self.login("c", ip="10.0.0.2").status_code, 200)
+
+    def test_buckets_refill_over_time_all_or_nothing(self):
+        buckets = {"test:a": (2, 60), "test:b": (1, 6)}
+        self.assertEqual(throttling.take(buckets, now=0), 0)
+        self.assertEqual(throttling.take(buckets, now=1), 9)  # b is empty; a keeps its token
+        self.assertEqual(throttling.take({"test:a": (2, 60)}, now=1), 0)
+        self.assertEqual(throttling.take(buckets, now=10), 0)
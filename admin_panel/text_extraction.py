@@ -0,0 +1,114 @@
+"""
+Plain-text extraction from uploaded course documents.
+
+docx and pptx files are zip archives of XML and are read with the standard
+library; PDF needs the optional ``pypdf`` package. Nothing here imports Django,
+so pool workers can load it cheaply.
+"""
+import io
+import os
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+
+# Text beyond this is dropped; it is plenty to find a document by topic.
+MAX_TEXT_CHARS = 500_000
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DRAWING_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+SLIDE_RE = re.compile(r"ppt/slides/slide(\d+)\.xml$")
+PLAIN_TEXT_EXTENSIONS = {".txt", ".md", ".csv"}
+
+
+def _xml_text(stream, text_tag, paragraph_tag, parts, budget):
+    """Append the text runs of an XML part to ``parts``; returns the remaining budget."""
+    for _, element in iterparse(stream, events=("end",)):
+        if element.tag == text_tag and element.text:
+            parts.append(element.text)
+            budget -= len(element.text)
+        elif element.tag == paragraph_tag:
+            parts.append("\n")
+            element.clear()
+        if budget <= 0:
+            break
+    return budget
+
+
+def _docx(source):
+    parts = []
+    with zipfile.ZipFile(source) as archive, archive.open("word/document.xml") as stream:
+        _xml_text(stream, f"{WORD_NS}t", f"{WORD_NS}p", parts, MAX_TEXT_CHARS)
+    return "".join(parts)
+
+
+def _pptx(source):
+    parts = []
+    budget = MAX_TEXT_CHARS
+    with zipfile.ZipFile(source) as archive:
+        slides = sorted(
+            (int(match.group(1)), name)
+            for name in archive.namelist()
+            if (match := SLIDE_RE.match(name))
+        )
+        for _, name in slides:
+            with archive.open(name) as stream:
+                budget = _xml_text(stream, f"{DRAWING_NS}t", f"{DRAWING_NS}p", parts, budget)
+            parts.append("\n")
+            if budget <= 0:
+                break
+    return "".join(parts)
+
+
+def _pdf(source):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise RuntimeError("PDF text extraction needs the optional 'pypdf' package (pip install pypdf).")
+
+    parts = []
+    size = 0
+    for page in PdfReader(source).pages:
+        text = page.extract_text() or ""
+        parts.append(text)
+        size += len(text)
+        if size >= MAX_TEXT_CHARS:
+            break
+    return "\n".join(parts)
+
+
+def _plain(source):
+    if isinstance(source, str):
+        with open(source, "rb") as fileobj:
+            data = fileobj.read(MAX_TEXT_CHARS * 4)
+    else:
+        data = source.read(MAX_TEXT_CHARS * 4)
+    return data.decode("utf-8", errors="replace")
+
+
+EXTRACTORS = {
+    ".docx": _docx,
+    ".pptx": _pptx,
+    ".pdf": _pdf,
+}
+
+
+def extract_text(source, name):
+    """
+    Text of the document ``name``; ``source`` is a filesystem path or the file's
+    bytes. Returns None for file types that are not supported.
+    """
+    extension = os.path.splitext(name)[1].lower()
+    if extension in PLAIN_TEXT_EXTENSIONS:
+        extractor = _plain
+    else:
+        extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        return None
+
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    text = extractor(source)
+    text = re.sub(r"[ \t\r\f\v]+", " ", text)
+    text = re.sub(r"\n\s*\n+", "\n\n", text)
+    return text.strip()[:MAX_TEXT_CHARS]
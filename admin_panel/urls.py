@@ -32,6 +32,7 @@ urlpatterns = [
     # 📈 PROGRESS TRACKING
     # =====================================================
     path('students/progress/', views.progress_tracking_view, name='progress_tracking_view'),
+    path('students/progress/trends/', views.progress_trends_view, name='progress_trends'),
 
     # =====================================================
     # 📚 COURSES
@@ -62,12 +63,14 @@ urlpatterns = [
     # 💼 CAREER OPPORTUNITIES
     # =====================================================
     path('careers/', views.career_opportunities_view, name='career_opportunities'),
+    path('careers/import/', views.import_careers_view, name='import_careers'),
     path('careers/delete/<int:job_id>/', views.delete_job_view, name='delete_job'),
 
     # =====================================================
     # 📅 CALENDAR
     # =====================================================
     path('calendar/', views.calendar_event_view, name='calendar'),
+    path('calendar/events/', views.calendar_events_view, name='calendar_events'),
 
     # =====================================================
     # 🖼 STUDY IMAGES
@@ -80,4 +83,19 @@ urlpatterns = [
 
     path('schedule-event/', views.calendar_event_view, name='schedule_event'),
 
+    # =====================================================
+    # 🔎 SEARCH
+    # =====================================================
+    path('search/', views.admin_search_view, name='admin_search'),
+
+    # =====================================================
+    # 📤 EXPORTS
+    # =====================================================
+    path('exports/<str:dataset>/', views.export_view, name='export'),
+
+    # =====================================================
+    # ⚙️ BACKGROUND JOBS
+    # =====================================================
+    path('jobs/<int:background_job_id>/', views.background_job_status, name='background_job_status'),
+
 ]
@@ -1,24 +1,37 @@
 
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
 from django.contrib import messages
-from django.db.models import Q
-from django.utils.dateparse import parse_datetime
+from django.core.files.storage import default_storage
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils import timezone
+from django.db.models import Max
 
 from rest_framework import viewsets
 
+from ManasioLMS.throttling import throttle_login
 from superuser_admin.models import AdminUser
 from .models import (
     College, Student, Course, CourseAssignment,
     CourseFolder, CourseMaterial, Task,
-    BroadcastMessage, CalendarEvent, StudyImage,
-    ProgressReport, CareerOpportunities
+    BroadcastMessage, CalendarEvent, CalendarEventOverride, StudyImage,
+    ProgressReport, CareerOpportunities, BackgroundJob, SearchEntry
 )
 from .serializers import (
     StudentSerializer, CourseSerializer, TaskSerializer,
     CourseAssignmentSerializer, CalendarEventSerializer
 )
 from .forms import StudyImageForm
+from .data_versions import conditional_on_versions
+from .pagination import cursor_paginate
+from .search import search_careers, search_index, search_objects
+from .career_feed import import_feed_file
+from .jobs import enqueue
+from .notifications import notify, notify_course
+from .purge import soft_delete
+from .recurrence import build_rule, events_between, parse_window
+from . import exports, progress_import, rollups
 
 
 # =====================================================
@@ -36,6 +49,7 @@ def admin_required(view_func):
 # =====================================================
 # 🔐 AUTH: LOGIN / LOGOUT
 # =====================================================
+@throttle_login("username")
 def admin_login(request):
     """
     Admin logs in using AdminUser created by Superuser.
@@ -131,25 +145,23 @@ def add_college_view(request):
         email = request.POST.get("email")
         address = request.POST.get("address")
         description = request.POST.get("description")
-        student_count = request.POST.get("student_count") or 0
         logo_image = request.FILES.get("logo_image")
         poster_image = request.FILES.get("poster_image")
         mode = request.POST.get("mode")
 
         if not email:
             messages.error(request, "Email is required.")
-            return render(request, "admin_dashboard/partials/add_college.html")
+            return render(request, "admin_panel/partials/add_college.html")
 
-        if College.objects.filter(email=email).exists():
+        if College.all_objects.filter(email=email).exists():
             messages.error(request, "College with this email already exists.")
-            return render(request, "admin_dashboard/partials/add_college.html")
+            return render(request, "admin_panel/partials/add_college.html")
 
         College.objects.create(
             name=name,
             email=email,
             address=address,
             description=description or "",
-            student_count=int(student_count),
             logo_image=logo_image,
             poster_image=poster_image,
             mode=mode or "offline",
@@ -168,12 +180,11 @@ def manage_colleges_view(request):
     qs = College.objects.all()
 
     if query:
-        # Your College model has address, not location (avoid crash)
-        qs = qs.filter(Q(name__icontains=query) | Q(address__icontains=query) | Q(email__icontains=query))
+        qs = search_objects(qs, "college", query)
 
     return render(
         request,
-        "admin_dashboard/partials/manage_colleges.html",
+        "admin_panel/partials/manage_colleges.html",
         {"colleges": qs.order_by("-id"), "query": query},
     )
 
@@ -182,8 +193,8 @@ def manage_colleges_view(request):
 def delete_college_view(request, college_id):
     if request.method == "POST":
         college = get_object_or_404(College, id=college_id)
-        college.delete()
-        messages.success(request, "College deleted successfully.")
+        job = soft_delete(college)
+        messages.success(request, f"College deleted. Its data is being purged in the background (job #{job.id}).")
     return redirect("manage_colleges")
 
 
@@ -209,11 +220,11 @@ def add_student_view(request):
             return render(request, "admin_panel/partials/add_student.html", {"colleges": colleges})
 
         # 🔴 Duplicate checks
-        if Student.objects.filter(email=email).exists():
+        if Student.all_objects.filter(email=email).exists():
             messages.error(request, "Student with this email already exists.")
             return render(request, "admin_panel/partials/add_student.html", {"colleges": colleges})
 
-        if Student.objects.filter(roll=roll).exists():
+        if Student.all_objects.filter(roll=roll).exists():
             messages.error(request, "Student with this roll number already exists.")
             return render(request, "admin_panel/partials/add_student.html", {"colleges": colleges})
 
@@ -243,12 +254,12 @@ def manage_students_view(request):
     qs = Student.objects.select_related("college").all()
 
     if query:
-        qs = qs.filter(Q(name__icontains=query) | Q(email__icontains=query) | Q(roll__icontains=query))
+        qs = search_objects(qs, "student", query)
 
     return render(
         request,
         "admin_panel/partials/manage_students.html",
-        {"students": qs.order_by("-id"), "query": query},
+        {"students": qs.order_by("-id"), "query": query, "export_choices": exports.CHOICES},
     )
 
 
@@ -256,7 +267,7 @@ def manage_students_view(request):
 def delete_student_view(request, student_id):
     if request.method == "POST":
         student = get_object_or_404(Student, id=student_id)
-        student.delete()
+        soft_delete(student)
         messages.success(request, "Student deleted successfully.")
     return redirect("manage_students")
 
@@ -264,58 +275,92 @@ def delete_student_view(request, student_id):
 # =====================================================
 # 📈 PROGRESS TRACKING
 # =====================================================
+PROGRESS_MAX_ERRORS = 20
+
+
+def _grid_rows(post):
+    """Rows of the cohort grid: one ``roll`` input and one input per score for each student."""
+    columns = {name: post.getlist(name) for name in progress_import.SCORE_FIELDS}
+    return [
+        {"roll": roll, **{name: values[index] if index < len(values) else "" for name, values in columns.items()}}
+        for index, roll in enumerate(post.getlist("roll"))
+    ]
+
+
 @admin_required
 def progress_tracking_view(request):
-    students = Student.objects.all().order_by("roll")
+    college_id = request.GET.get("college", "")
+    if not college_id.isdigit():
+        college_id = ""  # ignore malformed ids instead of failing in the query
+    mode = request.GET.get("mode", "")
+    entered = {}
 
     if request.method == "POST":
-        roll_no = (request.POST.get("roll-no") or "").strip()
+        upload = request.FILES.get("scores_csv")
+        try:
+            rows = progress_import.read_csv(upload) if upload else _grid_rows(request.POST)
+        except ValueError as exc:
+            rows, errors = [], [str(exc)]
+        else:
+            created, errors = progress_import.import_reports(rows)
 
-        def as_int(key):
-            try:
-                return int(request.POST.get(key) or 0)
-            except ValueError:
-                return 0
-
-        interview_prep = as_int("interview-prep")
-        communication_skills = as_int("communication-skills")
-        resume_prep = as_int("resume-prep")
-        technical_prep = as_int("technical-prep")
-        mock_tests = as_int("mock-tests")
-        mock_interviews = as_int("mock-interviews")
-
-        if not roll_no:
-            return render(
-                request,
-                "admin_panel/partials/progress_tracking.html",
-                {"error": "❌ Roll number is required!", "students": students},
-            )
+        if not errors:
+            if created:
+                messages.success(request, f"✅ Recorded progress for {created} student(s).")
+            else:
+                messages.warning(request, "No scores were entered.")
+            return redirect(request.get_full_path())
+
+        for error in errors[:PROGRESS_MAX_ERRORS]:
+            messages.error(request, f"❌ {error}")
+        if len(errors) > PROGRESS_MAX_ERRORS:
+            messages.error(request, f"❌ ... and {len(errors) - PROGRESS_MAX_ERRORS} more problem(s).")
+        if rows:
+            messages.error(request, "Nothing was saved. Fix the rows above and submit again.")
+        if not upload:
+            # Keep what the trainer typed in the grid.
+            entered = {row["roll"]: [row[name] for name in progress_import.SCORE_FIELDS] for row in rows}
+
+    rows = []
+    if college_id:
+        students = Student.objects.filter(college_id=college_id).order_by("roll")
+        if mode:
+            students = students.filter(mode=mode)
+        latest_ids = (
+            ProgressReport.objects.filter(student__in=students)
+            .values("student_id").annotate(latest=Max("id")).values("latest")
+        )
+        latest = {report.student_id: report for report in ProgressReport.objects.filter(id__in=latest_ids)}
+        for student in students:
+            report = latest.get(student.id)
+            values = entered.get(student.roll) or [""] * len(progress_import.SCORE_FIELDS)
+            rows.append({
+                "student": student,
+                "cells": [
+                    {"name": name, "value": value, "last": getattr(report, name) if report else None}
+                    for name, value in zip(progress_import.SCORE_FIELDS, values)
+                ],
+            })
+
+    return render(request, "admin_panel/partials/progress_tracking.html", {
+        "colleges": College.objects.order_by("name"),
+        "college_id": college_id,
+        "mode": mode,
+        "rows": rows,
+    })
 
-        try:
-            # If your ProgressReport model uses roll_no as string (as you pasted),
-            # store it directly; if you later change to FK Student, adjust here.
-            ProgressReport.objects.create(
-                roll_no=roll_no,
-                interview_prep=interview_prep,
-                communication_skills=communication_skills,
-                resume_prep=resume_prep,
-                technical_prep=technical_prep,
-                mock_tests=mock_tests,
-                mock_interviews=mock_interviews,
-            )
-            return render(
-                request,
-                "admin_panel/partials/progress_tracking.html",
-                {"success": "✅ Student progress report added successfully!", "students": students},
-            )
-        except Exception:
-            return render(
-                request,
-                "admin_panel/partials/progress_tracking.html",
-                {"error": "❌ Error occurred adding progress report!", "students": students},
-            )
 
-    return render(request, "admin_panel/partials/progress_tracking.html", {"students": students})
+@admin_required
+@conditional_on_versions("rollups")
+def progress_trends_view(request):
+    """Daily trend series for the dashboard charts, read from the rollup tables only."""
+    try:
+        days = min(max(int(request.GET.get("days") or 30), 1), rollups.MAX_TREND_DAYS)
+        college_id = int(request.GET.get("college") or 0) or None
+        course_id = int(request.GET.get("course") or 0) or None
+    except ValueError:
+        return JsonResponse({"error": "days, college and course must be numbers."}, status=400)
+    return JsonResponse(rollups.trends(days, college_id, course_id, request.GET.get("mode") or None))
 
 
 # =====================================================
@@ -333,7 +378,7 @@ def add_course_view(request):
             messages.error(request, "Course name and code are required.")
             return render(request, "admin_panel/partials/add_course.html")
 
-        if Course.objects.filter(code=code).exists():
+        if Course.all_objects.filter(code=code).exists():
             messages.error(request, "Course code already exists.")
             return render(request, "admin_panel/partials/add_course.html")
 
@@ -350,6 +395,7 @@ def add_course_view(request):
 
 
 @admin_required
+@conditional_on_versions("courses", "enrolments")
 def manage_courses_view(request):
     courses = Course.objects.all().order_by("-id")
     return render(request, "admin_panel/partials/manage_courses.html", {"courses": courses})
@@ -371,8 +417,8 @@ def manage_course_view(request, course_code):
 def delete_course_view(request, course_code):
     if request.method == "POST":
         course = get_object_or_404(Course, code=course_code)
-        course.delete()
-        messages.success(request, "Course deleted successfully.")
+        job = soft_delete(course)
+        messages.success(request, f"Course deleted. Its materials are being purged in the background (job #{job.id}).")
     return redirect("manage_courses")
 
 
@@ -459,6 +505,10 @@ def upload_course_material(request, course_id):
             type=mat_type,
             file=file,
         )
+        notify_course(
+            "material", f"New material in {course.name}", body=title,
+            link=reverse("matrical_page", args=[course.id]), course_id=course.id,
+        )
 
         messages.success(request, "Material uploaded successfully.")
         return redirect("manage_course", course_code=course.code)
@@ -573,6 +623,10 @@ def assign_task_view(request):
             priority=priority,
             status="pending",
         )
+        notify(
+            [student.id], "task", f"New task: {title}", body=f"Due {deadline}",
+            link=reverse("student_dashboard"),
+        )
         messages.success(request, "Task assigned successfully.")
         return redirect("assign_task")
 
@@ -622,6 +676,9 @@ def live_class_view(request):
 # =====================================================
 # 💼 CAREER OPPORTUNITIES
 # =====================================================
+CAREERS_PAGE_SIZE = 50
+
+
 @admin_required
 def career_opportunities_view(request):
     if request.method == "POST":
@@ -638,16 +695,51 @@ def career_opportunities_view(request):
         )
         messages.success(request, "✅ Job post submitted successfully!")
 
-    online_jobs = CareerOpportunities.objects.filter(mode="online").order_by("-updated_at")
-    offline_jobs = CareerOpportunities.objects.filter(mode="offline").order_by("-updated_at")
+    query = request.GET.get("q", "").strip()
+    jobs = search_careers(CareerOpportunities.objects.all(), query)
+    online_jobs = cursor_paginate(
+        jobs.filter(mode="online"), request.GET.get("online_cursor"), page_size=CAREERS_PAGE_SIZE
+    )
+    offline_jobs = cursor_paginate(
+        jobs.filter(mode="offline"), request.GET.get("offline_cursor"), page_size=CAREERS_PAGE_SIZE
+    )
 
     return render(
         request,
         "admin_panel/partials/career_opportunities.html",
-        {"online_students": online_jobs, "offline_students": offline_jobs},
+        {"online_students": online_jobs, "offline_students": offline_jobs, "query": query},
     )
 
 
+@admin_required
+def import_careers_view(request):
+    if request.method == "POST":
+        feed = request.FILES.get("feed")
+        source = request.POST.get("source", "").strip()[:50]
+        if not feed or not source:
+            messages.error(request, "❌ Choose a feed file and enter its source name.")
+            return redirect("career_opportunities")
+
+        # Large feeds are imported by the job worker; the upload is parked in storage.
+        path = default_storage.save(f"career_feeds/{feed.name}", feed)
+        job = enqueue(
+            import_feed_file, path, source,
+            default_mode=request.POST.get("mode", "offline"),
+            deactivate_missing=bool(request.POST.get("deactivate_missing")),
+            priority=5,
+        )
+        if job.status == "succeeded":
+            stats = job.result
+            messages.success(
+                request,
+                f"✅ Imported '{source}': {stats['created']} new, {stats['updated']} updated, "
+                f"{stats['skipped']} skipped, {stats['deactivated']} deactivated."
+            )
+        else:
+            messages.success(request, f"⏳ Import of '{source}' queued as job #{job.id}.")
+    return redirect("career_opportunities")
+
+
 @admin_required
 def delete_job_view(request, job_id):
     if request.method == "POST":
@@ -749,115 +841,125 @@ def calendar_event_view1(request):
         {"events": event_list, "courses": Course.objects.all()},
     )
 
+def _calendar_moment(raw, all_day):
+    """Aware datetime from the calendar form; all-day values are plain dates."""
+    if not raw:
+        return None
+    if all_day and "T" not in raw:
+        raw = raw + "T00:00:00+00:00"
+    value = parse_datetime(raw)
+    if value is not None and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _calendar_rule(request):
+    """RRULE from the form's Repeat fields ("" for a one-off event). Raises ValueError."""
+    freq = request.POST.get("repeat", "")
+    if not freq:
+        return ""
+    until = parse_date(request.POST.get("repeat-until", ""))
+    count = request.POST.get("repeat-count") or None
+    return build_rule(freq, count=count, until=until)
+
+
 @admin_required
+@conditional_on_versions("calendar", "courses")
 def calendar_event_view(request):
+    """
+    Create / edit / delete from the calendar page. For a recurring event the
+    form sends ``occurrence`` (its original start) and ``scope``: "this"
+    changes or cancels that occurrence only, "series" the whole event.
+    """
     if request.method == "POST":
         event_id = request.POST.get('event-id')
         title = request.POST.get('title')
         course = request.POST.get('course')
         description = request.POST.get('description')
         meeting_link = request.POST.get('meeting-link')
-        start = request.POST.get('start')
-        end = request.POST.get('end')
-        all_day = request.POST.get('allDay')
+        all_day = request.POST.get('allDay') == "true"
+        start = _calendar_moment(request.POST.get('start'), all_day)
+        end = _calendar_moment(request.POST.get('end'), all_day)
         edit = request.POST.get('edit')
         delete = request.POST.get('delete')
-        print(course)
-        # if len(start) != len('2025-06-17T08:00:00+05:30'):
-        #     start=start + 'T00:00:00+00:00'
-        #     end=end + 'T00:00:00+00:00'
-
-        if all_day == "true":
-            all_day = True
-            start = start + 'T00:00:00+00:00'
-            end = end + 'T00:00:00+00:00'
-        else:
-            all_day = False
-
-        if delete == "true":
-            print(event_id)
-            CalendarEvent.objects.filter(id=event_id).delete()
+        occurrence = parse_datetime(request.POST.get('occurrence') or "")
+        single = request.POST.get('scope') == "this" and occurrence is not None
+
+        event = CalendarEvent.objects.filter(id=event_id).first() if event_id else None
+        if (delete == "true" or edit == "true") and event is None:
+            messages.error(request, "Event not found.")
+        elif delete == "true" and single:
+            CalendarEventOverride.objects.update_or_create(
+                event=event, original_start=occurrence, defaults={"cancelled": True},
+            )
+            messages.success(request, f"Cancelled '{event.title}' on {timezone.localtime(occurrence):%d %b %Y}.")
+        elif delete == "true":
+            event.delete()
+            messages.success(request, f"Deleted '{event.title}'.")
+        elif edit == "true" and single:
+            moved = start is not None and start != occurrence
+            usual_end = occurrence + (event.end - event.start) if event.end else None
+            CalendarEventOverride.objects.update_or_create(
+                event=event, original_start=occurrence,
+                defaults={
+                    "cancelled": False,
+                    "title": title if title != event.title else "",
+                    "description": description if description != event.description else None,
+                    "meeting_link": meeting_link if meeting_link != event.meeting_link else None,
+                    "start": start if moved else None,
+                    "end": end if end and (moved or end != usual_end) else None,
+                },
+            )
+            messages.success(request, f"Updated '{event.title}' on {timezone.localtime(occurrence):%d %b %Y}.")
         elif edit == "true":
-            event = CalendarEvent.objects.filter(id=event_id).first()
-            if event:
-                event.title = title
-                event.course = course
-                event.description = description
-                event.meeting_link = meeting_link
+            event.title = title
+            event.course = course
+            event.description = description
+            event.meeting_link = meeting_link
+            if not event.recurrence:
+                # Occurrences of a series report their own dates; keep the series start.
                 event.start = start
                 event.end = end
                 event.all_day = all_day
-                event.save()
-        else:
-            event = CalendarEvent(title=title, course=course, description=description,
-                                  meeting_link=meeting_link, start=start, end=end, all_day=all_day)
             event.save()
+            messages.success(request, f"Updated '{event.title}'.")
+        elif start is None:
+            messages.error(request, "Pick a date for the event.")
+        else:
+            try:
+                recurrence = _calendar_rule(request)
+            except ValueError as exc:
+                messages.error(request, f"Invalid repeat rule: {exc}")
+                return redirect("calendar")
+            CalendarEvent.objects.create(
+                title=title, course=course, description=description, meeting_link=meeting_link,
+                start=start, end=end, all_day=all_day, recurrence=recurrence,
+            )
+            notify_course(
+                "event", f"New event: {title}", body=description or "",
+                link=reverse("student_calendar"),
+                course_code=course if course and course != "All Courses" else None,
+            )
+        return redirect("calendar")
 
+    repeat_choices = [("", "Does not repeat"), ("DAILY", "Daily"), ("WEEKLY", "Weekly"),
+                      ("MONTHLY", "Monthly"), ("YEARLY", "Yearly")]
+    return render(request, 'admin_panel/partials/calendar.html', {
+        'courses': Course.objects.all(),
+        'repeat_choices': repeat_choices,
+    })
 
-        events = CalendarEvent.objects.all()
-
-        event_list = []
-        for event in events:
-            if event.all_day == True:
-                event_list.append({
-                    'eventId': event.id,
-                    'title': event.title,
-                    'course': event.course or "",
-                    'description': event.description or "",
-                    'meetingLink': f'{event.meeting_link}' or "",
-                    'start': event.start.isoformat(),
-                    'end': event.end.isoformat() if event.end else None,
-                    'allDay': 'true'
-                })
-            else:
-                event_list.append({
-                    'eventId': event.id,
-                    'title': event.title,
-                    'course': event.course or "",
-                    'description': event.description or "",
-                    'meetingLink': f'{event.meeting_link}' or "",
-                    'start': event.start.isoformat(),
-                    'end': event.end.isoformat() if event.end else None
-                })
-
-        return render(request,'admin_panel/partials/calendar.html', {'events': event_list, 'courses': Course.objects.all()})
-
-
-    events = CalendarEvent.objects.all()
-    
-    event_list = []
 
-    if events == []:
-        pass
-    else:
-        for event in events:
-            if event.all_day == True:
-                event_list.append({
-                    'eventId': event.id,    
-                    'title': event.title,
-                    'course': event.course or "",
-                    'description': event.description or "",
-                    'meetingLink': f'{event.meeting_link}' or "",
-                    'start': event.start.isoformat(),
-                    'end': event.end.isoformat() if event.end else None,
-                    'allDay': 'true'
-                })
-            else:
-                event_list.append({
-                    'eventId': event.id,
-                    'title': event.title,
-                    'course': event.course or "",
-                    'description': event.description or "",
-                    'meetingLink': f'{event.meeting_link}' or "",
-                    'start': event.start.isoformat(),
-                    'end': event.end.isoformat() if event.end else None
-                })
-
-    ''' By default, Django automatically adds a field called 'id' which is an 'AutoField' primary key 
-    for every model (unless you override it). '''
+@admin_required
+@conditional_on_versions("calendar")
+def calendar_events_view(request):
+    """Occurrences in the window FullCalendar asks for (``?start=...&end=...``)."""
+    try:
+        window_start, window_end = parse_window(request.GET.get("start"), request.GET.get("end"))
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    return JsonResponse(events_between(CalendarEvent.objects.all(), window_start, window_end), safe=False)
 
-    return render(request,'admin_panel/partials/calendar.html', {'events': event_list, 'courses': Course.objects.all()})
- 
 
 
 @admin_required
@@ -936,3 +1038,65 @@ class CourseAssignmentViewSet(viewsets.ModelViewSet):
 class CalendarEventViewSet(viewsets.ModelViewSet):
     queryset = CalendarEvent.objects.all().order_by("start")
     serializer_class = CalendarEventSerializer
+
+
+# =====================================================
+# 🔎 ADMIN SEARCH
+# =====================================================
+SEARCH_MAX_LIMIT = 50
+
+
+@admin_required
+def admin_search_view(request):
+    query = request.GET.get("q", "").strip()
+    kinds = [kind for kind in request.GET.getlist("kind") if kind in dict(SearchEntry.KIND_CHOICES)]
+    try:
+        limit = max(1, min(int(request.GET.get("limit", 20)), SEARCH_MAX_LIMIT))
+    except ValueError:
+        limit = 20
+
+    results, corrections = search_index(query, kinds, limit)
+    return JsonResponse({"query": query, "results": results, "corrections": corrections})
+
+
+# =====================================================
+# ⚙️ BACKGROUND JOBS
+# =====================================================
+@admin_required
+def background_job_status(request, background_job_id):
+    job = get_object_or_404(BackgroundJob, id=background_job_id)
+    return JsonResponse({
+        "id": job.id,
+        "task": job.task,
+        "status": job.status,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "progress": job.progress,
+        "result": job.result,
+        "error": job.error.strip().splitlines()[-1] if job.error else "",
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    })
+
+
+# =====================================================
+# 📤 EXPORTS
+# =====================================================
+@admin_required
+def export_view(request, dataset):
+    if dataset not in exports.EXPORTS:
+        raise Http404("Unknown export.")
+    filename = f"{dataset}-{timezone.localdate().isoformat()}"
+
+    if request.GET.get("format") == "xlsx":
+        try:
+            fileobj = exports.xlsx_tempfile(dataset)
+        except RuntimeError as exc:
+            messages.error(request, f"❌ {exc}")
+            return redirect("admin_dashboard")
+        return FileResponse(fileobj, as_attachment=True, filename=f"{filename}.xlsx")
+
+    response = StreamingHttpResponse(exports.iter_csv(dataset), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+    return response
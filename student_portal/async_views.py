@@ -0,0 +1,171 @@
+"""
+Async versions of the read-heavy student pages, for ASGI deployments.
+
+Enabled with ``STUDENT_PORTAL_ASYNC_VIEWS = True`` (see ``student_portal.urls``).
+They use the async ORM, so a worker waiting on the database keeps serving other
+requests, and independent queries are issued together with ``asyncio.gather``.
+Everything a template touches is loaded up front: templates must not run
+queries from async code.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.http import Http404, JsonResponse
+from django.shortcuts import aget_object_or_404, redirect, render
+from django.urls import reverse
+
+from admin_panel import ical
+from admin_panel.dashboards import aget_broadcast, aget_dashboard
+from admin_panel.data_versions import conditional_on_versions
+from admin_panel.models import (
+    CalendarEvent, CareerOpportunities, Course,
+    CourseAssignment, ProgressReport, Student, StudyImage,
+)
+from admin_panel.pagination import acursor_paginate
+from admin_panel.recurrence import aevents_between, parse_window
+from admin_panel.search import search_careers
+
+from .views import CAREERS_PAGE_SIZE, _broadcast_context, _dashboard_page, _progress_summary
+
+
+# ================= HELPERS =================
+async def _alist(queryset):
+    return [obj async for obj in queryset]
+
+
+def _student(student_id):
+    # base1.html shows the student's college in the header.
+    return aget_object_or_404(Student.objects.select_related('college'), id=student_id)
+
+
+async def aget_logged_in_student(request):
+    student_id = await request.session.aget('student_id')
+    if not student_id:
+        return None
+    return await _student(student_id)
+
+
+# ================= DASHBOARD =================
+async def student_dashboard(request):
+    student_id = await request.session.aget('student_id')
+    if not student_id:
+        return redirect('student_login')
+
+    dashboard, broadcast = await asyncio.gather(aget_dashboard(student_id), aget_broadcast())
+    return render(request, 'student_portal/cantidates/student_dashboard.html', _dashboard_page(dashboard, broadcast))
+
+
+async def candidate_study_images(request):
+    student_id = await request.session.aget('student_id')
+    if not student_id:
+        return redirect('student_login')
+
+    dashboard, broadcast, images = await asyncio.gather(
+        aget_dashboard(student_id),
+        aget_broadcast(),
+        _alist(StudyImage.objects.all().order_by('-uploaded_at')),
+    )
+    context = _dashboard_page(dashboard, broadcast)
+    context['images'] = images
+    return render(request, 'student_portal/cantidates/dashboard.html', context)
+
+
+# ================= PROGRESS REPORT =================
+async def student_progress_report(request):
+    student_id = await request.session.aget('student_id')
+    if not student_id:
+        return redirect('student_login')
+
+    student, reports = await asyncio.gather(
+        _student(student_id),
+        _alist(ProgressReport.objects.filter(student_id=student_id).order_by('-id')[:2]),
+    )
+    progress, improvement = _progress_summary(reports)
+
+    return render(request, 'student_portal/cantidates/progress_report.html', {
+        'student': student,
+        'progress_report': progress,
+        'improvement': improvement,
+    })
+
+
+# ================= CAREER =================
+async def career_opportunities_view(request):
+    student = await aget_logged_in_student(request)
+    if not student:
+        return redirect('student_login')
+
+    query = request.GET.get('q', '').strip()
+    jobs = CareerOpportunities.objects.filter(mode=student.mode, status='active')
+    page = await acursor_paginate(search_careers(jobs, query), request.GET.get('cursor'), page_size=CAREERS_PAGE_SIZE)
+
+    return render(request, 'student_portal/cantidates/career_opportunities.html', {
+        'student': student,
+        'jobs': page,
+        'query': query,
+        'next_cursor': page.next_cursor,
+    })
+
+
+# ================= STUDY MATERIAL =================
+async def _no_course():
+    return None
+
+
+async def matrical_page(request, course_id=None):
+    student_id = await request.session.aget('student_id')
+    if not student_id:
+        return redirect('student_login')
+
+    # Folders, their materials and the materials' previews are prefetched.
+    course = aget_object_or_404(
+        Course.objects.prefetch_related('folders__coursematerial_set__preview'), id=course_id
+    ) if course_id else _no_course()
+    student, broadcast, course = await asyncio.gather(
+        _student(student_id), aget_broadcast(), course,
+    )
+
+    return render(request, 'student_portal/cantidates/matrial_page.html', {
+        'student': student,
+        **_broadcast_context(broadcast),
+        'course': course,
+    })
+
+
+# ================= CALENDAR =================
+@conditional_on_versions("calendar", "student")
+async def student_calendar_view(request):
+    student = await aget_logged_in_student(request)
+    if not student:
+        return redirect('student_login')
+
+    token = student.calendar_token or await sync_to_async(ical.calendar_token)(student)
+    feed_url = request.build_absolute_uri(reverse('student_calendar_feed', args=[token]))
+    return render(request, 'student_portal/cantidates/calendar.html', {
+        'student': student,
+        'feed_url': feed_url,
+        'webcal_url': 'webcal://' + feed_url.split('://', 1)[1],
+    })
+
+
+@conditional_on_versions("calendar", "student")
+async def student_calendar_events_view(request):
+    student_id = await request.session.aget('student_id')
+    if not student_id:
+        return JsonResponse({'error': 'Login required.'}, status=401)
+
+    try:
+        window_start, window_end = parse_window(request.GET.get('start'), request.GET.get('end'))
+    except ValueError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    course_codes = CourseAssignment.objects.filter(student_id=student_id).values_list('course__code', flat=True)
+    events = CalendarEvent.objects.filter(Q(course__in=course_codes) | Q(course="All Courses"))
+    exists, payload = await asyncio.gather(
+        Student.objects.filter(id=student_id).aexists(),
+        aevents_between(events, window_start, window_end),
+    )
+    if not exists:
+        raise Http404("No Student matches the given query.")
+    return JsonResponse(payload, safe=False)
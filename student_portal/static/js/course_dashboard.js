@@ -0,0 +1,52 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate progress bars
+    const progressBars = document.querySelectorAll('.progress-bar');
+    progressBars.forEach(bar => {
+        const width = bar.style.width;
+        bar.style.width = '0%';
+        setTimeout(() => {
+            bar.style.width = width;
+        }, 500);
+    });
+
+    // Add bookmark functionality
+    const bookmarkBtns = document.querySelectorAll('.course-bookmark');
+    bookmarkBtns.forEach(btn => {
+        btn.addEventListener('click', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+
+            const icon = this.querySelector('i');
+            if (icon.classList.contains('fas')) {
+                icon.classList.remove('fas');
+                icon.classList.add('far');
+                this.style.background = '#f8fafc';
+                this.style.color = 'var(--dashboard-text-light)';
+            } else {
+                icon.classList.remove('far');
+                icon.classList.add('fas');
+                this.style.background = 'var(--dashboard-primary)';
+                this.style.color = 'white';
+            }
+        });
+    });
+
+    // Add loading states for course actions
+    const courseActions = document.querySelectorAll('.course-action');
+    courseActions.forEach(btn => {
+        btn.addEventListener('click', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+
+            const originalText = this.innerHTML;
+            this.innerHTML = '<i class="fas fa-spinner fa-spin me-1"></i>Loading...';
+            this.disabled = true;
+
+            setTimeout(() => {
+                this.innerHTML = originalText;
+                this.disabled = false;
+                window.location.href = this.closest('a').href;
+            }, 800);
+        });
+    });
+});
@@ -0,0 +1,40 @@
+// Header scroll effect
+window.addEventListener('scroll', () => {
+  document.getElementById('main-header').classList.toggle('scrolled', window.scrollY > 20);
+});
+
+// Popup close
+document.getElementById('popupClose').addEventListener('click', () => {
+  document.getElementById('newsletterPopup').style.display = 'none';
+});
+
+// Typing animation
+const words = ['Data Analytics', 'Power BI', 'Python', 'SQL', 'AI & ML'];
+let wordIdx = 0, charIdx = 0, deleting = false;
+const el = document.getElementById('typing-text');
+
+function type() {
+  const word = words[wordIdx];
+  el.textContent = deleting ? word.substring(0, --charIdx) : word.substring(0, ++charIdx);
+  if (!deleting && charIdx === word.length) {
+    setTimeout(() => { deleting = true; setTimeout(type, 60); }, 1400);
+  } else if (deleting && charIdx === 0) {
+    deleting = false;
+    wordIdx = (wordIdx + 1) % words.length;
+    setTimeout(type, 400);
+  } else {
+    setTimeout(type, deleting ? 50 : 110);
+  }
+}
+setTimeout(type, 600);
+
+// Animate progress bars on scroll
+const bars = document.querySelectorAll('.prog-fill');
+const observer = new IntersectionObserver((entries) => {
+  entries.forEach(e => {
+    if (e.isIntersecting) {
+      e.target.style.width = e.target.style.width; // trigger
+    }
+  });
+}, { threshold: 0.3 });
+bars.forEach(b => observer.observe(b));
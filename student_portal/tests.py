@@ -1,3 +1,101 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import AsyncRequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from admin_panel.models import BroadcastMessage, College, Course, CourseAssignment, CourseMaterial, MaterialText, Student, Task
+from admin_panel.notifications import mark_read, notify
+from admin_panel.search import search_materials
+
+from . import async_views
+
+
+class DashboardRenderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        cls.student = Student.objects.create(name="Asha", email="asha@example.com", roll="R001", college=college)
+        cls.course = Course.objects.create(name="Cloud Basics", code="CLD101")
+        CourseAssignment.objects.create(student=cls.student, course=cls.course)
+        CourseMaterial.objects.create(course=cls.course, title="Intro", link="https://example.com/intro")
+
+    def setUp(self):
+        session = self.client.session
+        session["student_id"] = self.student.id
+        session.save()
+
+    def test_dashboards_render(self):
+        # "My Courses" lists the courses; the home dashboard counts them.
+        for name, text in (("student_dashboard", "Cloud Basics"), ("dashboard_student", "1 Active Courses")):
+            with self.subTest(name=name):
+                response = self.client.get(reverse(name))
+                self.assertContains(response, text)
+
+    def test_task_writes_leave_the_dashboard_alone(self):
+        self.client.get(reverse("student_dashboard"))
+        with self.assertNumQueries(1):
+            Task.objects.create(student=self.student, title="Mock interview", description="-", deadline=timezone.localdate())
+
+    def test_broadcast_link_does_not_depend_on_the_first_page(self):
+        BroadcastMessage.objects.create(message="Placement drive on Friday", link="https://example.com/drive")
+        for name in ("qna_forum", "student_dashboard", "feedback", "progress_tracking"):
+            with self.subTest(name=name):
+                self.assertContains(self.client.get(reverse(name)), 'href="https://example.com/drive"')
+
+    def test_notifications_revalidate_the_calendar(self):
+        first = self.client.get(reverse("student_calendar"))
+        self.assertEqual(first.status_code, 200)
+
+        notify([self.student.id], "general", "Placement drive")
+        second = self.client.get(reverse("student_calendar"), HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertContains(second, '<span class="notification-count">1</span>', html=True)
+
+        mark_read(self.student)
+        third = self.client.get(reverse("student_calendar"), HTTP_IF_NONE_MATCH=second["ETag"])
+        self.assertNotContains(third, "notification-count\">", status_code=200)
+
+    async def test_async_dashboards_render(self):
+        session = SessionStore()
+        await session.aset("student_id", self.student.id)
+        views = ((async_views.student_dashboard, "Cloud Basics"), (async_views.candidate_study_images, "1 Active Courses"))
+        for view, text in views:
+            with self.subTest(view=view.__name__):
+                request = AsyncRequestFactory().get("/")
+                request.session = session
+                self.assertContains(await view(request), text)
+
+    def test_progress_tracking_shows_task_windows(self):
+        today = timezone.localdate()
+        Task.objects.create(student=self.student, title="Mock interview", description="-", deadline=today + timedelta(days=3))
+        Task.objects.create(student=self.student, title="Resume review", description="-", deadline=today - timedelta(days=1))
+        Task.objects.create(
+            student=self.student, title="Aptitude test", description="-", deadline=today, status="completed"
+        )
+
+        response = self.client.get(reverse("progress_tracking"))
+        self.assertTemplateUsed(response, "student_portal/cantidates/Progress_tracking.html")
+        upcoming, overdue = response.content.decode().split("Overdue Tasks")
+        self.assertIn("Mock interview", upcoming)
+        self.assertIn("Resume review", overdue)
+        self.assertNotContains(response, "Aptitude test")
+        self.assertContains(response, "33% completed")
+
+
+class MaterialSearchTests(TestCase):
+    def test_stemmed_and_partially_typed_words_match(self):
+        college = College.objects.create(name="Test College", email="college@example.com", address="Chennai")
+        student = Student.objects.create(name="Asha", email="asha@example.com", roll="R001", college=college)
+        course = Course.objects.create(name="Cloud Basics", code="CLD101")
+        CourseAssignment.objects.create(student=student, course=course)
+        material = CourseMaterial.objects.create(course=course, title="Kubernetes", link="https://example.com/k8s")
+        MaterialText.objects.update_or_create(
+            material=material,
+            defaults={"course_id": course.id, "title": "Kubernetes", "text": "Scaling pods across deployments."},
+        )
+
+        for query in ("pods deploy", "kuber", "deployment scal"):
+            with self.subTest(query=query):
+                self.assertEqual([r["material_id"] for r in search_materials(student, query)], [material.id])
+        self.assertEqual(search_materials(student, "helm"), [])
@@ -32,13 +32,40 @@ urlpatterns = [
     # Feedback
     path('feedback/', feedback_view, name='feedback'),
 
+    # Notifications
+    path('notifications/', notifications_view, name='notifications'),
+    path('notifications/<int:notification_id>/', open_notification_view, name='open_notification'),
+
     # Calendar
     path('student-calendar/', student_calendar_view, name='student_calendar'),
+    path('student-calendar/events/', student_calendar_events_view, name='student_calendar_events'),
+    path('student-calendar/feed/reset/', reset_calendar_feed_view, name='reset_calendar_feed'),
+    path('student-calendar/<str:token>.ics', student_calendar_feed, name='student_calendar_feed'),
 
     # Study Material
     path('material/', matrical_page, name='matrical_page'),
     path('material/<int:course_id>/', matrical_page, name='matrical_page'),
+    path('material/search/', material_search_view, name='material_search'),
 ]
 
+# Under ASGI, serve the read-heavy pages from async views (same URLs and names).
+if settings.STUDENT_PORTAL_ASYNC_VIEWS:
+    from . import async_views
+
+    ASYNC_VIEWS = {
+        'student_dashboard': async_views.student_dashboard,
+        'dashboard_student': async_views.candidate_study_images,
+        'student_progress_report': async_views.student_progress_report,
+        'student_career_opportunities': async_views.career_opportunities_view,
+        'matrical_page': async_views.matrical_page,
+        'student_calendar': async_views.student_calendar_view,
+        'student_calendar_events': async_views.student_calendar_events_view,
+    }
+    urlpatterns = [
+        path(str(pattern.pattern), ASYNC_VIEWS[pattern.name], name=pattern.name)
+        if pattern.name in ASYNC_VIEWS else pattern
+        for pattern in urlpatterns
+    ]
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
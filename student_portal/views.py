@@ -1,6 +1,23 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
 from django.views.decorators.csrf import csrf_protect
+from django.db.models import Count, Q
+from ManasioLMS.throttling import throttle_login
 from admin_panel.models import *
+from admin_panel.data_versions import conditional_on_versions
+from admin_panel.pagination import cursor_paginate
+from admin_panel.search import search_careers, search_materials
+from admin_panel.notifications import mark_read
+from admin_panel.dashboards import get_broadcast, get_dashboard
+from admin_panel.recurrence import events_between, parse_window
+from admin_panel import ical
+
+CAREERS_PAGE_SIZE = 20
+NOTIFICATIONS_PAGE_SIZE = 20
+TASK_WINDOW_SIZE = 20
 
 
 # ================= HELPER =================
@@ -11,14 +28,20 @@ def get_logged_in_student(request):
     return get_object_or_404(Student, id=student_id)
 
 
+def _broadcast_context(broadcast):
+    """Template context for base1.html's banner from a ``get_broadcast()`` pair."""
+    broadcast_message, broadcast_link = broadcast
+    return {'broadcast_message': broadcast_message, 'broadcast_link': broadcast_link}
+
+
 def student_mock_interview(request):
-    broadcast = BroadcastMessage.objects.first()
     return render(request, 'student_portal/cantidates/mock_interviews.html', {
-        'broadcast_message': broadcast.message if broadcast else None
+        **_broadcast_context(get_broadcast()),
     })
 
 
 # ================= AUTH =================
+@throttle_login('email')
 def student_login(request):
     if request.method == 'POST':
         email = request.POST.get('email')
@@ -45,55 +68,42 @@ def index(request):
 
 
 # ================= DASHBOARD =================
-def student_dashboard(request):
-    student = get_logged_in_student(request)
-    if not student:
-        return redirect('student_login')
+def _dashboard_context(request):
+    """Context shared by both dashboards, read from the precomputed document."""
+    return _dashboard_page(get_dashboard(request.session['student_id']), get_broadcast())
 
-    assignments = CourseAssignment.objects.filter(student=student).select_related('course')
-    tasks = Task.objects.filter(student=student).order_by('-deadline')
-    broadcast = BroadcastMessage.objects.first()
 
-    return render(request, 'student_portal/cantidates/student_dashboard.html', {
-        'student': student,
-        'assignments': assignments,
-        'tasks': tasks,
-        'broadcast_message': broadcast.message if broadcast else None
-    })
+def _dashboard_page(dashboard, broadcast):
+    document = dashboard.document
+    return {
+        'student': dashboard.student,
+        'dashboard': document,
+        'assignments': [{'course': course} for course in document['courses']],
+        **_broadcast_context(broadcast),
+    }
 
 
-def candidate_study_images(request):
-    student = get_logged_in_student(request)
-    if not student:
+def student_dashboard(request):
+    if not request.session.get('student_id'):
         return redirect('student_login')
 
-    assignments = CourseAssignment.objects.filter(student=student).select_related('course')
-    tasks = Task.objects.filter(student=student).order_by('-deadline')
-    broadcast = BroadcastMessage.objects.first()
-    images = StudyImage.objects.all().order_by('-uploaded_at')
-
-    return render(request, 'student_portal/cantidates/dashboard.html', {
-        'student': student,
-        'assignments': assignments,
-        'tasks': tasks,
-        'images': images,
-        'broadcast_message': broadcast.message if broadcast else None
-    })
+    return render(request, 'student_portal/cantidates/student_dashboard.html', _dashboard_context(request))
 
 
-# ================= PROGRESS REPORT =================
-def student_progress_report(request):
-    student_id = request.session.get('student_id')
-    if not student_id:
+def candidate_study_images(request):
+    if not request.session.get('student_id'):
         return redirect('student_login')
 
-    student = get_object_or_404(Student, id=student_id)
+    context = _dashboard_context(request)
+    context['images'] = StudyImage.objects.all().order_by('-uploaded_at')
+    return render(request, 'student_portal/cantidates/dashboard.html', context)
 
-    reports = ProgressReport.objects.filter(student=student).order_by('id')
 
-    if reports.count() > 1:
-        latest = reports.last()
-        previous = reports[reports.count() - 2]
+# ================= PROGRESS REPORT =================
+def _progress_summary(reports):
+    """``(progress, improvement)`` from the two newest reports, newest first."""
+    if len(reports) > 1:
+        latest, previous = reports
 
         improvement = {
             'interview_prep': latest.interview_prep - previous.interview_prep,
@@ -106,8 +116,8 @@ def student_progress_report(request):
 
         progress = latest
 
-    elif reports.count() == 1:
-        progress = reports.first()
+    elif len(reports) == 1:
+        progress = reports[0]
         improvement = {
             'interview_prep': progress.interview_prep,
             'communication_skills': progress.communication_skills,
@@ -128,6 +138,20 @@ def student_progress_report(request):
         }
         improvement = None
 
+    return progress, improvement
+
+
+def student_progress_report(request):
+    student_id = request.session.get('student_id')
+    if not student_id:
+        return redirect('student_login')
+
+    student = get_object_or_404(Student, id=student_id)
+
+    # Only the two newest snapshots matter; older ones may already be archived.
+    reports = list(ProgressReport.objects.filter(student=student).order_by('-id')[:2])
+    progress, improvement = _progress_summary(reports)
+
     return render(request, 'student_portal/cantidates/progress_report.html', {
         'student': student,
         'progress_report': progress,
@@ -141,14 +165,20 @@ def career_opportunities_view(request):
     if not student:
         return redirect('student_login')
 
-    jobs = CareerOpportunities.objects.filter(mode=student.mode)
+    query = request.GET.get('q', '').strip()
+    jobs = CareerOpportunities.objects.filter(mode=student.mode, status='active')
+    jobs = search_careers(jobs, query)
+    page = cursor_paginate(jobs, request.GET.get('cursor'), page_size=CAREERS_PAGE_SIZE)
 
     return render(request, 'student_portal/cantidates/career_opportunities.html', {
         'student': student,
-        'jobs': jobs
+        'jobs': page,
+        'query': query,
+        'next_cursor': page.next_cursor,
     })
 
 
+@conditional_on_versions("careers")
 def job_post_view(request, job_id):
     job = get_object_or_404(CareerOpportunities, id=job_id)
     return render(request, 'student_portal/cantidates/job_post.html', {'job': job})
@@ -161,32 +191,63 @@ def progress_tracking_view(request):
         return redirect('student_login')
 
     tasks = Task.objects.filter(student=student)
-    broadcast = BroadcastMessage.objects.first()
 
-    completed = tasks.filter(status='completed').count()
-    total = tasks.count()
-    score = int((completed / total) * 100) if total else 0
+    counts = tasks.aggregate(total=Count('id'), completed=Count('id', filter=Q(status='completed')))
+    score = int((counts['completed'] / counts['total']) * 100) if counts['total'] else 0
 
-    return render(request, 'student_portal/cantidates/progress_tracking.html', {
+    return render(request, 'student_portal/cantidates/Progress_tracking.html', {
         'student': student,
-        'tasks': tasks,
+        'tasks': tasks.upcoming()[:TASK_WINDOW_SIZE],
+        'overdue_tasks': tasks.overdue()[:TASK_WINDOW_SIZE],
         'score': score,
-        'broadcast_message': broadcast.message if broadcast else None
+        **_broadcast_context(get_broadcast()),
+    })
+
+
+# ================= NOTIFICATIONS =================
+def notifications_view(request):
+    student = get_logged_in_student(request)
+    if not student:
+        return redirect('student_login')
+
+    if request.method == 'POST':
+        mark_read(student)
+        return redirect('notifications')
+
+    page = cursor_paginate(
+        Notification.objects.filter(student=student),
+        request.GET.get('cursor'),
+        page_size=NOTIFICATIONS_PAGE_SIZE,
+        field='created_at',
+    )
+    return render(request, 'student_portal/cantidates/notifications.html', {
+        'student': student,
+        'notifications': page,
+        'next_cursor': page.next_cursor,
     })
 
 
+def open_notification_view(request, notification_id):
+    student = get_logged_in_student(request)
+    if not student:
+        return redirect('student_login')
+
+    notification = get_object_or_404(Notification, id=notification_id, student=student)
+    if notification.read_at is None:
+        mark_read(student, [notification.id])
+    return redirect(notification.link or 'notifications')
+
+
 # ================= QNA =================
 def qna_forum_view(request):
-    broadcast = BroadcastMessage.objects.first()
     return render(request, 'student_portal/cantidates/Q&A_forum.html', {
-        'broadcast_message': broadcast.message if broadcast else None
+        **_broadcast_context(get_broadcast()),
     })
 
 
 # ================= FEEDBACK =================
 @csrf_protect
 def feedback_view(request):
-    broadcast = BroadcastMessage.objects.first()
     submitted = False
 
     if request.method == 'POST':
@@ -199,7 +260,7 @@ def feedback_view(request):
 
     return render(request, 'student_portal/cantidates/feedback.html', {
         'submitted': submitted,
-        'broadcast_message': broadcast.message if broadcast else None
+        **_broadcast_context(get_broadcast()),
     })
 
 
@@ -210,24 +271,58 @@ def matrical_page(request, course_id=None):
         return redirect('student_login')
 
     assignments = CourseAssignment.objects.filter(student=student).select_related('course')
-    broadcast = BroadcastMessage.objects.first()
 
-    course = get_object_or_404(Course, id=course_id) if course_id else None
+    # Folders, their materials and the materials' previews in three queries.
+    course = get_object_or_404(
+        Course.objects.prefetch_related('folders__coursematerial_set__preview'), id=course_id
+    ) if course_id else None
 
     return render(request, 'student_portal/cantidates/matrial_page.html', {
         'student': student,
         'assignments': assignments,
-        'broadcast_message': broadcast.message if broadcast else None,
+        **_broadcast_context(get_broadcast()),
         'course': course,
     })
 
+
+def material_search_view(request):
+    student = get_logged_in_student(request)
+    if not student:
+        return JsonResponse({'error': 'Login required.'}, status=401)
+
+    query = request.GET.get('q', '').strip()
+    return JsonResponse({'query': query, 'results': search_materials(student, query)})
+
 from django.db.models import Q
 
+@conditional_on_versions("calendar", "student")
 def student_calendar_view(request):
     student = get_logged_in_student(request)
     if not student:
         return redirect('student_login')
 
+    # Events are loaded per visible range from student_calendar_events_view.
+    feed_url = request.build_absolute_uri(
+        reverse('student_calendar_feed', args=[ical.calendar_token(student)])
+    )
+    return render(request, 'student_portal/cantidates/calendar.html', {
+        'student': student,
+        'feed_url': feed_url,
+        'webcal_url': 'webcal://' + feed_url.split('://', 1)[1],
+    })
+
+
+@conditional_on_versions("calendar", "student")
+def student_calendar_events_view(request):
+    student = get_logged_in_student(request)
+    if not student:
+        return JsonResponse({'error': 'Login required.'}, status=401)
+
+    try:
+        window_start, window_end = parse_window(request.GET.get('start'), request.GET.get('end'))
+    except ValueError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
     course_codes = CourseAssignment.objects.filter(
         student=student
     ).values_list('course__code', flat=True)
@@ -235,22 +330,39 @@ def student_calendar_view(request):
     events = CalendarEvent.objects.filter(
         Q(course__in=course_codes) | Q(course="All Courses")
     )
+    return JsonResponse(events_between(events, window_start, window_end), safe=False)
 
-    event_list = []
-    for e in events:
-        event_list.append({
-            'title': e.title,
-            'course': e.course,
-            'description': e.description or "",
-            'meetingLink': e.meeting_link or "",
-            'start': e.start.isoformat(),
-            'end': e.end.isoformat() if e.end else None,
-            'allDay': bool(e.all_day),
-        })
 
-    return render(request, 'student_portal/cantidates/calendar.html', {
-        'events': event_list,
-        'student': student
-    })
+def _calendar_feed_etag(request, token):
+    feed = ical.feed_for_token(token)
+    return feed[0] if feed else None
+
+
+@condition(etag_func=_calendar_feed_etag)
+def student_calendar_feed(request, token):
+    """iCalendar subscription; the token in the URL is the only credential."""
+    feed = ical.feed_for_token(token)
+    if feed is None:
+        raise Http404
+    etag, course_codes = feed
+
+    body = ical.cached_feed(etag)
+    if body is not None:
+        response = HttpResponse(body, content_type=ical.CONTENT_TYPE)
+    else:
+        response = StreamingHttpResponse(ical.stream_feed(etag, course_codes), content_type=ical.CONTENT_TYPE)
+    response['Content-Disposition'] = 'inline; filename="courses.ics"'
+    patch_cache_control(response, private=True, max_age=ical.FEED_MAX_AGE)
+    return response
+
+
+def reset_calendar_feed_view(request):
+    student = get_logged_in_student(request)
+    if not student:
+        return redirect('student_login')
+    if request.method == 'POST':
+        # The old link stops working; calendar apps must subscribe again.
+        ical.calendar_token(student, reset=True)
+    return redirect('student_calendar')
 
    
\ No newline at end of file
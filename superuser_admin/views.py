@@ -1,8 +1,10 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
+from ManasioLMS.throttling import throttle_login
 from .models import AdminUser
 
 # 🔐 Fixed Superuser Login
+@throttle_login('username')
 def superuser_login(request):
     if request.method == 'POST':
         username = request.POST.get('username')